@@ -20,7 +20,7 @@
 """
 
 import json
-from framework.utils.service_logging import logger
+from framework.utils.service_logging import logger, debug_enabled
 try:
    from systemd import journal
    use_journal=True
@@ -36,16 +36,29 @@ class Debug(object):
         self._debug = False
         self._debug_persist = False
 
-    def _log_debug(self, message):
-        """Logging messages"""
-        # if self._debug:
-        #     log_msg = self.name() + ", " + message
-        #     if use_journal:
-        #         journal.send(log_msg, PRIORITY=7, SYSLOG_IDENTIFIER="sspl-ll")
-        #     else:
-        #         logger.debug(log_msg)
-        log_msg = self.name() + ", " + message
-        logger.debug(log_msg)
+    def _log_debug(self, message, *args):
+        """Logging messages
+
+        message is only formatted when it is logged, pass its % arguments
+        in args or a callable returning it instead of formatting it here.
+        Logged when logging is at DEBUG level, or to the journal while
+        debug mode is turned on for this module with sspl_ll_debug.
+        """
+        if not self._is_debug_logged():
+            return
+        if callable(message):
+            message = message()
+        elif args:
+            message = message % args
+        log_msg = f"{self.name()}, {message}"
+        if not debug_enabled() and use_journal:
+            journal.send(log_msg, PRIORITY=7, SYSLOG_IDENTIFIER="sspl-ll")
+        else:
+            logger.debug(log_msg)
+
+    def _is_debug_logged(self):
+        """Returns True if debug messages of this module are logged"""
+        return debug_enabled() or getattr(self, "_debug", False)
 
     def _set_debug(self, debug):
         """Sets debug flag"""
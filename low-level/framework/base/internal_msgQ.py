@@ -20,8 +20,14 @@
                     another.
  ****************************************************************************
 """
+import queue
+import time
+
+from framework.base.msg_queue import MsgQueue
+from framework.base.shared_scheduler import notify_queue
 from framework.utils.service_logging import logger
 
+
 class InternalMsgQ(object):
     """Base Class for internal message queue communications between modules"""
 
@@ -37,11 +43,14 @@ class InternalMsgQ(object):
         q = self._msgQlist[self.name()]
         return q.empty()
 
-    def _read_my_msgQ(self):
-        """Blocks on reading from this module's queue placed by another thread"""
+    def _read_my_msgQ(self, timeout=None):
+        """Blocks on reading from this module's queue placed by another thread
+
+        Gives up after timeout seconds when set, returning (None, None).
+        """
         try:
             q = self._msgQlist[self.name()]
-            jsonMsg, event = q.get()
+            jsonMsg, event = q.get(timeout=timeout)
 
             if jsonMsg is None:
                 return None, None
@@ -51,14 +60,21 @@ class InternalMsgQ(object):
             if global_debug_off is True:
                  self._debug_off_globally()
 
-            self._log_debug("_read_my_msgQ: %s, Msg:%s" % (self.name(), jsonMsg))
+            self._log_debug("_read_my_msgQ: %s, Msg:%s", self.name(), jsonMsg)
             return jsonMsg, event
 
+        except queue.Empty:
+            pass
         except Exception as e:
             logger.exception("_read_my_msgQ: %r" % e)
 
         return None, None
 
+    def _read_my_msgQ_until(self, deadline):
+        """Blocks on reading from this module's queue until deadline, a
+        time.monotonic() value, returning (None, None) once it has passed"""
+        return self._read_my_msgQ(timeout=max(0, deadline - time.monotonic()))
+
     def _read_my_msgQ_noWait(self):
         """Non-Blocks on reading from this module's queue placed by another thread"""
         try:
@@ -79,7 +95,7 @@ class InternalMsgQ(object):
             if global_debug_off is True:
                 self._debug_off_globally()
 
-            self._log_debug("_read_my_msgQ_noWait: %s, Msg:%s" % (self.name(), jsonMsg))
+            self._log_debug("_read_my_msgQ_noWait: %s, Msg:%s", self.name(), jsonMsg)
             return jsonMsg, event
 
         except Exception as e:
@@ -87,17 +103,26 @@ class InternalMsgQ(object):
 
     def _write_internal_msgQ(self, toModule, jsonMsg, event=None):
         """writes a json message to an internal message queue"""
-        self._log_debug("_write_internal_msgQ: From %s, To %s, Msg:%s" %
-                       (self.name(), toModule, jsonMsg))
+        self._log_debug("_write_internal_msgQ: From %s, To %s, Msg:%s",
+                        self.name(), toModule, jsonMsg)
 
         q = self._msgQlist[toModule]
         q.put((jsonMsg, event))
+        notify_queue(toModule)
 
     def _get_msgQ_copy(self, module_name):
         """Returns a copy of a modules message queue"""
         with self._msgQlist[module_name].mutex:
            return list(self._msgQlist[module_name].queue)
 
+    def _get_msgQ_counters(self, module_name):
+        """Returns the high-water marks and drop counts of a module's message
+        queue, None if it does not keep them"""
+        q = self._msgQlist[module_name]
+        if isinstance(q, MsgQueue):
+            return q.get_counters()
+        return None
+
     def _debug_off_globally(self):
         """Turns debug mode off on all threads"""
         jsonMsg = {'sspl_ll_debug': {'debug_component':'all', 'debug_enabled' : False}}
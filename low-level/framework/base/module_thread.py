@@ -26,6 +26,8 @@ import threading
 import time
 from sched import scheduler
 from .debug import Debug
+from .shared_scheduler import (ModuleScheduler, get_shared_scheduler,
+    shared_scheduler_enabled)
 from framework.utils.service_logging import logger
 
 class DependencyState(object):
@@ -65,10 +67,18 @@ class ScheduledModuleThread(ModuleThread, Debug):
     SUSPENDED = 2
     HALTED = 3
 
+    # Run events on the process wide SharedScheduler instead of a thread
+    # of its own. Only for modules whose run() does not block for long.
+    SHARED_SCHEDULER = False
+
     def __init__(self, module_name, priority):
         super(ScheduledModuleThread, self).__init__()
 
-        self._scheduler   = scheduler(time.time, time.sleep)
+        if self.SHARED_SCHEDULER and shared_scheduler_enabled():
+            self._scheduler = ModuleScheduler(module_name,
+                                              get_shared_scheduler())
+        else:
+            self._scheduler = scheduler(time.time, time.sleep)
         self._module_name = module_name
         self._priority    = priority
         self._running     = False
@@ -82,10 +92,21 @@ class ScheduledModuleThread(ModuleThread, Debug):
         self._scheduler.enter(1, self._priority, self.run, ())
 
     def start(self):
-        """Run the scheduler"""
+        """Run the scheduler, returns at once on the shared scheduler"""
         self._running = True
         self._scheduler.run()
 
+    def uses_shared_scheduler(self):
+        """Returns True if events run on the SharedScheduler"""
+        return isinstance(self._scheduler, ModuleScheduler)
+
+    def _wake_on_msgQ(self, action):
+        """Run a pending action right away when a message is queued for
+        this module. No-op for modules on a dedicated thread."""
+        if self.uses_shared_scheduler():
+            get_shared_scheduler().set_queue_listener(
+                self.name(), lambda: self._scheduler.wake(action))
+
     def start_thread(self, conf_reader, msgQlist, product):
         self.initialize(conf_reader, msgQlist, product)
         self.start()
@@ -0,0 +1,246 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+"""
+ ****************************************************************************
+  Description:       Bounded internal message queue with priority lanes.
+
+                    Messages are classified as fault, fault_resolved,
+                    control, telemetry or debug and read in that order, so
+                    alerts never wait behind bulk telemetry. A fault does
+                    not overtake a fault_resolved of the same resource
+                    queued before it. Once capacity messages are queued, a
+                    new message first evicts the oldest droppable message
+                    of a lower class, otherwise the policy of its class
+                    applies: overflow queues it beyond capacity,
+                    drop_oldest evicts the oldest of its class and
+                    drop_newest drops it. Events of dropped messages are
+                    set so that no sensor waits on them.
+ ****************************************************************************
+"""
+
+import queue
+import re
+from collections import deque
+
+FAULT = "fault"
+FAULT_RESOLVED = "fault_resolved"
+CONTROL = "control"
+TELEMETRY = "telemetry"
+DEBUG = "debug"
+
+# Message classes, highest priority first
+MSG_CLASSES = (FAULT, FAULT_RESOLVED, CONTROL, TELEMETRY, DEBUG)
+_RESOLVED_LANE = MSG_CLASSES.index(FAULT_RESOLVED)
+
+OVERFLOW = "overflow"
+DROP_OLDEST = "drop_oldest"
+DROP_NEWEST = "drop_newest"
+
+DEFAULT_CAPACITY = 1000
+DEFAULT_POLICIES = {
+    FAULT: OVERFLOW,
+    FAULT_RESOLVED: OVERFLOW,
+    CONTROL: OVERFLOW,
+    TELEMETRY: DROP_OLDEST,
+    DEBUG: DROP_NEWEST,
+}
+
+# Alert types raising and clearing a condition of a resource
+_FAULT_ALERT_TYPES = frozenset(
+    ["fault", "missing", "threshold_breached:high"])
+_RESOLVED_ALERT_TYPES = frozenset(
+    ["fault_resolved", "insertion", "threshold_breached:low"])
+
+# Messages travel mostly as serialized JSON, which is searched instead of
+# being decoded once more
+_ALERT_TYPE = re.compile(r'"alert_type":\s*"([^"]*)"')
+_RESOURCE_TYPE = re.compile(r'"resource_type":\s*"([^"]*)"')
+_RESOURCE_ID = re.compile(r'"resource_id":\s*"?([^",}]*)')
+_LOG_DEBUG = re.compile(r'"log_level":\s*"LOG_DEBUG"')
+
+
+def classify_msg(jsonMsg):
+    """Return (message class, resource) of a message, the resource being
+    (resource_type, resource_id) for alerts and None otherwise."""
+    if isinstance(jsonMsg, dict):
+        message = jsonMsg.get("message", jsonMsg)
+        if not isinstance(message, dict):
+            return CONTROL, None
+        response = message.get("sensor_response_type")
+        if isinstance(response, dict):
+            alert_type = response.get("alert_type")
+            info = response.get("info") or {}
+            resource = (info.get("resource_type"),
+                        str(info.get("resource_id")))
+            return _classify_alert(alert_type, resource)
+        request = message.get("actuator_request_type")
+        if isinstance(request, dict) and \
+                (request.get("logging") or {}).get("log_level") == "LOG_DEBUG":
+            return DEBUG, None
+        return CONTROL, None
+
+    if isinstance(jsonMsg, str):
+        if '"sensor_response_type"' in jsonMsg:
+            match = _ALERT_TYPE.search(jsonMsg)
+            alert_type = match.group(1) if match else None
+            resource_type = _RESOURCE_TYPE.search(jsonMsg)
+            resource_id = _RESOURCE_ID.search(jsonMsg)
+            resource = (resource_type and resource_type.group(1),
+                        resource_id and resource_id.group(1))
+            return _classify_alert(alert_type, resource)
+        if _LOG_DEBUG.search(jsonMsg):
+            return DEBUG, None
+    return CONTROL, None
+
+
+def _classify_alert(alert_type, resource):
+    if alert_type in _FAULT_ALERT_TYPES:
+        return FAULT, resource
+    if alert_type in _RESOLVED_ALERT_TYPES:
+        return FAULT_RESOLVED, resource
+    return TELEMETRY, None
+
+
+class MsgQueue(queue.Queue):
+    """Queue of (jsonMsg, event) read by message class priority."""
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, policies=None):
+        """A capacity of 0 leaves the queue unbounded. policies maps
+        message classes to their policy, others use DEFAULT_POLICIES."""
+        self.capacity = capacity
+        self.policies = dict(DEFAULT_POLICIES)
+        for msg_class, policy in (policies or {}).items():
+            if msg_class not in self.policies:
+                raise ValueError(f"Unknown message class '{msg_class}'")
+            if policy not in (OVERFLOW, DROP_OLDEST, DROP_NEWEST):
+                raise ValueError(f"Unknown queue policy '{policy}'")
+            self.policies[msg_class] = policy
+        # The base class never blocks writers, capacity is enforced here
+        super(MsgQueue, self).__init__()
+
+    def _init(self, maxsize):
+        # Lanes hold (item, resource), highest priority first
+        self._lanes = [deque() for _ in MSG_CLASSES]
+        self._size = 0
+        # resource: number of its alerts in the fault_resolved lane
+        self._queued_resolved = {}
+        self._counters = {
+            "high_water": 0,
+            "lane_high_water": dict.fromkeys(MSG_CLASSES, 0),
+            "dropped": dict.fromkeys(MSG_CLASSES, 0),
+            "overflowed": dict.fromkeys(MSG_CLASSES, 0),
+        }
+
+    def _qsize(self):
+        return self._size
+
+    @property
+    def queue(self):
+        """Queued items in the order they are read, hold mutex to use."""
+        return [item for lane in self._lanes for item, _ in lane]
+
+    def put(self, item, block=True, timeout=None):
+        """Queue item, a (jsonMsg, event) tuple, never blocks."""
+        with self.not_empty:
+            if self._admit(item):
+                self.unfinished_tasks += 1
+                self.not_empty.notify()
+
+    def _admit(self, item):
+        """Queue item or drop it by the policies, True if it was queued."""
+        msg_class, resource = classify_msg(item[0])
+        index = MSG_CLASSES.index(msg_class)
+        if msg_class == FAULT and resource in self._queued_resolved:
+            index = _RESOLVED_LANE
+
+        if self.capacity and self._size >= self.capacity:
+            policy = self.policies[msg_class]
+            for lower in range(len(MSG_CLASSES) - 1, index, -1):
+                if self._lanes[lower] and \
+                        self.policies[MSG_CLASSES[lower]] != OVERFLOW:
+                    self._drop(lower)
+                    break
+            else:
+                if policy == OVERFLOW:
+                    self._counters["overflowed"][msg_class] += 1
+                elif policy == DROP_OLDEST and self._lanes[index]:
+                    self._drop(index)
+                else:
+                    self._counters["dropped"][msg_class] += 1
+                    self._set_event(item)
+                    return False
+
+        if index != _RESOLVED_LANE:
+            resource = None
+        elif resource is not None:
+            self._queued_resolved[resource] = \
+                self._queued_resolved.get(resource, 0) + 1
+        lane = self._lanes[index]
+        lane.append((item, resource))
+        self._size += 1
+        lane_high_water = self._counters["lane_high_water"]
+        lane_high_water[MSG_CLASSES[index]] = \
+            max(lane_high_water[MSG_CLASSES[index]], len(lane))
+        self._counters["high_water"] = \
+            max(self._counters["high_water"], self._size)
+        return True
+
+    def _get(self):
+        for index, lane in enumerate(self._lanes):
+            if lane:
+                return self._pop(index)
+
+    def _pop(self, index):
+        item, resource = self._lanes[index].popleft()
+        self._size -= 1
+        if resource is not None:
+            count = self._queued_resolved[resource] - 1
+            if count:
+                self._queued_resolved[resource] = count
+            else:
+                del self._queued_resolved[resource]
+        return item
+
+    def _drop(self, index):
+        item = self._pop(index)
+        self.unfinished_tasks -= 1
+        self._counters["dropped"][MSG_CLASSES[index]] += 1
+        self._set_event(item)
+
+    @staticmethod
+    def _set_event(item):
+        event = item[1] if isinstance(item, tuple) and len(item) > 1 else None
+        if event is not None:
+            event.set()
+
+    def get_counters(self):
+        """Return the high-water marks and drop and overflow counts."""
+        with self.mutex:
+            return {key: dict(value) if isinstance(value, dict) else value
+                    for key, value in self._counters.items()}
+
+
+def new_msgQ():
+    """Return a MsgQueue set up by SSPL_LL_SETTING>msg_queue_capacity and
+    SSPL_LL_SETTING>msg_queue_policies."""
+    # Imported here as reading sspl config needs cortx-utils
+    from framework.utils.conf_utils import SSPL_CONF, Conf, SSPL_LL_SETTING
+    capacity = int(Conf.get(SSPL_CONF,
+                            f"{SSPL_LL_SETTING}>msg_queue_capacity",
+                            DEFAULT_CAPACITY))
+    policies = Conf.get(SSPL_CONF, f"{SSPL_LL_SETTING}>msg_queue_policies",
+                        None)
+    return MsgQueue(capacity, policies)
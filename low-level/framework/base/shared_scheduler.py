@@ -0,0 +1,326 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+"""
+ ****************************************************************************
+  Description:       Process wide timer queue and worker pool shared by
+                    module threads.
+
+                    A single timer thread sleeps until the earliest event
+                    of all registered modules is due and hands due events
+                    to a small worker pool. Events of one module never run
+                    concurrently, so module code keeps the single threaded
+                    behaviour it had with its own sched.scheduler.
+ ****************************************************************************
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from framework.utils.service_logging import logger
+
+
+class ScheduledEvent(object):
+    """An action due at a point in time, ordered like sched.Event."""
+
+    __slots__ = ("time", "priority", "sequence", "action", "argument",
+                 "kwargs", "owner", "cancelled")
+
+    def __init__(self, time, priority, sequence, action, argument, kwargs,
+                 owner):
+        self.time = time
+        self.priority = priority
+        self.sequence = sequence
+        self.action = action
+        self.argument = argument
+        self.kwargs = kwargs
+        self.owner = owner
+        self.cancelled = False
+
+    def __lt__(self, other):
+        return (self.time, self.priority, self.sequence) < \
+            (other.time, other.priority, other.sequence)
+
+
+class SharedScheduler(object):
+    """Timer queue of every ModuleScheduler, running actions on a pool."""
+
+    DEFAULT_WORKERS = 4
+
+    def __init__(self, workers=DEFAULT_WORKERS, timefunc=time.monotonic):
+        self._timefunc = timefunc
+        self._heap = []
+        self._sequence = itertools.count()
+        self._cond = threading.Condition()
+        self._workers = workers
+        self._executor = None
+        self._timer = None
+        # Queue name: callback run when a message is written to it
+        self._queue_listeners = {}
+
+    def now(self):
+        return self._timefunc()
+
+    def schedule(self, when, priority, action, argument=(), kwargs=None,
+                 owner=None):
+        """Add an event due at when (in timefunc time)."""
+        event = ScheduledEvent(when, priority, next(self._sequence), action,
+                               argument, kwargs or {}, owner)
+        with self._cond:
+            self._start()
+            heapq.heappush(self._heap, event)
+            if self._heap[0] is event:
+                # New earliest event, the timer must re-arm its wait
+                self._cond.notify()
+        return event
+
+    def call_later(self, delay, action, *argument):
+        """Run action on the pool after delay seconds, outside any module."""
+        return self.schedule(self.now() + delay, 0, action, argument)
+
+    def cancel(self, event):
+        """Cancel a pending event, it is dropped lazily by the timer."""
+        event.cancelled = True
+
+    def submit(self, func, *args):
+        self._start()
+        return self._executor.submit(func, *args)
+
+    def set_queue_listener(self, name, callback):
+        """Call callback whenever a message is written to queue name.
+
+        A queue is read by one module only, so a later call replaces the
+        listener of a restarted module. None removes it.
+        """
+        with self._cond:
+            if callback is None:
+                self._queue_listeners.pop(name, None)
+            else:
+                self._queue_listeners[name] = callback
+
+    def notify_queue(self, name):
+        """Signal that a message has been written to queue name."""
+        callback = self._queue_listeners.get(name)
+        if callback is not None:
+            callback()
+
+    def _start(self):
+        if self._timer is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._workers, thread_name_prefix="sspl_sched")
+            self._timer = threading.Thread(target=self._run_timer,
+                                           name="sspl_sched_timer",
+                                           daemon=True)
+            self._timer.start()
+
+    def _run_timer(self):
+        while True:
+            due = []
+            with self._cond:
+                while True:
+                    while self._heap and self._heap[0].cancelled:
+                        heapq.heappop(self._heap)
+                    if not self._heap:
+                        self._cond.wait()
+                        continue
+                    delay = self._heap[0].time - self._timefunc()
+                    if delay <= 0:
+                        break
+                    self._cond.wait(delay)
+                now = self._timefunc()
+                while self._heap and self._heap[0].time <= now:
+                    event = heapq.heappop(self._heap)
+                    if not event.cancelled:
+                        due.append(event)
+            for event in due:
+                if event.owner is not None:
+                    event.owner._dispatch(event)
+                else:
+                    self._executor.submit(self._run_event, event)
+
+    @staticmethod
+    def _run_event(event):
+        try:
+            event.action(*event.argument, **event.kwargs)
+        except Exception as err:
+            logger.exception(f"SharedScheduler, {event.action} failed: {err}")
+
+
+class ModuleScheduler(object):
+    """sched.scheduler replacement for one module on the SharedScheduler.
+
+    enter(), enterabs(), cancel(), empty() and queue behave like their
+    sched.scheduler counterparts. Instead of run() blocking the module
+    thread, start() returns immediately and exit_callback(err) is called
+    once no event is left (err is None) or when an action raised err.
+    """
+
+    def __init__(self, name, shared):
+        self._name = name
+        self._shared = shared
+        self._lock = threading.Lock()
+        self._pending = set()
+        self._ready = deque()
+        self._busy = False
+        self._started = False
+        self.exit_callback = None
+
+    @property
+    def queue(self):
+        with self._lock:
+            return sorted(self._pending)
+
+    def empty(self):
+        with self._lock:
+            return not self._pending and not self._ready
+
+    def enter(self, delay, priority, action, argument=(), kwargs=None):
+        return self.enterabs(self._shared.now() + delay, priority, action,
+                             argument, kwargs)
+
+    def enterabs(self, time, priority, action, argument=(), kwargs=None):
+        with self._lock:
+            event = self._shared.schedule(time, priority, action, argument,
+                                          kwargs, owner=self)
+            self._pending.add(event)
+        return event
+
+    def cancel(self, event):
+        with self._lock:
+            if event not in self._pending:
+                raise ValueError("event not scheduled by this module")
+            self._pending.discard(event)
+        self._shared.cancel(event)
+
+    def clear(self):
+        """Cancel every pending event."""
+        with self._lock:
+            events = list(self._pending)
+            self._pending.clear()
+            self._ready.clear()
+        for event in events:
+            self._shared.cancel(event)
+
+    def wake(self, action=None):
+        """Run pending events, or only those of action, right away."""
+        with self._lock:
+            events = [event for event in self._pending
+                      if action is None or event.action == action]
+        now = self._shared.now()
+        for event in events:
+            if event.time > now:
+                try:
+                    self.cancel(event)
+                except ValueError:
+                    # Already dispatched
+                    continue
+                self.enterabs(now, event.priority, event.action,
+                              event.argument, event.kwargs)
+
+    def start(self):
+        """Begin dispatching, actions entered before start() are held."""
+        with self._lock:
+            self._started = True
+            ready = bool(self._ready) and not self._busy
+            if ready:
+                self._busy = True
+        if ready:
+            self._shared.submit(self._drain)
+        elif self.empty():
+            self._finish(None)
+
+    def run(self, blocking=True):
+        """Compatibility with sched.scheduler, same as start()."""
+        self.start()
+
+    def _dispatch(self, event):
+        """Called by the timer for a due event of this module."""
+        with self._lock:
+            if event not in self._pending:
+                return
+            self._pending.discard(event)
+            self._ready.append(event)
+            if self._busy or not self._started:
+                return
+            self._busy = True
+        self._shared.submit(self._drain)
+
+    def _drain(self):
+        """Run ready events one at a time on a pool worker."""
+        while True:
+            with self._lock:
+                if not self._ready:
+                    self._busy = False
+                    finished = not self._pending and self._started
+                    break
+                event = self._ready.popleft()
+            try:
+                event.action(*event.argument, **event.kwargs)
+            except Exception as err:
+                logger.error(f"{self._name}, scheduled action failed: {err}")
+                with self._lock:
+                    self._busy = False
+                    self._started = False
+                self.clear()
+                self._finish(err)
+                return
+        if finished:
+            with self._lock:
+                self._started = False
+            self._finish(None)
+
+    def _finish(self, err):
+        if self.exit_callback is not None:
+            try:
+                self.exit_callback(err)
+            except Exception as cb_err:
+                logger.exception(f"{self._name}, exit callback failed: {cb_err}")
+
+
+_shared_scheduler = None
+_shared_scheduler_lock = threading.Lock()
+
+
+def get_shared_scheduler():
+    """Return the process wide SharedScheduler, created on first use."""
+    global _shared_scheduler
+    if _shared_scheduler is None:
+        with _shared_scheduler_lock:
+            if _shared_scheduler is None:
+                # Imported here as reading sspl config needs cortx-utils
+                from framework.utils.conf_utils import (SSPL_CONF, Conf,
+                                                        SSPL_LL_SETTING)
+                workers = int(Conf.get(SSPL_CONF,
+                    f"{SSPL_LL_SETTING}>scheduler_workers",
+                    SharedScheduler.DEFAULT_WORKERS))
+                _shared_scheduler = SharedScheduler(workers)
+    return _shared_scheduler
+
+
+def notify_queue(name):
+    """Wake the listener of queue name, if the SharedScheduler is in use."""
+    if _shared_scheduler is not None:
+        _shared_scheduler.notify_queue(name)
+
+
+def shared_scheduler_enabled():
+    """True unless disabled with SSPL_LL_SETTING>shared_scheduler."""
+    from framework.utils.conf_utils import SSPL_CONF, Conf, SSPL_LL_SETTING
+    enabled = Conf.get(SSPL_CONF, f"{SSPL_LL_SETTING}>shared_scheduler", True)
+    return enabled in [True, 'true', 'True']
@@ -29,7 +29,7 @@ from cortx.utils.iem_framework.error import EventMessageError
 from framework.base.internal_msgQ import InternalMsgQ
 from framework.base.module_thread import ScheduledModuleThread
 from framework.base.sspl_constants import IEM_INIT_FAILED
-from framework.utils.conf_utils import SSPL_CONF, Conf
+from framework.utils.conf_utils import EGRESSPROCESSOR, SSPL_CONF, Conf
 from framework.utils.service_logging import logger
 from framework.utils.store_queue import StoreQueue
 from framework.utils.iem import Iem
@@ -41,11 +41,12 @@ class EgressAccumulatedMsgsProcessor(ScheduledModuleThread, InternalMsgQ):
 
     SENSOR_NAME = "EgressAccumulatedMsgsProcessor"
     PRIORITY    = 1
+    SHARED_SCHEDULER = True
 
     # TODO: read egress config from common place
     # Section and keys in configuration file
     # Section and keys in configuration file
-    PROCESSOR = 'EgressProcessor'
+    PROCESSOR = EGRESSPROCESSOR
     SIGNATURE_USERNAME = 'message_signature_username'
     SIGNATURE_TOKEN = 'message_signature_token'
     SIGNATURE_EXPIRES = 'message_signature_expires'
@@ -53,8 +54,13 @@ class EgressAccumulatedMsgsProcessor(ScheduledModuleThread, InternalMsgQ):
     PRODUCER_ID = 'producer_id'
     MESSAGE_TYPE = 'message_type'
     METHOD = 'method'
+    DRAIN_BATCH_SIZE = 'drain_batch_size'
+    DRAIN_IDLE_INTERVAL = 'drain_idle_interval'
+    DRAIN_MAX_BACKOFF = 'drain_max_backoff'
     # 300 seconds for 5 mins
     MSG_TIMEOUT = 300
+    # Delay between batches while a backlog is being drained
+    DRAIN_BUSY_INTERVAL = 0.1
 
     @staticmethod
     def name():
@@ -74,9 +80,14 @@ class EgressAccumulatedMsgsProcessor(ScheduledModuleThread, InternalMsgQ):
 
         super(EgressAccumulatedMsgsProcessor, self).initialize_msgQ(
             msgQlist)
+        # Handle a shutdown message without waiting for the idle interval
+        self._wake_on_msgQ(self.run)
 
         self.store_queue = StoreQueue()
         self._read_config()
+        self._backoff = self._idle_interval
+        self._drained_count = 0
+        self._drain_rate = 0.0
         producer_initialized.wait()
         self.create_MsgProducer_obj()
 
@@ -114,52 +125,154 @@ class EgressAccumulatedMsgsProcessor(ScheduledModuleThread, InternalMsgQ):
                     "EgressAccumulatedMsgsProcessor, run, received"
                     "global shutdown message from sspl_ll_d")
                 self.shutdown()
+        next_run = self._idle_interval
         try:
             # TODO : Fix accumulated message processor when message bus changes are available to
             # error out in case of failure (EOS-17626)
             if not self.store_queue.is_empty():
                 logger.debug("Found accumulated messages, trying to send again")
-                while not self.store_queue.is_empty():
-                    message = self.store_queue.get()
-                    if isinstance(message, bytes):
-                        message = message.decode()
-                    dict_msg = json.loads(message)
-                    if dict_msg.get("iem"):
-                        try:
-                            Iem.raise_iem_event(
-                                module=dict_msg["iem"]["module"],
-                                event_code=dict_msg["iem"]["event_code"],
-                                severity=dict_msg["iem"]["severity"],
-                                description=dict_msg["iem"]["description"])
-                            logger.info("Accumulated IEM sent. %s" % dict_msg)
-                            self.store_queue.delete()
-                        except (EventMessageError, Exception) as e:
-                            logger.error(f"Failed to send IEM. ERROR: {e}")
-                    else:
-                        if "actuator_response_type" in dict_msg["message"]:
-                            event_time = dict_msg["message"] \
-                                ["actuator_response_type"]["info"]["event_time"]
-                            time_diff = int(time.time()) - int(event_time)
-                            if time_diff > self.MSG_TIMEOUT:
-                                continue
-                        if "sensor_response_type" in dict_msg["message"]:
-                            logger.info(f"Publishing Accumulated Alert: {message}")
-                        if isinstance(self._producer, MessageProducer):
-                            self._producer.send([message])
-                            logger.info(f"Published Accumulated Message {message}")
-                            self.store_queue.delete()
-                        else:
-                            self.create_MsgProducer_obj()
+                next_run = self._drain()
         except MessageBusError as e:
             logger.error("EgressAccumulatedMsgsProcessor, run, %r" % e)
+            next_run = self._next_backoff()
         except Exception as e:
             logger.error(e)
+            next_run = self._next_backoff()
         finally:
             logger.debug("Consul accumulated processing ended")
-            self._scheduler.enter(30, self._priority, self.run, ())
+            self._scheduler.enter(next_run, self._priority, self.run, ())
+
+    def _drain(self):
+        """Send accumulated messages in batches while the backlog lasts.
+
+        Returns the delay before the next run: short while messages are left
+        and the bus accepts them, backing off exponentially when it does not.
+        """
+        start = time.time()
+        sent = 0
+        while not self.store_queue.is_empty():
+            messages = self.store_queue.get_many(self._batch_size)
+            done, batch_sent = self._send_batch(messages)
+            if done:
+                self.store_queue.delete_many(done)
+                sent += batch_sent
+            if done < len(messages):
+                self._update_drain_rate(sent, time.time() - start)
+                return self._next_backoff()
+            if time.time() - start >= self._idle_interval:
+                # Give the shutdown check in run() a chance on large backlogs
+                break
+        self._update_drain_rate(sent, time.time() - start)
+        self._backoff = self._idle_interval
+        if self.store_queue.is_empty():
+            return self._idle_interval
+        return self.DRAIN_BUSY_INTERVAL
+
+    def _send_batch(self, messages):
+        """Publish a batch of accumulated messages.
+
+        Returns the number of leading messages which are done with (sent or
+        expired) and can be deleted, and the number actually sent.
+        """
+        to_send = []
+        # Index of the first message in to_send, nothing after it may be
+        # deleted if publishing to_send fails
+        first_pending = 0
+        done = 0
+        sent = 0
+        for message in messages:
+            if isinstance(message, bytes):
+                message = message.decode()
+            try:
+                dict_msg = json.loads(message)
+            except ValueError as e:
+                logger.error(f"Dropping undecodable accumulated message: {e}")
+                done += 1
+                continue
+            if dict_msg.get("iem"):
+                # IEMs go through the IEM framework, keep them ordered with
+                # the messages queued before them
+                if to_send:
+                    if not self._publish(to_send):
+                        return first_pending, sent
+                    sent += len(to_send)
+                    to_send = []
+                try:
+                    Iem.raise_iem_event(
+                        module=dict_msg["iem"]["module"],
+                        event_code=dict_msg["iem"]["event_code"],
+                        severity=dict_msg["iem"]["severity"],
+                        description=dict_msg["iem"]["description"])
+                    logger.info("Accumulated IEM sent. %s" % dict_msg)
+                except (EventMessageError, Exception) as e:
+                    logger.error(f"Failed to send IEM. ERROR: {e}")
+                    return done, sent
+                done += 1
+                sent += 1
+                continue
+            if "actuator_response_type" in dict_msg["message"]:
+                event_time = dict_msg["message"] \
+                    ["actuator_response_type"]["info"]["event_time"]
+                time_diff = int(time.time()) - int(event_time)
+                if time_diff > self.MSG_TIMEOUT:
+                    # Stale actuator response, nobody is waiting for it
+                    done += 1
+                    continue
+            if "sensor_response_type" in dict_msg["message"]:
+                logger.debug(f"Publishing Accumulated Alert: {message}")
+            if not to_send:
+                first_pending = done
+            to_send.append(message)
+            done += 1
+        if to_send:
+            if not self._publish(to_send):
+                return first_pending, sent
+            sent += len(to_send)
+        return done, sent
+
+    def _publish(self, messages):
+        """Send messages as one list, returns False if the bus is unavailable."""
+        if not isinstance(self._producer, MessageProducer):
+            self.create_MsgProducer_obj()
+            return False
+        try:
+            self._producer.send(messages)
+        except MessageBusError as e:
+            logger.error(f"EgressAccumulatedMsgsProcessor, _publish, {e}")
+            return False
+        logger.info(f"Published {len(messages)} Accumulated Messages")
+        return True
+
+    def _next_backoff(self):
+        """Double the retry delay, up to the configured maximum."""
+        delay = self._backoff
+        self._backoff = min(self._backoff * 2, self._max_backoff)
+        return delay
+
+    def _update_drain_rate(self, sent, elapsed):
+        self._drained_count += sent
+        if sent and elapsed > 0:
+            self._drain_rate = sent / elapsed
+            logger.info(f"EgressAccumulatedMsgsProcessor, drained {sent} messages"
+                        f" at {self._drain_rate:.1f} msgs/sec, total drained"
+                        f" {self._drained_count}")
+
+    @property
+    def drain_rate(self):
+        """Messages per second sent by the last drain cycle."""
+        return self._drain_rate
+
+    @property
+    def drained_count(self):
+        """Messages sent from the accumulated queue since start."""
+        return self._drained_count
 
     def _read_config(self):
         """Read config for messaging bus."""
+        # Drain defaults, kept if the config cannot be read
+        self._batch_size = 100
+        self._idle_interval = 30
+        self._max_backoff = 300
         try:
             self._signature_user = Conf.get(SSPL_CONF,
                                             f"{self.PROCESSOR}>{self.SIGNATURE_USERNAME}",
@@ -179,6 +292,15 @@ class EgressAccumulatedMsgsProcessor(ScheduledModuleThread, InternalMsgQ):
             self._method = Conf.get(SSPL_CONF,
                                     f"{self.PROCESSOR}>{self.METHOD}",
                                     "sync")
+            self._batch_size = int(Conf.get(SSPL_CONF,
+                                            f"{self.PROCESSOR}>{self.DRAIN_BATCH_SIZE}",
+                                            self._batch_size))
+            self._idle_interval = int(Conf.get(SSPL_CONF,
+                                               f"{self.PROCESSOR}>{self.DRAIN_IDLE_INTERVAL}",
+                                               self._idle_interval))
+            self._max_backoff = int(Conf.get(SSPL_CONF,
+                                             f"{self.PROCESSOR}>{self.DRAIN_MAX_BACKOFF}",
+                                             self._max_backoff))
         except Exception as ex:
             logger.error("EgressProcessor, _read_config: %r" % ex)
 
@@ -28,7 +28,9 @@ from cortx.utils.message_bus.error import MessageBusError
 
 from framework.base.internal_msgQ import InternalMsgQ
 from framework.base.module_thread import ScheduledModuleThread
+from framework.utils.alert_coalescer import AlertCoalescer
 from framework.utils.conf_utils import SSPL_CONF, Conf
+from framework.utils.message_signer import MessageSigner, render_message
 from framework.utils.service_logging import logger
 from framework.utils.store_queue import StoreQueue
 from . import producer_initialized
@@ -57,6 +59,14 @@ class EgressProcessor(ScheduledModuleThread, InternalMsgQ):
     PRODUCER_ID = 'producer_id'
     MESSAGE_TYPE = 'message_type'
     METHOD = 'method'
+    COALESCE_WINDOW = 'coalesce_window'
+    COALESCE_RATE_LIMIT = 'coalesce_rate_limit'
+    COALESCE_RATE_PERIOD = 'coalesce_rate_period'
+    PUBLISH_BATCH_SIZE = 'publish_batch_size'
+    PUBLISH_LINGER_MS = 'publish_linger_ms'
+
+    # Seconds between logs of the alert coalescing counters
+    COUNTERS_LOG_INTERVAL = 300
 
     @staticmethod
     def name():
@@ -81,6 +91,20 @@ class EgressProcessor(ScheduledModuleThread, InternalMsgQ):
         self._request_shutdown = False
 
         self._read_config()
+        self._signer = None
+        if use_security_lib:
+            self._signer = MessageSigner(SSPL_SEC, self._signature_user,
+                                         self._signature_token,
+                                         self._signature_expires)
+        self._coalescer = AlertCoalescer(self._coalesce_window,
+                                         self._coalesce_rate_limit,
+                                         self._coalesce_rate_period)
+        self._counters_logged = None
+        self._msgQ_counters_logged = None
+        # (serialized message, event, is_ack) in the order they were read
+        self._batch = []
+        self._batch_started = None
+        self._next_counters_log = time.monotonic() + self.COUNTERS_LOG_INTERVAL
         self.create_MsgProducer_obj()
         producer_initialized.set()
 
@@ -102,10 +126,25 @@ class EgressProcessor(ScheduledModuleThread, InternalMsgQ):
         try:
             # Loop thru all messages in queue until and transmit
             while not self._is_my_msgQ_empty():
-                self._jsonMsg, self._event = self._read_my_msgQ()
-
-                if self._jsonMsg is not None:
-                    self._transmit_msg_on_exchange()
+                jsonMsg, event = self._read_my_msgQ()
+
+                if jsonMsg is not None:
+                    self._transmit_msgs(self._coalescer.add(jsonMsg, event))
+
+            # Alerts held back by ended windows, all of them on shutdown
+            self._transmit_msgs(
+                self._coalescer.flush(force=self._request_shutdown))
+
+            # Give a started batch up to the linger time to fill up
+            while self._batch and not self._request_shutdown:
+                deadline = self._batch_started + self._linger_time
+                if time.monotonic() >= deadline:
+                    break
+                jsonMsg, event = self._read_my_msgQ_until(deadline)
+                if jsonMsg is not None:
+                    self._transmit_msgs(self._coalescer.add(jsonMsg, event))
+            self._send_batch()
+            self._log_counters()
 
         except Exception:
             # Log it and restart the whole process when a failure occurs
@@ -119,10 +158,21 @@ class EgressProcessor(ScheduledModuleThread, InternalMsgQ):
         if self._request_shutdown is True:
             self.shutdown()
         else:
-            self._scheduler.enter(1, self._priority, self.run, ())
+            delay = 1
+            deadline = self._coalescer.get_next_deadline()
+            if deadline is not None:
+                delay = min(delay, max(0, deadline - time.monotonic()))
+            self._scheduler.enter(delay, self._priority, self.run, ())
 
     def _read_config(self):
         """Read the messaging bus configs."""
+        # Coalescing and batching defaults, kept if the config cannot be
+        # read
+        self._coalesce_window = 2
+        self._coalesce_rate_limit = 10
+        self._coalesce_rate_period = 60
+        self._batch_size = 50
+        self._linger_time = 10 / 1000
         try:
             self._signature_user = Conf.get(SSPL_CONF,
                                             f"{self.PROCESSOR}>{self.SIGNATURE_USERNAME}",
@@ -142,42 +192,67 @@ class EgressProcessor(ScheduledModuleThread, InternalMsgQ):
             self._method = Conf.get(SSPL_CONF,
                                     f"{self.PROCESSOR}>{self.METHOD}",
                                     "sync")
+            self._coalesce_window = float(Conf.get(SSPL_CONF,
+                                                   f"{self.PROCESSOR}>{self.COALESCE_WINDOW}",
+                                                   self._coalesce_window))
+            self._coalesce_rate_limit = int(Conf.get(SSPL_CONF,
+                                                     f"{self.PROCESSOR}>{self.COALESCE_RATE_LIMIT}",
+                                                     self._coalesce_rate_limit))
+            self._coalesce_rate_period = float(Conf.get(SSPL_CONF,
+                                                        f"{self.PROCESSOR}>{self.COALESCE_RATE_PERIOD}",
+                                                        self._coalesce_rate_period))
+            self._batch_size = max(1, int(Conf.get(SSPL_CONF,
+                                                   f"{self.PROCESSOR}>{self.PUBLISH_BATCH_SIZE}",
+                                                   self._batch_size)))
+            self._linger_time = int(Conf.get(SSPL_CONF,
+                                             f"{self.PROCESSOR}>{self.PUBLISH_LINGER_MS}",
+                                             10)) / 1000
 
         except Exception as ex:
             logger.error("EgressProcessor, _read_config: %r" % ex)
 
+    def _transmit_msgs(self, msgs):
+        """Transmit the (jsonMsg, event) pairs released by the coalescer."""
+        for self._jsonMsg, self._event in msgs:
+            self._transmit_msg_on_exchange()
+
+    def _log_counters(self):
+        """Log the alert coalescing and message queue counters when they
+        changed."""
+        now = time.monotonic()
+        if now < self._next_counters_log:
+            return
+        self._next_counters_log = now + self.COUNTERS_LOG_INTERVAL
+        counters = self._coalescer.get_counters()
+        if counters != self._counters_logged:
+            logger.info(f"EgressProcessor, alert coalescing: {counters}")
+            self._counters_logged = counters
+        counters = self._get_msgQ_counters(self.name())
+        if counters != self._msgQ_counters_logged:
+            logger.info(f"EgressProcessor, message queue: {counters}")
+            self._msgQ_counters_logged = counters
+
     def _add_signature(self):
-        """Adds the authentication signature to the message"""
-        self._log_debug("_add_signature, jsonMsg: %s" % self._jsonMsg)
+        """Adds the authentication signature to the message and returns
+        the message serialized as JSON"""
+        self._log_debug("_add_signature, jsonMsg: %s", self._jsonMsg)
         self._jsonMsg["username"] = self._signature_user
         self._jsonMsg["expires"] = int(self._signature_expires)
         self._jsonMsg["time"] = str(int(time.time()))
 
-        if use_security_lib:
-            authn_token_len = len(self._signature_token) + 1
-            session_length = int(self._signature_expires)
-            token = ctypes.create_string_buffer(
-                SSPL_SEC.sspl_get_token_length())
-
-            SSPL_SEC.sspl_generate_session_token(
-                self._signature_user, authn_token_len,
-                self._signature_token, session_length, token)
-
-            # Generate the signature
-            msg_len = len(self._jsonMsg) + 1
-            sig = ctypes.create_string_buffer(SSPL_SEC.sspl_get_sig_length())
-            SSPL_SEC.sspl_sign_message(msg_len, str(self._jsonMsg),
-                                       self._signature_user,
-                                       token, sig)
-
-            self._jsonMsg["signature"] = str(sig.raw, encoding='utf-8')
+        # The signature covers the serialized message body, which is
+        # rendered once for signing and sending
+        body = json.dumps(self._jsonMsg.get("message"))
+        if self._signer is not None:
+            self._jsonMsg["signature"] = self._signer.sign(body.encode())
         else:
             self._jsonMsg["signature"] = "SecurityLibNotInstalled"
+        return render_message(self._jsonMsg, body)
 
     def _transmit_msg_on_exchange(self):
         """Transmit json message onto messaging bus."""
         self._log_debug(
-            "_transmit_msg_on_exchange, jsonMsg: %s" % self._jsonMsg)
+            "_transmit_msg_on_exchange, jsonMsg: %s", self._jsonMsg)
 
         try:
             # Check for shut down message from sspl_ll_d and set a flag to shutdown
@@ -203,55 +278,88 @@ class EgressProcessor(ScheduledModuleThread, InternalMsgQ):
             # is "thread_controller".
             # TODO: Find a proper way to solve this issue. Avoid changing
             # core egress processor code
-            if self._jsonMsg.get("message").get(
+            is_ack = self._jsonMsg.get("message").get(
                     "actuator_response_type") is not None and \
                     (self._jsonMsg.get("message").get(
                         "actuator_response_type").get("ack") is not None or
                      self._jsonMsg.get("message").get(
                          "actuator_response_type").get(
-                         "thread_controller") is not None):
-                self._add_signature()
-                if isinstance(self._producer, MessageProducer):
-                    self._producer.send([json.dumps(self._jsonMsg)])
-                else:
-                    self.create_MsgProducer_obj()
-                logger.debug(
-                    "_transmit_msg_on_exchange, Successfully Sent: %s" % self._jsonMsg)
-            else:
-                self._add_signature()
-                jsonMsg = json.dumps(self._jsonMsg)
-                try:
-                    if self.store_queue.is_empty():
-                        if isinstance(self._producer, MessageProducer):
-                            self._producer.send([jsonMsg])
-                            logger.info(f"Published Alert: {jsonMsg}")
-                        else:
-                            logger.info(f"MessageProducer instance is not available,"
-                                "adding message to accumulated queue.")
-                            self.store_queue.put(jsonMsg)
-                            self.create_MsgProducer_obj()
-                    else:
-                        logger.info("'Accumulated msg queue' is not Empty." +
-                                    " Adding the msg to the end of the queue")
-                        self.store_queue.put(jsonMsg)
-                except MessageBusError as e:
-                    logger.error(
-                        f"EgressProcessor, _transmit_msg_on_exchange, error {e} in producing message,\
-                                    adding message to consul {self._jsonMsg}")
-                    self.store_queue.put(jsonMsg)
-                except Exception as err:
-                    logger.error(
-                        f'EgressProcessor, _transmit_msg_on_exchange, Unknown error {err} while publishing the message, adding to persistent store {self._jsonMsg}')
-                    self.store_queue.put(jsonMsg)
-
-            # If event is added by sensors, set it
-            if self._event:
-                self._event.set()
+                         "thread_controller") is not None)
+            jsonMsg = self._add_signature()
+            if not self._batch:
+                self._batch_started = time.monotonic()
+            self._batch.append((jsonMsg, self._event, is_ack))
+            if len(self._batch) >= self._batch_size:
+                self._send_batch()
 
         except Exception as ex:
             logger.error(
                 f'EgressProcessor, _transmit_msg_on_exchange, problem while publishing the message:{ex}, adding message to consul: {self._jsonMsg}')
 
+    def _send_batch(self):
+        """Publish the batch with a single send.
+
+        Events are set once the batch was acknowledged, or its alerts were
+        added to the accumulated queue. Alerts of a failed batch go to the
+        queue together and in order, as do all alerts while the queue holds
+        older ones, so the order of messages from a module is preserved.
+        """
+        batch, self._batch = self._batch, []
+        if not self.store_queue.is_empty():
+            alerts = [item for item in batch if not item[2]]
+            if alerts:
+                logger.info("'Accumulated msg queue' is not Empty." +
+                            f" Adding {len(alerts)} msgs to the end of the queue")
+                self._spill(alerts)
+                batch = [item for item in batch if item[2]]
+        if not batch:
+            return
+
+        if not isinstance(self._producer, MessageProducer):
+            logger.info(f"MessageProducer instance is not available,"
+                "adding message to accumulated queue.")
+            self._spill(batch)
+            self.create_MsgProducer_obj()
+            return
+
+        try:
+            self._producer.send([jsonMsg for jsonMsg, _, _ in batch])
+        except MessageBusError as e:
+            logger.error(
+                f"EgressProcessor, _send_batch, error {e} in producing {len(batch)} messages,\
+                                adding them to consul")
+            self._spill(batch)
+            return
+        except Exception as err:
+            logger.error(
+                f'EgressProcessor, _send_batch, Unknown error {err} while publishing {len(batch)} messages, adding them to persistent store')
+            self._spill(batch)
+            return
+
+        for jsonMsg, _, is_ack in batch:
+            if is_ack:
+                self._log_debug("_send_batch, Successfully Sent: %s", jsonMsg)
+            else:
+                logger.info(f"Published Alert: {jsonMsg}")
+        self._set_events(batch)
+
+    def _spill(self, batch):
+        """Add the alerts of batch to the accumulated queue as a unit.
+
+        Acks are not resent later, as before batching.
+        """
+        alerts = [jsonMsg for jsonMsg, _, is_ack in batch if not is_ack]
+        if alerts:
+            self.store_queue.put_many(alerts)
+        self._set_events(batch)
+
+    @staticmethod
+    def _set_events(batch):
+        # If event is added by sensors, set it
+        for _, event, _ in batch:
+            if event:
+                event.set()
+
     def shutdown(self):
         """Clean up scheduler queue and gracefully shutdown thread"""
         super(EgressProcessor, self).shutdown()
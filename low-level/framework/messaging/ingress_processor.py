@@ -25,7 +25,7 @@ import os
 import time
 
 from cortx.utils.message_bus import MessageConsumer
-from jsonschema import Draft3Validator, validate
+from jsonschema import Draft3Validator
 
 from framework.base.internal_msgQ import InternalMsgQ
 from framework.base.module_thread import ScheduledModuleThread
@@ -34,6 +34,7 @@ from framework.messaging.egress_processor import \
     EgressProcessor
 from framework.utils.conf_utils import (
     SSPL_CONF, Conf, GLOBAL_CONF, NODE_ID_KEY)
+from framework.utils.keyed_executor import KeyedExecutor
 from framework.utils.service_logging import logger
 from json_msgs.messages.actuators.ack_response import AckResponseMsg
 from . import producer_initialized
@@ -59,12 +60,24 @@ class IngressProcessor(ScheduledModuleThread, InternalMsgQ):
     CONSUMER_GROUP_PREFIX = "consumer_group_prefix"
     MESSAGE_TYPE = "message_type"
     OFFSET = "offset"
+    DISPATCH_WORKERS = "dispatch_workers"
+    MAX_IN_FLIGHT = "max_in_flight"
     SYSTEM_INFORMATION_KEY = 'SYSTEM_INFORMATION'
     CLUSTER_ID_KEY = 'cluster_id'
 
     JSON_ACTUATOR_SCHEMA = "SSPL-LL_Actuator_Request.json"
     JSON_SENSOR_SCHEMA = "SSPL-LL_Sensor_Request.json"
 
+    # Module handling each actuator and sensor request type
+    MSG_HANDLERS = {
+        "thread_controller": "ThreadController",
+        "service_controller": "ServiceMsgHandler",
+        "node_controller": "NodeControllerMsgHandler",
+        "storage_enclosure": "RealStorActuatorMsgHandler",
+        "node_data": "NodeDataMsgHandler",
+        "enclosure_alert": "RealStorEnclMsgHandler",
+    }
+
     @staticmethod
     def name():
         """ @return: name of the module."""
@@ -77,12 +90,14 @@ class IngressProcessor(ScheduledModuleThread, InternalMsgQ):
         # Read in the actuator schema for validating messages
         schema_file = os.path.join(RESOURCE_PATH + '/actuators',
                                    self.JSON_ACTUATOR_SCHEMA)
-        self._actuator_schema = self._load_schema(schema_file)
+        self._actuator_validator = Draft3Validator(
+            self._load_schema(schema_file))
 
         # Read in the sensor schema for validating messages
         schema_file = os.path.join(RESOURCE_PATH + '/sensors',
                                    self.JSON_SENSOR_SCHEMA)
-        self._sensor_schema = self._load_schema(schema_file)
+        self._sensor_validator = Draft3Validator(
+            self._load_schema(schema_file))
 
     def _load_schema(self, schema_file):
         """Loads a schema from a file and validates
@@ -107,6 +122,11 @@ class IngressProcessor(ScheduledModuleThread, InternalMsgQ):
         super(IngressProcessor, self).initialize_msgQ(msgQlist)
 
         self._init_config()
+        # Requests are verified, validated and handed off by a worker per
+        # module they go to, so requests to a module stay in order
+        self._dispatcher = KeyedExecutor(self._dispatch_workers,
+                                         self._max_in_flight,
+                                         name="sspl_ingress")
         producer_initialized.wait()
         self.create_MsgConsumer_obj()
 
@@ -129,6 +149,8 @@ class IngressProcessor(ScheduledModuleThread, InternalMsgQ):
             "IngressProcessor, Initialization complete, accepting requests")
 
         try:
+            # Messages received since the last ack
+            unacked = 0
             while True:
                 message = None
                 if isinstance(self._consumer, MessageConsumer):
@@ -138,12 +160,19 @@ class IngressProcessor(ScheduledModuleThread, InternalMsgQ):
                 if message:
                     logger.info(
                         f"IngressProcessor, Message Received: {message}")
-                    self._process_msg(message)
+                    self._dispatch_msg(message)
+                    unacked += 1
+                # Acks cover all messages received, so they are sent once
+                # these were processed, when idle or max_in_flight were taken
+                if unacked and (not message or
+                                unacked >= self._max_in_flight):
+                    self._dispatcher.wait_idle()
+                    unacked = 0
                     if isinstance(self._consumer, MessageConsumer):
                         self._consumer.ack()
                     else:
                         self.create_MsgConsumer_obj()
-                else:
+                elif not message:
                     time.sleep(1)
         except Exception as e:
             if self.is_running() is True:
@@ -157,8 +186,33 @@ class IngressProcessor(ScheduledModuleThread, InternalMsgQ):
 
         self._log_debug("Finished processing successfully")
 
+    def _dispatch_msg(self, body):
+        """Parses the incoming message and queues it for the worker of the
+        module it goes to"""
+        try:
+            if isinstance(body, dict) is False:
+                ingressMsg = json.loads(body)
+            else:
+                ingressMsg = body
+            message = ingressMsg.get("message")
+            msgType = message.get("actuator_request_type") or \
+                message.get("sensor_request_type")
+            handler = self._get_msg_handler(msgType) if msgType else None
+        except Exception:
+            # Reported by _process_msg
+            ingressMsg, handler = body, None
+        self._dispatcher.submit(handler, self._process_msg, ingressMsg)
+
+    def _get_msg_handler(self, msgType):
+        """Return the module handling the request type, None if unknown"""
+        for request_type, handler in self.MSG_HANDLERS.items():
+            if msgType.get(request_type) is not None:
+                return handler
+        return None
+
     def _process_msg(self, body):
-        """Parses the incoming message and hands off to the appropriate module"""
+        """Verifies and validates the incoming message and hands off to the
+        appropriate module"""
 
         ingressMsg = {}
         uuid = None
@@ -173,26 +227,27 @@ class IngressProcessor(ScheduledModuleThread, InternalMsgQ):
             signature = ingressMsg.get("signature")
             message = ingressMsg.get("message")
             uuid = ingressMsg.get("uuid")
-            msg_len = len(message) + 1
 
             if uuid is None:
                 uuid = "N/A"
 
-            if use_security_lib and \
-                    SSPL_SEC.sspl_verify_message(msg_len, str(message),
-                                                 username, signature) != 0:
-                logger.warn(
-                    "IngressProcessor, Authentication failed on message: %s" % ingressMsg)
-                return
+            # The signature covers the serialized message body
+            if use_security_lib:
+                payload = json.dumps(message).encode()
+                if SSPL_SEC.sspl_verify_message(len(payload), payload,
+                                                username, signature) != 0:
+                    logger.warn(
+                        "IngressProcessor, Authentication failed on message: %s" % ingressMsg)
+                    return
 
-            logger.debug("_process_msg, ingressMsg: %s" % ingressMsg)
+            self._log_debug("_process_msg, ingressMsg: %s", ingressMsg)
 
             # Get the incoming message type
             if message.get("actuator_request_type") is not None:
                 msgType = message.get("actuator_request_type")
 
                 # Validate against the actuator schema
-                validate(ingressMsg, self._actuator_schema)
+                self._actuator_validator.validate(ingressMsg)
                 # Compare target_node_id from the request to determine
                 # if request is meant for the current node
                 target_node_id = message.get("target_node_id")
@@ -212,7 +267,7 @@ class IngressProcessor(ScheduledModuleThread, InternalMsgQ):
                 msgType = message.get("sensor_request_type")
 
                 # Validate against the sensor schema
-                validate(ingressMsg, self._sensor_schema)
+                self._sensor_validator.validate(ingressMsg)
                 self._send_to_msg_handler(msgType, message, uuid)
 
             else:
@@ -229,28 +284,10 @@ class IngressProcessor(ScheduledModuleThread, InternalMsgQ):
             self._write_internal_msgQ(EgressProcessor.name(), ack_msg)
 
     def _send_to_msg_handler(self, msgType, message, uuid):
-        # Hand off to appropriate actuator message handler
-        if msgType.get("thread_controller") is not None:
-            self._write_internal_msgQ("ThreadController", message)
-
-        elif msgType.get("service_controller") is not None:
-            self._write_internal_msgQ("ServiceMsgHandler", message)
-
-        elif msgType.get("node_controller") is not None:
-            self._write_internal_msgQ("NodeControllerMsgHandler", message)
-
-        elif msgType.get("storage_enclosure") is not None:
-            self._write_internal_msgQ("RealStorActuatorMsgHandler", message)
-
-        # Hand off to appropriate sensor message handler
-        elif msgType.get("node_data") is not None:
-            self._write_internal_msgQ("NodeDataMsgHandler", message)
-
-        elif msgType.get("enclosure_alert") is not None:
-            self._write_internal_msgQ("RealStorEnclMsgHandler", message)
-
-        elif msgType.get("storage_enclosure") is not None:
-            self._write_internal_msgQ("RealStorActuatorMsgHandler", message)
+        # Hand off to appropriate actuator or sensor message handler
+        handler = self._get_msg_handler(msgType)
+        if handler is not None:
+            self._write_internal_msgQ(handler, message)
         # ... handle other incoming messages that have been validated
         else:
             # Send ack about not finding a msg handler
@@ -277,9 +314,14 @@ class IngressProcessor(ScheduledModuleThread, InternalMsgQ):
         self._offset = Conf.get(SSPL_CONF,
                                 f"{self.PROCESSOR}>{self.OFFSET}",
                                 'earliest')
+        self._dispatch_workers = int(Conf.get(
+            SSPL_CONF, f"{self.PROCESSOR}>{self.DISPATCH_WORKERS}", 4))
+        self._max_in_flight = int(Conf.get(
+            SSPL_CONF, f"{self.PROCESSOR}>{self.MAX_IN_FLIGHT}", 32))
 
     def shutdown(self):
         """Clean up scheduler queue and gracefully shutdown thread"""
         # TODO: cleanup message bus connection if that
         # functionality get added in messaging framework
+        self._dispatcher.shutdown()
         super(IngressProcessor, self).shutdown()
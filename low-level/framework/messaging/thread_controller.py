@@ -110,6 +110,15 @@ def execute_thread(module, msgQlist, conf_reader, product, resume=True):
         recovery_count, recovery_interval = _get_recovery_config(module_name)
         is_sensor_thread = True
 
+    def handle_failure(err, attempt):
+        _handle_module_failure(module, err, attempt, recovery_count,
+            recovery_interval, per_data_path, is_sensor_thread)
+
+    if module.uses_shared_scheduler():
+        _execute_on_shared_scheduler(module, msgQlist, conf_reader, product,
+                                     recovery_count, handle_failure)
+        return
+
     attempt = 0
 
     while attempt <= recovery_count:
@@ -119,50 +128,88 @@ def execute_thread(module, msgQlist, conf_reader, product, resume=True):
             # can transmit internal messages to other modules as desired
             module.start_thread(conf_reader, msgQlist, product)
         except Exception as err:
-            curr_state = "fault"
-            err_msg = f"{module_name}, {err}"
-            logger.error(err_msg)
-            if attempt > recovery_count:
-                logger.debug(traceback.format_exc())
-                description = f"{module_name} is stopped and unrecoverable. {err_msg}"
-                impact = module.impact()
-                recommendation = "Restart SSPL service"
-                logger.critical(
-                    f"{description}. Impact: {impact} Recommendation: {recommendation}")
-                # Check previous state of the module and send fault alert
-                if os.path.isfile(per_data_path):
-                    module_persistent_data[module_name] = store.get(per_data_path)
-                prev_state = module_persistent_data[module_name].get('prev_state')
-                if is_sensor_thread and curr_state != prev_state:
-                    module_persistent_data[module_name] = {"prev_state": curr_state}
-                    store.put(module_persistent_data[module_name], per_data_path)
-                    specific_info = Conf.get(SSPL_CONF, f"{module_name.upper()}")
-                    info = {
-                        "module_name": module_name,
-                        "alert_type": curr_state,
-                        "description": description,
-                        "impact": impact,
-                        "recommendation": recommendation,
-                        "severity": "critical",
-                        "specific_info": specific_info
-                    }
-                    jsonMsg = ThreadMonitorMsg(info).getJson()
-                    module._write_internal_msgQ(EgressProcessor.name(), jsonMsg)
-            else:
-                logger.debug(f"Recovering {module_name} from failure, "
-                             f"attempt: {attempt}")
-                time.sleep(recovery_interval)
-
-            # Shutdown if no recovery attempt
-            logger.info(f"Terminating monitoring thread {module_name}")
-            module.shutdown()
-            retry = 5
-            while module.is_running():
-                module.shutdown()
-                retry -= 1
-                if not retry:
-                    break
-                time.sleep(2)
+            handle_failure(err, attempt)
+
+
+def _execute_on_shared_scheduler(module, msgQlist, conf_reader, product,
+                                 recovery_count, handle_failure, attempt=1):
+    """
+    Start a module whose events run on the SharedScheduler and return.
+
+    Failures raised by its events are reported to the exit callback and
+    recovered the same way as execute_thread does, on a short lived thread
+    so that pool workers never sleep through the recovery interval.
+    """
+    def recover(err):
+        handle_failure(err, attempt)
+        if attempt <= recovery_count:
+            _execute_on_shared_scheduler(module, msgQlist, conf_reader,
+                product, recovery_count, handle_failure, attempt + 1)
+
+    def on_exit(err):
+        if err is not None:
+            Thread(target=recover, args=(err,)).start()
+
+    # Drop events left over by a failed run, e.g. a pending shutdown
+    module._scheduler.clear()
+    module._scheduler.exit_callback = on_exit
+    try:
+        module.start_thread(conf_reader, msgQlist, product)
+    except Exception as err:
+        recover(err)
+
+
+def _handle_module_failure(module, err, attempt, recovery_count,
+                           recovery_interval, per_data_path, is_sensor_thread):
+    """
+    Log a module failure, raise a fault alert once it is unrecoverable,
+    otherwise wait for the recovery interval, then shut the module down.
+    """
+    module_name = module.name()
+    curr_state = "fault"
+    err_msg = f"{module_name}, {err}"
+    logger.error(err_msg)
+    if attempt > recovery_count:
+        logger.debug(traceback.format_exc())
+        description = f"{module_name} is stopped and unrecoverable. {err_msg}"
+        impact = module.impact()
+        recommendation = "Restart SSPL service"
+        logger.critical(
+            f"{description}. Impact: {impact} Recommendation: {recommendation}")
+        # Check previous state of the module and send fault alert
+        if os.path.isfile(per_data_path):
+            module_persistent_data[module_name] = store.get(per_data_path)
+        prev_state = module_persistent_data[module_name].get('prev_state')
+        if is_sensor_thread and curr_state != prev_state:
+            module_persistent_data[module_name] = {"prev_state": curr_state}
+            store.put(module_persistent_data[module_name], per_data_path)
+            specific_info = Conf.get(SSPL_CONF, f"{module_name.upper()}")
+            info = {
+                "module_name": module_name,
+                "alert_type": curr_state,
+                "description": description,
+                "impact": impact,
+                "recommendation": recommendation,
+                "severity": "critical",
+                "specific_info": specific_info
+            }
+            jsonMsg = ThreadMonitorMsg(info).getJson()
+            module._write_internal_msgQ(EgressProcessor.name(), jsonMsg)
+    else:
+        logger.debug(f"Recovering {module_name} from failure, "
+                     f"attempt: {attempt}")
+        time.sleep(recovery_interval)
+
+    # Shutdown if no recovery attempt
+    logger.info(f"Terminating monitoring thread {module_name}")
+    module.shutdown()
+    retry = 5
+    while module.is_running():
+        module.shutdown()
+        retry -= 1
+        if not retry:
+            break
+        time.sleep(2)
 
 
 def _check_module_recovered(module):
@@ -21,6 +21,7 @@
 
 import hashlib
 import json
+import threading
 import time
 
 from framework.base import sspl_constants as sspl_const
@@ -33,6 +34,7 @@ from framework.utils.conf_utils import (GLOBAL_CONF, MGMT_INTERFACE,
                                         CNTRLR_SECONDARY_IP_KEY, CNTRLR_SECONDARY_PORT_KEY,
                                         ENCLOSURE, CNTRLR_USER_KEY, CNTRLR_SECRET_KEY)
 from framework.utils.service_logging import logger
+from framework.utils.single_flight_cache import SingleFlightCache
 from framework.utils.store_factory import store
 from framework.utils.webservices import WebServices
 
@@ -57,12 +59,16 @@ class RealStorEnclosure(StorageEnclosure):
     CONF_REALSTORENCLOSURESENSOR = "REALSTORENCLOSURESENSOR"
     CONF_REALSTORSENSORS = "REALSTORSENSORS"
     DEFAULT_POLL = 30
+    # Seconds a /show response is shared between sensors and providers
+    CACHE_TTL = "cache_ttl"
+    DEFAULT_CACHE_TTL = 10
 
     DEFAULT_USER = "manage"
     DEFAULT_PASSWD = "!manage"
 
     # CLI APIs
     URI_CLIAPI_LOGIN = "/login/"
+    URI_CLIAPI_SHOW = "/show/"
     URI_CLIAPI_SHOWDISKS = "/show/disks"
     URI_CLIAPI_SHOWSYSTEM = "/show/system"
     URI_CLIAPI_SHOWPSUS = "/show/power-supplies"
@@ -80,6 +86,9 @@ class RealStorEnclosure(StorageEnclosure):
     URI_CLIAPI_BASE = "/"
     URI_CLIAPI_DOWNLOADDEBUGDATA = "/downloadDebugData"
     URL_ENCLLOGS_POSTDATA = "/api/collectDebugData"
+    # /show apis never served from ws_cache: events are incremental and
+    # system status is what fault change invalidation relies on
+    URI_CLIAPI_UNCACHED = (URI_CLIAPI_SHOWEVENTS, URI_CLIAPI_SHOWSYSTEM)
 
     # CLI APIs Response status strings
     CLIAPI_RESP_INVSESSION = "Invalid sessionkey"
@@ -102,6 +111,22 @@ class RealStorEnclosure(StorageEnclosure):
         "sideplane": "SIDEPLANE"
     }
 
+    # get_realstor_encl_data() fru to cli api mapping
+    fru_uri_map = {
+        "controllers": URI_CLIAPI_SHOWCONTROLLERS,
+        "power-supplies": URI_CLIAPI_SHOWPSUS,
+        "sensors": URI_CLIAPI_SHOWSENSORSTATUS,
+        "volumes": URI_CLIAPI_SHOWVOLUMES,
+        "disk-groups": URI_CLIAPI_SHOWDISKGROUPS,
+        "enclosures": URI_CLIAPI_SHOWENCLOSURE,
+        "network-parameters": URI_CLIAPI_NETWORKHEALTHSTATUS,
+        "drives": URI_CLIAPI_SHOWDISKS,
+        "expander-ports": URI_CLIAPI_SASHEALTHSTATUS,
+        "fan-modules": URI_CLIAPI_SHOWFANMODULES,
+        "frus": URI_CLIAPI_SHOWFRUS,
+        "versions": URI_CLIAPI_SHOWVERSION
+    }
+
     # Current support for 'cliapi', future scope for 'rest', 'redfish' apis
     # once available
     realstor_supported_interfaces = ['cliapi']
@@ -125,6 +150,8 @@ class RealStorEnclosure(StorageEnclosure):
         # WS Request common headers
         self.ws = WebServices()
         self.common_reqheaders = {}
+        # Serializes re-login of concurrent requests on session expiry
+        self._login_lock = threading.Lock()
 
         self.encl_conf = self.CONF_SECTION_MC
 
@@ -148,6 +175,11 @@ class RealStorEnclosure(StorageEnclosure):
         self.pollfreq = int(Conf.get(SSPL_CONF, f"{self.CONF_REALSTORSENSORS}>{POLLING_FREQUENCY}",
                         self.DEFAULT_POLL))
 
+        # GET responses of /show cli apis, keyed by uri, shared by all sensors
+        self.ws_cache = SingleFlightCache(int(Conf.get(SSPL_CONF,
+                        f"{self.CONF_REALSTORSENSORS}>{self.CACHE_TTL}",
+                        self.DEFAULT_CACHE_TTL)))
+
         # Decrypt MC secret
         decryption_key = encryptor.gen_key(ENCLOSURE,
                     sspl_const.ServiceTypes.STORAGE_ENCLOSURE.value)
@@ -202,8 +234,53 @@ class RealStorEnclosure(StorageEnclosure):
             ".format(self.active_ip, self.active_wsport))
 
     def ws_request(self, url, method, retry_count=MAX_RETRIES,
+            post_data="", use_cache=True):
+        """Make webservice requests using common utils
+
+        GET requests of /show cli apis are served from ws_cache, concurrent
+        requests for the same uri share a single request to the controller.
+        """
+        uri = url[url.find('/api/') + len('/api'):] if '/api/' in url else None
+        if not use_cache or method != self.ws.HTTP_GET or uri is None or \
+                not uri.startswith(self.URI_CLIAPI_SHOW) or \
+                uri.startswith(self.URI_CLIAPI_UNCACHED):
+            return self._ws_request(url, method, retry_count, post_data)
+
+        response = self.ws_cache.get(uri,
+            lambda: self._ws_request(url, method, retry_count, post_data),
+            cacheable=self._is_cacheable_response)
+        if response is not None:
+            self.ws_response_status = response.status_code
+        return response
+
+    def _is_cacheable_response(self, response):
+        """Only successful cli api responses are shared."""
+        if response is None or response.status_code != self.ws.HTTP_OK:
+            return False
+        try:
+            jresponse = json.loads(response.content)
+            return jresponse['status'][0]['return-code'] != \
+                self.CLIAPI_RESP_FAILURE
+        except (ValueError, KeyError, IndexError, TypeError):
+            return False
+
+    def ws_request_many(self, urls, method=None):
+        """Make webservice requests for several urls concurrently.
+
+        Each request goes through ws_request(), so cached responses are
+        reused, and the total wait is that of the slowest request.
+        """
+        method = method or self.ws.HTTP_GET
+        return self.ws.map_concurrent(
+            lambda url: self.ws_request(url, method), urls)
+
+    def invalidate_cache(self, uri=None):
+        """Drop cached cli api responses, all of them if uri is None."""
+        self.ws_cache.invalidate(uri)
+
+    def _ws_request(self, url, method, retry_count=MAX_RETRIES,
             post_data=""):
-        """Make webservice requests using common utils"""
+        """Make webservice request to the active management controller"""
         response = None
         retried_login = False
         need_relogin = False
@@ -214,6 +291,7 @@ class RealStorEnclosure(StorageEnclosure):
                 # Extract show fru name from old URL to update alternative IP.
                 url = self.build_url(url[url.index('/api/'):].replace('/api',''))
 
+            session_key = self.common_reqheaders.get('sessionKey')
             response = self.ws.ws_request(method, url,
                        self.common_reqheaders, post_data,
                        self.WEBSERVICE_TIMEOUT)
@@ -252,7 +330,11 @@ class RealStorEnclosure(StorageEnclosure):
                 need_relogin) and retried_login is False:
                 logger.info("%s failed, retrying after login " % (url))
 
-                self.login()
+                with self._login_lock:
+                    # Skip login if a concurrent request already renewed
+                    # the session key
+                    if session_key == self.common_reqheaders.get('sessionKey'):
+                        self.login()
                 retried_login = True
                 need_relogin = False
                 continue
@@ -420,10 +502,15 @@ class RealStorEnclosure(StorageEnclosure):
                 # list and find item in that.
                 if not self.FAULT_KEY in system.keys():
                     logger.debug("{0} Healthy, no faults seen".format(self.LDR_R1_ENCL))
+                    if self.latest_faults:
+                        # Faults cleared, FRU health cached so far is stale
+                        self.invalidate_cache()
                     self.latest_faults = {}
                     return
 
                 # Extract system faults
+                if self.latest_faults != system[self.FAULT_KEY]:
+                    self.invalidate_cache()
                 self.latest_faults = system[self.FAULT_KEY]
 
                 #If no in-memory fault cache built yet!
@@ -462,21 +549,7 @@ class RealStorEnclosure(StorageEnclosure):
     def get_realstor_encl_data(self, fru: str):
         """Fetch fru information through webservice API."""
         fru_data = []
-        fru_uri_map = {
-            "controllers": self.URI_CLIAPI_SHOWCONTROLLERS,
-            "power-supplies": self.URI_CLIAPI_SHOWPSUS,
-            "sensors": self.URI_CLIAPI_SHOWSENSORSTATUS,
-            "volumes": self.URI_CLIAPI_SHOWVOLUMES,
-            "disk-groups": self.URI_CLIAPI_SHOWDISKGROUPS,
-            "enclosures": self.URI_CLIAPI_SHOWENCLOSURE,
-            "network-parameters": self.URI_CLIAPI_NETWORKHEALTHSTATUS,
-            "drives": self.URI_CLIAPI_SHOWDISKS,
-            "expander-ports": self.URI_CLIAPI_SASHEALTHSTATUS,
-            "fan-modules": self.URI_CLIAPI_SHOWFANMODULES,
-            "frus": self.URI_CLIAPI_SHOWFRUS,
-            "versions": self.URI_CLIAPI_SHOWVERSION
-        }
-        url = self.build_url(fru_uri_map.get(fru))
+        url = self.build_url(self.fru_uri_map.get(fru))
         response = self.ws_request(url, self.ws.HTTP_GET)
         if fru == "frus":
             fru = "enclosure-fru"
@@ -489,6 +562,24 @@ class RealStorEnclosure(StorageEnclosure):
 
         return fru_data
 
+    def get_realstor_encl_data_many(self, frus):
+        """Fetch information of several frus with concurrent requests.
+
+        Returns dict of fru and its data, the responses also populate
+        ws_cache for following get_realstor_encl_data() calls.
+        """
+        frus = [fru for fru in frus if fru in self.fru_uri_map]
+        responses = self.ws_request_many(
+            [self.build_url(self.fru_uri_map[fru]) for fru in frus])
+        fru_data = {}
+        for fru, response in zip(frus, responses):
+            key = "enclosure-fru" if fru == "frus" else fru
+            if not response or response.status_code != self.ws.HTTP_OK:
+                fru_data[fru] = []
+                continue
+            fru_data[fru] = json.loads(response.text).get(key)
+        return fru_data
+
     def load_storage_fru_list(self):
         """Get Storage FRU list and merge it with storage_fru_list,
         maintained in global config, with which FRU list can be extended
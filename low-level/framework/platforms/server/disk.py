@@ -14,11 +14,12 @@
 # cortx-questions@seagate.com.
 
 
-import json
 import re
 
 from cortx.utils.process import SimpleProcess
-from dbus import Array, Interface, SystemBus
+
+from framework.platforms.server.udisks2 import BY_PATH_PREFIX, get_udisks2_tree
+from framework.utils.drive_utils import DriveUtils
 
 
 class Disk:
@@ -30,10 +31,10 @@ class Disk:
         self.device = str(device)
 
     def get_health(self):
-        if self._is_local_drive():
-            smartctl = "sudo smartctl"
-        else:
-            smartctl = "sudo smartctl -d scsi"
+        device_type = None if self._is_local_drive() else "scsi"
+        smartctl = "sudo smartctl"
+        if device_type:
+            smartctl = f"{smartctl} -d {device_type}"
         # Get smart availability attributes
         cmd = f"{smartctl} -i {self.device}"
         response, _, _ = SimpleProcess(cmd).run()
@@ -47,10 +48,11 @@ class Disk:
             health_data["SMART_support"] = "Enabled"
         else:
             health_data["SMART_support"] = "NA"
-        # Get smart health attributes
-        cmd = f"{smartctl} --all {self.device} --json"
-        response, _, _ = SimpleProcess(cmd).run()
-        response = json.loads(response)
+        serial = re.search(r"Serial Number:\s*(\S+)", response)
+        # Get smart health attributes, recent data of the drive is reused
+        response = DriveUtils.read_smart_data(
+            self.device, device_type, serial=serial and serial.group(1),
+            sudo=True)
         try:
             smart_test_status = "PASSED" if response['smart_status']['passed'] else "FAILED"
         except KeyError:
@@ -97,58 +99,23 @@ class Disk:
 
     @classmethod
     def get_disks(cls):
-        bus = SystemBus()
-        # Obtain a disk manager interface for monitoring drives
-        disk_manager = Interface(bus.get_object('org.freedesktop.UDisks2',
-                                                '/org/freedesktop/UDisks2'),
-                                 dbus_interface='org.freedesktop.DBus.ObjectManager')
-
-        # Dict of drives by-path symlink from systemd
-        drive_by_path = {}
-
-        # Dict of drives by device name from systemd
-        drive_by_device_name = {}
-
-        disk_objects = disk_manager.GetManagedObjects()
-
-        # Get a list of all the block devices available in systemd
-        re_blocks = re.compile('(?P<path>.*?/block_devices/(?P<id>.*))')
-        block_devs = [m.groupdict() for m in
-                      [re_blocks.match(path) for path in list(disk_objects.keys())]
-                      if m]
-
-        # Retrieve the by-id symlink for each drive and save in a dict with the drive path as key
-        for block_dev in block_devs:
-            try:
-                if disk_objects[block_dev['path']].get('org.freedesktop.UDisks2.Block') is not None:
-                    # Obtain the list of symlinks for the block device
-                    udisk_block = disk_objects[block_dev['path']]["org.freedesktop.UDisks2.Block"]
-                    symlinks = cls._sanitize_dbus_value(udisk_block["Symlinks"])
-
-                    # Parse out the wwn symlink if it exists otherwise use the by-id
-                    for symlink in symlinks:
-                        # TODO:  Improve logic for getting resource_id
-                        # Current approch for getting resource_id is to check "phy" in by-path
-                        # symlink. If "phy" is in by-path use path of that drive for resource_id
-                        if "by-path" in symlink:
-                            drive_by_path[udisk_block["Drive"]] = symlink[len("/dev/disk/by-path/"):]
-
-                    # Maintain a dict of device names
-                    device = cls._sanitize_dbus_value(udisk_block["Device"])
-                    drive_by_device_name[udisk_block["Drive"]] = device
-
-            except Exception as ae:
-                # block_dev unusable
-                print("block_dev unusable: %r" % ae)
-
+        """Return the physical drives, read from the shared UDisks2 tree."""
+        tree = get_udisks2_tree()
+        drive_blocks = tree.get_drive_blocks()
         disks = []
-
-        for obj_path, interfaces_and_property in disk_manager.GetManagedObjects().items():
-            if "drive" in obj_path and cls.is_physical_drive(interfaces_and_property["org.freedesktop.UDisks2.Drive"]):
-                disk = cls(interfaces_and_property["org.freedesktop.UDisks2.Drive"]["Id"],
-                           drive_by_path.get(obj_path, interfaces_and_property["org.freedesktop.UDisks2.Drive"]["Id"]),
-                           drive_by_device_name[obj_path])
-                disks.append(disk)
+        for drive_path, drive in tree.get_drives().items():
+            if drive_path not in drive_blocks or \
+                    not cls.is_physical_drive(drive):
+                continue
+            device, symlinks = drive_blocks[drive_path]
+            # TODO:  Improve logic for getting resource_id
+            # Current approch for getting resource_id is to check "phy" in by-path
+            # symlink. If "phy" is in by-path use path of that drive for resource_id
+            by_paths = [symlink[len(BY_PATH_PREFIX):] for symlink in symlinks
+                        if "by-path" in symlink]
+            disks.append(cls(drive["Id"],
+                             by_paths[-1] if by_paths else drive["Id"],
+                             device))
         return disks
 
     @staticmethod
@@ -174,31 +141,3 @@ class Disk:
         [6:0:1:1]    disk    0x600c0ff00050f0bb13c7505f02000000  /dev/sdr
         """
         return interfaces_and_property["WWN"].startswith("0x5")
-
-    @classmethod
-    def _sanitize_dbus_value(cls, value):
-        """Convert certain DBus type combinations so that they are easier to read."""
-        if isinstance(value, Array) and value.signature == "ay":
-            try:
-                return cls._decode_ay(value)
-            except Exception:
-                # Try an array of arrays; 'aay' which is the symlinks
-                return list(map(cls._decode_ay, value or ()))
-        elif isinstance(value, Array) and value.signature == "y":
-            return bytearray(value).rstrip(bytearray((0,))).decode('utf-8')
-        else:
-            return value
-
-    @staticmethod
-    def _decode_ay(value):
-        """Convert binary blob from DBus queries to strings."""
-        if len(value) == 0 or \
-           value is None:
-            return ''
-        elif isinstance(value, str):
-            return value
-        elif isinstance(value, bytes):
-            return value.decode('utf-8')
-        else:
-            # dbus.Array([dbus.Byte]) or any similar sequence type:
-            return bytearray(value).rstrip(bytearray((0,))).decode('utf-8')
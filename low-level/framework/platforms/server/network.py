@@ -14,10 +14,29 @@
 # please email opensource@seagate.com or cortx-questions@seagate.com
 
 import os
+import socket
+import struct
+import threading
 
 from framework.utils.conf_utils import (
     Conf, SSPL_CONF, SYSFS_PATH, SYSTEM_INFORMATION)
 from framework.platforms.server.error import NetworkError
+from framework.utils.service_logging import logger
+
+# rtnetlink constants, see linux/netlink.h, linux/rtnetlink.h and
+# linux/if_addr.h
+NETLINK_ROUTE = 0
+NLMSG_ERROR = 2
+NLMSG_DONE = 3
+RTM_NEWADDR = 20
+RTM_GETADDR = 22
+NLM_F_REQUEST = 0x1
+NLM_F_DUMP = 0x300
+IFA_ADDRESS = 1
+IFA_LOCAL = 2
+NLMSG_HDR = struct.Struct("=LHHLL")
+IFADDRMSG = struct.Struct("=BBBBL")
+RTATTR = struct.Struct("=HH")
 
 
 class Network:
@@ -47,7 +66,7 @@ class Network:
                 carrier_indicator = cFile.read().strip()
 
             if carrier_indicator not in link_status:
-                carrier_file_path = "UNKNOWN"
+                return "UNKNOWN"
         except OSError as err:
             raise NetworkError(err.errno, (
                 "Failed to read link state for interface '%s' "
@@ -79,3 +98,135 @@ class Network:
                 "interface '%s' due to an Error: '%s, %s'"),
                 interface, err.strerror, err.filename)
         return operstate
+
+    def get_ipv4_addresses(self):
+        """Return {interface: [ipv4 address, ...]} read over rtnetlink.
+
+            Primary addresses come first, as listed by 'ip addr'.
+        """
+        request = NLMSG_HDR.pack(NLMSG_HDR.size + IFADDRMSG.size,
+                                 RTM_GETADDR, NLM_F_REQUEST | NLM_F_DUMP,
+                                 1, 0) + \
+            IFADDRMSG.pack(socket.AF_INET, 0, 0, 0, 0)
+        addresses = {}
+        with socket.socket(socket.AF_NETLINK, socket.SOCK_RAW,
+                           NETLINK_ROUTE) as nl_sock:
+            nl_sock.sendall(request)
+            done = False
+            while not done:
+                done = self.parse_addr_messages(nl_sock.recv(65536),
+                                                addresses)
+        by_name = {}
+        for index, ips in addresses.items():
+            try:
+                by_name[socket.if_indextoname(index)] = ips
+            except OSError:
+                # Interface removed while dumping
+                continue
+        return by_name
+
+    @staticmethod
+    def parse_addr_messages(data, addresses):
+        """Add IPv4 addresses of RTM_NEWADDR messages in data to addresses.
+
+            addresses is keyed by interface index. Returns True once the
+            end of the dump has been reached.
+        """
+        offset = 0
+        while offset + NLMSG_HDR.size <= len(data):
+            msg_len, msg_type, _, _, _ = NLMSG_HDR.unpack_from(data, offset)
+            if msg_len < NLMSG_HDR.size:
+                break
+            if msg_type == NLMSG_DONE:
+                return True
+            if msg_type == NLMSG_ERROR:
+                error = -struct.unpack_from("=i", data,
+                                            offset + NLMSG_HDR.size)[0]
+                raise NetworkError(error, "rtnetlink address dump failed: %s",
+                                   os.strerror(error))
+            if msg_type == RTM_NEWADDR:
+                family, _, _, _, index = IFADDRMSG.unpack_from(
+                    data, offset + NLMSG_HDR.size)
+                attrs = {}
+                attr_offset = offset + NLMSG_HDR.size + IFADDRMSG.size
+                while attr_offset + RTATTR.size <= offset + msg_len:
+                    attr_len, attr_type = RTATTR.unpack_from(data,
+                                                             attr_offset)
+                    if attr_len < RTATTR.size:
+                        break
+                    attrs[attr_type] = data[attr_offset + RTATTR.size:
+                                            attr_offset + attr_len]
+                    attr_offset += (attr_len + 3) & ~3
+                # IFA_LOCAL is the address of the interface, IFA_ADDRESS
+                # the peer one on point to point links
+                address = attrs.get(IFA_LOCAL, attrs.get(IFA_ADDRESS))
+                if family == socket.AF_INET and address:
+                    addresses.setdefault(index, []).append(
+                        socket.inet_ntop(socket.AF_INET, address))
+            offset += (msg_len + 3) & ~3
+        return False
+
+
+class InterfaceStateProvider:
+    """Operational state, first IPv4 address and carrier of every interface.
+
+    refresh() reads sysfs and one rtnetlink address dump, once per
+    collection cycle, and returns the interfaces whose state changed since
+    the previous refresh. get() then serves the per interface lookups of
+    that cycle from memory.
+    """
+
+    UNKNOWN = "UNKNOWN"
+
+    def __init__(self, network=None):
+        self._network = network or Network()
+        self._lock = threading.Lock()
+        # Interface: (operstate, ipv4, carrier)
+        self._state = {}
+
+    def refresh(self):
+        """Read the current state of all interfaces, return changed ones."""
+        try:
+            interfaces = os.listdir(self._network.base_dir)
+        except OSError as err:
+            logger.error(f"InterfaceStateProvider, failed to list "
+                         f"{self._network.base_dir}: {err}")
+            interfaces = []
+        try:
+            addresses = self._network.get_ipv4_addresses()
+        except Exception as err:
+            logger.error(f"InterfaceStateProvider, failed to read interface "
+                         f"addresses: {err}")
+            # Keep the last known addresses
+            addresses = {name: [state[1]] for name, state
+                         in self._state.items() if state[1]}
+
+        state = {}
+        for interface in interfaces:
+            state[interface] = (
+                self._read(self._network.get_operational_state, interface),
+                addresses.get(interface, [""])[0],
+                self._read(self._network.get_link_state, interface))
+        with self._lock:
+            previous, self._state = self._state, state
+        changed = {interface for interface in state.keys() | previous.keys()
+                   if state.get(interface) != previous.get(interface)}
+        for interface in changed:
+            logger.debug(f"InterfaceStateProvider, {interface} changed from "
+                         f"{previous.get(interface)} to {state.get(interface)}")
+        return changed
+
+    def get(self, interface):
+        """Return (operstate, ipv4, carrier) of interface from last refresh."""
+        with self._lock:
+            return self._state.get(interface,
+                                   (self.UNKNOWN, "", self.UNKNOWN))
+
+    @classmethod
+    def _read(cls, reader, interface):
+        try:
+            return reader(interface)
+        except NetworkError as err:
+            # sysfs entry is not readable, e.g. interface down or removed
+            logger.debug(err)
+            return cls.UNKNOWN
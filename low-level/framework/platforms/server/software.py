@@ -17,6 +17,7 @@
 
 import os
 import shlex
+import threading
 
 from cortx.utils.process import SimpleProcess
 from cortx.utils.conf_store.error import ConfError
@@ -61,6 +62,13 @@ class Service:
     SERVICE_HANDLER = 'SERVICEMONITOR'
     SERVICE_LIST = 'monitored_services'
 
+    # rpm queries are answered from memory until one of these changes
+    RPM_DB_FILES = ["/var/lib/rpm/Packages", "/var/lib/rpm/rpmdb.sqlite"]
+    _rpm_db_version = None
+    # {(service, prop): value}
+    _rpm_info = {}
+    _rpm_info_lock = threading.Lock()
+
     def __init__(self):
         """Initialize the class."""
         self._bus, self._manager = DbusServiceHandler._get_systemd_interface()
@@ -98,13 +106,42 @@ class Service:
         ]
         return cortx_services
 
+    @staticmethod
+    def _get_rpm_db_version():
+        version = []
+        for path in Service.RPM_DB_FILES:
+            try:
+                version.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                version.append(None)
+        return tuple(version)
+
     @staticmethod
     def get_service_info_from_rpm(service, prop):
         """
         Get specified service property from its corrosponding RPM.
 
         eg. (kafka.service,'LICENSE') -> 'Apache License, Version 2.0'
+
+        Results are kept until the rpm database changes, so rpm runs once
+        per service and property instead of on every call.
         """
+        key = (service, prop)
+        db_version = Service._get_rpm_db_version()
+        with Service._rpm_info_lock:
+            if db_version != Service._rpm_db_version:
+                Service._rpm_info.clear()
+                Service._rpm_db_version = db_version
+            elif key in Service._rpm_info:
+                return Service._rpm_info[key]
+        result = Service._query_service_rpm(service, prop)
+        with Service._rpm_info_lock:
+            if db_version == Service._rpm_db_version:
+                Service._rpm_info[key] = result
+        return result
+
+    @staticmethod
+    def _query_service_rpm(service, prop):
         # TODO Include service execution path in systemd_path_list
         systemd_path_list = ["/usr/lib/systemd/system/",
                              "/etc/systemd/system/"]
@@ -0,0 +1,328 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+"""
+ ****************************************************************************
+  Description:       Process wide copy of the UDisks2 object tree.
+
+                    The tree is loaded with a single GetManagedObjects()
+                    call and indexed by drive object path, by-path symlink
+                    and device name. Once DiskMonitor watches it, the
+                    InterfacesAdded, InterfacesRemoved and PropertiesChanged
+                    signals keep it up to date and readers never go to
+                    D-Bus. Processes without a watcher load it again when
+                    the "disk" snapshot version changes or MAX_AGE expires.
+ ****************************************************************************
+"""
+
+import threading
+import time
+
+from dbus import Array, Interface, SystemBus
+
+from framework.utils import snapshot_cache
+from framework.utils.service_logging import logger
+
+UDISKS2_SERVICE = "org.freedesktop.UDisks2"
+UDISKS2_PATH = "/org/freedesktop/UDisks2"
+OBJECT_MANAGER_INTERFACE = "org.freedesktop.DBus.ObjectManager"
+PROPERTIES_INTERFACE = "org.freedesktop.DBus.Properties"
+BLOCK_INTERFACE = "org.freedesktop.UDisks2.Block"
+DRIVE_INTERFACE = "org.freedesktop.UDisks2.Drive"
+PARTITION_INTERFACE = "org.freedesktop.UDisks2.Partition"
+BY_PATH_PREFIX = "/dev/disk/by-path/"
+
+
+def decode_ay(value):
+    """Convert binary blob from DBus queries to strings."""
+    if value is None or len(value) == 0:
+        return ''
+    elif isinstance(value, str):
+        return value
+    elif isinstance(value, bytes):
+        return value.decode('utf-8')
+    else:
+        # dbus.Array([dbus.Byte]) or any similar sequence type:
+        return bytearray(value).rstrip(bytearray((0,))).decode('utf-8')
+
+
+def sanitize_dbus_value(value):
+    """Convert certain DBus type combinations so that they are easier to read."""
+    if isinstance(value, Array) and value.signature == "ay":
+        try:
+            return decode_ay(value)
+        except Exception:
+            # Try an array of arrays; 'aay' which is the symlinks
+            return list(map(decode_ay, value or ()))
+    elif isinstance(value, Array) and value.signature == "y":
+        return bytearray(value).rstrip(bytearray((0,))).decode('utf-8')
+    else:
+        return value
+
+
+class UDisks2ObjectTree(object):
+    """Managed objects of UDisks2 with indexes of drives and their blocks."""
+
+    # Seconds a tree nobody watches is served before it is loaded again
+    MAX_AGE = 60
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._bus = None
+        self._manager = None
+        self._watching = False
+        self._loaded = False
+        self._load_time = 0
+        self._version = None
+        self._listeners = []
+        # Object path: {interface: properties}, an interface's properties
+        # are replaced and never modified, so shallow copies are safe
+        self._objects = {}
+        # Block path: drive path
+        self._block_drive = {}
+        # Drive path: set of block paths
+        self._drive_blocks = {}
+        # Drive path: (device name, [symlinks]) of its whole disk block
+        self._drive_info = {}
+        # by-path symlink without its prefix: drive path
+        self._by_path = {}
+        # Device name: drive path
+        self._by_device = {}
+
+    def _get_manager(self):
+        if self._manager is None:
+            if self._bus is None:
+                self._bus = SystemBus()
+            self._manager = Interface(
+                self._bus.get_object(UDISKS2_SERVICE, UDISKS2_PATH),
+                dbus_interface=OBJECT_MANAGER_INTERFACE)
+        return self._manager
+
+    def watch(self, bus, manager=None):
+        """Follow UDisks2 signals on bus, which must have a main loop.
+
+        The tree is loaded again once subscribed, so no change is missed.
+        """
+        with self._lock:
+            if not self._watching or bus is not self._bus:
+                self._bus = bus
+                self._manager = manager
+                manager = self._get_manager()
+                manager.connect_to_signal("InterfacesAdded",
+                                          self._interfaces_added)
+                manager.connect_to_signal("InterfacesRemoved",
+                                          self._interfaces_removed)
+                bus.add_signal_receiver(self._properties_changed,
+                                        signal_name="PropertiesChanged",
+                                        dbus_interface=PROPERTIES_INTERFACE,
+                                        bus_name=UDISKS2_SERVICE,
+                                        path_keyword="path")
+                self._watching = True
+            self.load()
+
+    def add_listener(self, on_added=None, on_removed=None):
+        """Call on_added(path, interfaces_and_properties) and
+        on_removed(path, interfaces) after the tree applied a signal."""
+        with self._lock:
+            if (on_added, on_removed) not in self._listeners:
+                self._listeners.append((on_added, on_removed))
+
+    def load(self, objects=None):
+        """Replace the tree with GetManagedObjects(), or objects if given."""
+        if objects is None:
+            objects = self._get_manager().GetManagedObjects()
+        with self._lock:
+            self._version = snapshot_cache.get_version("disk")
+            self._objects = {path: {interface: dict(properties)
+                                    for interface, properties
+                                    in interfaces.items()}
+                             for path, interfaces in objects.items()}
+            self._block_drive = {}
+            self._drive_blocks = {}
+            for path, interfaces in self._objects.items():
+                self._link_block(path, interfaces)
+            self._drive_info = {}
+            self._by_path = {}
+            self._by_device = {}
+            for drive_path in self._drive_blocks:
+                self._index_drive(drive_path)
+            self._loaded = True
+            self._load_time = time.monotonic()
+        logger.debug(f"UDisks2ObjectTree, loaded {len(objects)} objects")
+
+    def _refresh(self):
+        if self._watching:
+            return
+        if self._loaded and \
+                time.monotonic() - self._load_time < self.MAX_AGE and \
+                snapshot_cache.get_version("disk") == self._version:
+            return
+        self.load()
+
+    def _link_block(self, path, interfaces):
+        """Note which drive a block belongs to, return the drive path."""
+        block = interfaces.get(BLOCK_INTERFACE)
+        drive_path = str(block.get("Drive", "/")) if block else "/"
+        if drive_path == "/":
+            return None
+        self._block_drive[path] = drive_path
+        self._drive_blocks.setdefault(drive_path, set()).add(path)
+        return drive_path
+
+    def _unlink_block(self, path):
+        drive_path = self._block_drive.pop(path, None)
+        if drive_path is not None:
+            blocks = self._drive_blocks.get(drive_path)
+            blocks.discard(path)
+            if not blocks:
+                del self._drive_blocks[drive_path]
+        return drive_path
+
+    def _index_drive(self, drive_path):
+        """Index the by-path symlinks and device of a drive's whole disk."""
+        old_info = self._drive_info.pop(drive_path, None)
+        if old_info is not None:
+            device, symlinks = old_info
+            if self._by_device.get(device) == drive_path:
+                del self._by_device[device]
+            for symlink in symlinks:
+                by_path = symlink[len(BY_PATH_PREFIX):]
+                if self._by_path.get(by_path) == drive_path:
+                    del self._by_path[by_path]
+
+        blocks = sorted(self._drive_blocks.get(drive_path, ()))
+        if not blocks:
+            return
+        # Partitions share the drive of their disk, they are used only if
+        # the disk itself is not exported
+        whole_disks = [path for path in blocks
+                       if PARTITION_INTERFACE not in self._objects[path]]
+        block = self._objects[(whole_disks or blocks)[0]][BLOCK_INTERFACE]
+        device = sanitize_dbus_value(block.get("Device", ""))
+        symlinks = [str(symlink) for symlink in
+                    sanitize_dbus_value(block.get("Symlinks", []))]
+        self._drive_info[drive_path] = (device, symlinks)
+        self._by_device[device] = drive_path
+        for symlink in symlinks:
+            if symlink.startswith(BY_PATH_PREFIX):
+                self._by_path[symlink[len(BY_PATH_PREFIX):]] = drive_path
+
+    def _update_object(self, path, interfaces):
+        """Replace the interfaces of path, None removes the object."""
+        old_drive = self._unlink_block(path)
+        objects = dict(self._objects)
+        if interfaces:
+            objects[path] = interfaces
+        else:
+            objects.pop(path, None)
+        self._objects = objects
+        new_drive = self._link_block(path, interfaces) if interfaces else None
+        for drive_path in {old_drive, new_drive} - {None}:
+            self._index_drive(drive_path)
+
+    def _interfaces_added(self, object_path, interfaces_and_properties):
+        object_path = str(object_path)
+        with self._lock:
+            interfaces = dict(self._objects.get(object_path, {}))
+            for interface, properties in interfaces_and_properties.items():
+                interfaces[str(interface)] = dict(properties)
+            self._update_object(object_path, interfaces)
+            listeners = list(self._listeners)
+        for on_added, _ in listeners:
+            if on_added is not None:
+                on_added(object_path, interfaces_and_properties)
+
+    def _interfaces_removed(self, object_path, removed):
+        object_path = str(object_path)
+        with self._lock:
+            interfaces = dict(self._objects.get(object_path, {}))
+            for interface in removed:
+                interfaces.pop(str(interface), None)
+            self._update_object(object_path, interfaces)
+            listeners = list(self._listeners)
+        for _, on_removed in listeners:
+            if on_removed is not None:
+                on_removed(object_path, removed)
+
+    def _properties_changed(self, interface, changed, invalidated, path=None):
+        path = str(path)
+        interface = str(interface)
+        with self._lock:
+            if interface not in self._objects.get(path, {}):
+                return
+            interfaces = dict(self._objects[path])
+            properties = dict(interfaces[interface])
+            properties.update(changed)
+            for name in invalidated:
+                properties.pop(name, None)
+            interfaces[interface] = properties
+            if interface == BLOCK_INTERFACE:
+                self._update_object(path, interfaces)
+            else:
+                self._objects = dict(self._objects)
+                self._objects[path] = interfaces
+
+    def get_objects(self):
+        """Return {object path: {interface: properties}}, as
+        GetManagedObjects() does. The dicts must not be modified."""
+        with self._lock:
+            self._refresh()
+            return dict(self._objects)
+
+    def get_drives(self):
+        """Return {drive path: properties of its Drive interface}."""
+        with self._lock:
+            self._refresh()
+            return {path: interfaces[DRIVE_INTERFACE]
+                    for path, interfaces in self._objects.items()
+                    if DRIVE_INTERFACE in interfaces}
+
+    def get_drive_blocks(self):
+        """Return {drive path: (device name, [symlinks])} of drives having
+        a block device."""
+        with self._lock:
+            self._refresh()
+            return dict(self._drive_info)
+
+    def get_device(self, drive_path):
+        """Return the device name of a drive, None if it has no block."""
+        with self._lock:
+            self._refresh()
+            return self._drive_info.get(drive_path, (None, None))[0]
+
+    def find_drive(self, by_path=None, device=None):
+        """Return the drive path of a by-path symlink, with or without
+        its /dev/disk/by-path/ prefix, or of a device name."""
+        with self._lock:
+            self._refresh()
+            if by_path is not None:
+                if by_path.startswith(BY_PATH_PREFIX):
+                    by_path = by_path[len(BY_PATH_PREFIX):]
+                return self._by_path.get(by_path)
+            return self._by_device.get(device)
+
+
+_tree = None
+_tree_lock = threading.Lock()
+
+
+def get_udisks2_tree():
+    """Return the UDisks2 object tree shared by the whole process."""
+    global _tree
+    if _tree is None:
+        with _tree_lock:
+            if _tree is None:
+                _tree = UDisks2ObjectTree()
+    return _tree
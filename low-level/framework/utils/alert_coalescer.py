@@ -0,0 +1,227 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+"""
+ ****************************************************************************
+  Description:       Coalesces bursts of alerts about the same resource.
+
+                    The first state alert of a (resource_type, resource_id)
+                    is published at once and opens a window. Alerts arriving
+                    within the window are held, each replacing the one held
+                    before, and the last is published when the window ends
+                    unless it repeats the state published already. A
+                    resource publishing more than rate_limit alerts within
+                    rate_period is muted for the rest of the period, then
+                    its last alert is published as a summary of the muted
+                    ones.
+
+                    Events of the alerts are set once an alert covering
+                    them was handed over for publishing, so windows should
+                    be shorter than the time sensors wait on them. Muted
+                    alerts are acknowledged at once, or their sensors would
+                    raise them again until the period ends.
+ ****************************************************************************
+"""
+
+import time
+
+from framework.utils.service_logging import logger
+
+# Alert types reporting a state of the resource, other messages pass through
+COALESCED_ALERT_TYPES = frozenset(
+    ["fault", "fault_resolved", "missing", "insertion"])
+
+
+class _Resource(object):
+    """Coalescing state of a resource."""
+
+    __slots__ = ("window_end", "state", "held", "held_events",
+                 "period_end", "published", "muted", "muted_msg")
+
+    def __init__(self):
+        self.window_end = None
+        # (alert_type, severity) published last
+        self.state = None
+        self.held = None
+        self.held_events = []
+        self.period_end = None
+        self.published = 0
+        self.muted = 0
+        self.muted_msg = None
+
+
+class AlertCoalescer(object):
+    """Holds back superseded and excess alerts per resource."""
+
+    def __init__(self, window, rate_limit, rate_period, clock=time.monotonic):
+        """window and rate_period are in seconds. A window of 0 or a
+        rate_limit of 0 disables the respective stage."""
+        self._window = window
+        self._rate_limit = rate_limit
+        self._rate_period = rate_period
+        self._clock = clock
+        # (resource_type, resource_id): _Resource
+        self._resources = {}
+        self._counters = dict.fromkeys(
+            ("received", "published", "superseded", "unchanged", "muted",
+             "summaries"), 0)
+
+    @staticmethod
+    def get_key(json_msg):
+        """Return (resource_type, resource_id) of a state alert, else None."""
+        try:
+            response = json_msg["message"]["sensor_response_type"]
+            if response.get("alert_type") not in COALESCED_ALERT_TYPES:
+                return None
+            info = response["info"]
+            return info["resource_type"], info["resource_id"]
+        except (KeyError, TypeError, AttributeError):
+            return None
+
+    @staticmethod
+    def _get_state(json_msg):
+        response = json_msg["message"]["sensor_response_type"]
+        return response.get("alert_type"), response.get("severity")
+
+    def add(self, json_msg, event=None):
+        """Take an alert, return the [(json_msg, event)] to publish now."""
+        key = self.get_key(json_msg)
+        if key is None or not (self._window or self._rate_limit):
+            return [(json_msg, event)]
+        self._counters["received"] += 1
+        now = self._clock()
+        resource = self._resources.get(key)
+        if resource is None:
+            resource = self._resources[key] = _Resource()
+        ready = []
+        self._expire(key, resource, now, ready)
+
+        if resource.window_end is not None:
+            if resource.held is not None:
+                self._counters["superseded"] += 1
+            resource.held = json_msg
+            resource.held_events.append(event)
+        else:
+            self._publish(resource, json_msg, [event], now, ready)
+        return ready
+
+    def flush(self, force=False):
+        """Return the [(json_msg, event)] whose windows or periods ended,
+        all of the held ones if force is set."""
+        now = float("inf") if force else self._clock()
+        ready = []
+        for key, resource in list(self._resources.items()):
+            self._expire(key, resource, now, ready)
+            if resource.window_end is None and resource.period_end is None:
+                del self._resources[key]
+        return ready
+
+    def get_next_deadline(self):
+        """Return the clock time flush() is due next, None if nothing is
+        held."""
+        deadlines = [resource.window_end for resource
+                     in self._resources.values() if resource.held is not None]
+        deadlines.extend(resource.period_end for resource
+                         in self._resources.values() if resource.muted)
+        return min(deadlines, default=None)
+
+    def get_counters(self):
+        """Return a copy of the counters of alerts by outcome."""
+        counters = dict(self._counters)
+        counters["resources"] = len(self._resources)
+        return counters
+
+    def _expire(self, key, resource, now, ready):
+        if resource.period_end is not None and now >= resource.period_end:
+            resource.period_end = None
+            resource.published = 0
+            if resource.muted:
+                self._publish_summary(key, resource, now, ready)
+
+        if resource.window_end is not None and now >= resource.window_end:
+            resource.window_end = None
+            json_msg, events = resource.held, resource.held_events
+            resource.held, resource.held_events = None, []
+            if json_msg is None:
+                return
+            if self._get_state(json_msg) == resource.state:
+                # Consumers saw this state already
+                self._counters["unchanged"] += 1
+                self._set_events(events)
+            else:
+                self._publish(resource, json_msg, events, now, ready)
+
+    def _publish(self, resource, json_msg, events, now, ready):
+        if self._rate_limit and resource.published >= self._rate_limit:
+            self._counters["muted"] += 1
+            resource.muted += 1
+            resource.muted_msg = json_msg
+            self._set_events(events)
+            return
+        if self._rate_limit and resource.period_end is None:
+            resource.period_end = now + self._rate_period
+        resource.published += 1
+        resource.state = self._get_state(json_msg)
+        if self._window:
+            resource.window_end = now + self._window
+        self._counters["published"] += 1
+        ready.append((json_msg, _merge_events(events)))
+
+    def _publish_summary(self, key, resource, now, ready):
+        json_msg, muted = resource.muted_msg, resource.muted
+        resource.muted, resource.muted_msg = 0, None
+        logger.warn(f"AlertCoalescer, muted {muted} alerts of {key[0]} "
+                    f"{key[1]} within {self._rate_period} seconds")
+        info = json_msg["message"]["sensor_response_type"]["info"]
+        if isinstance(info.get("description"), str):
+            info["description"] += \
+                f" ({muted} alerts muted within {self._rate_period} seconds)"
+        self._counters["summaries"] += 1
+        # Held alerts are older than the summary, publish the summary
+        # in place of them
+        if resource.held is not None:
+            self._counters["superseded"] += 1
+            self._set_events(resource.held_events)
+            resource.held, resource.held_events = None, []
+        # The summary is the last muted alert
+        self._counters["muted"] -= 1
+        self._publish(resource, json_msg, [], now, ready)
+
+    @staticmethod
+    def _set_events(events):
+        for event in events:
+            if event is not None:
+                event.set()
+
+
+class _Events(object):
+    """Sets the events of all alerts one published alert stands for."""
+
+    __slots__ = ("_events",)
+
+    def __init__(self, events):
+        self._events = events
+
+    def set(self):
+        for event in self._events:
+            event.set()
+
+
+def _merge_events(events):
+    """Return the one event to set once an alert was published."""
+    events = [event for event in events if event is not None]
+    if len(events) > 1:
+        return _Events(events)
+    return events[0] if events else None
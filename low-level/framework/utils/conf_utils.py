@@ -49,6 +49,7 @@ REALSTORLOGICALVOLUMESENSOR="REALSTORLOGICALVOLUMESENSOR"
 REALSTORPSUSENSOR="REALSTORPSUSENSOR"
 REALSTORSENSORS="REALSTORSENSORS"
 REALSTORSIDEPLANEEXPANDERSENSOR="REALSTORSIDEPLANEEXPANDERSENSOR"
+RESOURCE_MAP="RESOURCE_MAP"
 SASPORTSENSOR="SASPORTSENSOR"
 SSPL_LL_SETTING="SSPL_LL_SETTING"
 STORAGE_ENCLOSURE="STORAGE_ENCLOSURE"
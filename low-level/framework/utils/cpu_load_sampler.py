@@ -0,0 +1,167 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+"""
+ ****************************************************************************
+  Description:       Per CPU core load averages sampled from /proc/stat.
+
+                     Each tick stores the busy and total jiffies every core
+                     spent since the previous tick in an array backed ring
+                     buffer. Running sums over the last 1, 5 and 15 minutes
+                     are updated by adding the newest and dropping the oldest
+                     slot of each window, so reading averages costs nothing.
+ ****************************************************************************
+"""
+
+import threading
+import time
+from array import array
+
+from framework.utils.service_logging import logger
+
+
+class CPULoadSampler(object):
+    """Samples /proc/stat every interval seconds on the shared scheduler,
+    or on a thread of its own when the shared scheduler is disabled."""
+
+    PROC_STAT = "/proc/stat"
+    DEFAULT_INTERVAL = 5
+    # Average windows in seconds
+    WINDOWS = (60, 300, 900)
+    # Reported for a core until it has been sampled once
+    NOT_SAMPLED = -1
+
+    def __init__(self, cpus, interval=DEFAULT_INTERVAL, scheduler=None):
+        self._cpus = cpus
+        self._interval = interval
+        self._scheduler = scheduler
+        self._lock = threading.Lock()
+        # Ticks per window. The ring holds the largest one plus the slot
+        # leaving it, which is read after the newest tick is stored.
+        self._window_ticks = [max(1, int(window // interval))
+                              for window in self.WINDOWS]
+        self._slots = max(self._window_ticks) + 1
+        # Slot s of core c is at s * cpus + c
+        self._busy = array('d', bytes(8 * self._slots * cpus))
+        self._total = array('d', bytes(8 * self._slots * cpus))
+        self._busy_sums = [array('d', bytes(8 * cpus)) for _ in self.WINDOWS]
+        self._total_sums = [array('d', bytes(8 * cpus)) for _ in self.WINDOWS]
+        self._ticks = 0
+        self._prev = None
+        self._cpu_usage = 0.0
+
+    def start(self):
+        """Take the first reading and keep sampling every interval."""
+        self.sample()
+        if self._scheduler is None:
+            from framework.base.shared_scheduler import (
+                get_shared_scheduler, shared_scheduler_enabled)
+            if not shared_scheduler_enabled():
+                threading.Thread(target=self._run, name="cpu_load_sampler",
+                                 daemon=True).start()
+                return
+            self._scheduler = get_shared_scheduler()
+        self._scheduler.call_later(self._interval, self._tick)
+
+    def _run(self):
+        while True:
+            time.sleep(self._interval)
+            self._sample_logged()
+
+    def _tick(self):
+        self._sample_logged()
+        self._scheduler.call_later(self._interval, self._tick)
+
+    def _sample_logged(self):
+        try:
+            self.sample()
+        except Exception as err:
+            logger.error(f"CPULoadSampler, failed to sample cpu load: {err}")
+
+    @classmethod
+    def read_proc_stat(cls):
+        """Returns (busy, total) jiffies of all cpus and of each core."""
+        overall = None
+        cores = {}
+        with open(cls.PROC_STAT) as proc_stat:
+            for line in proc_stat:
+                if not line.startswith("cpu"):
+                    break
+                fields = line.split()
+                # user nice system idle iowait irq softirq steal, guest
+                # time is already part of user and nice
+                times = [int(field) for field in fields[1:9]]
+                total = sum(times)
+                busy = total - times[3] - times[4]
+                if fields[0] == "cpu":
+                    overall = (busy, total)
+                else:
+                    cores[int(fields[0][3:])] = (busy, total)
+        return overall, cores
+
+    def sample(self, stat=None):
+        """Add one tick from read_proc_stat() output, read it when None."""
+        overall, cores = stat or self.read_proc_stat()
+        with self._lock:
+            prev, self._prev = self._prev, (overall, cores)
+            if prev is None:
+                return
+            prev_overall, prev_cores = prev
+            overall_total = overall[1] - prev_overall[1]
+            if overall_total > 0:
+                self._cpu_usage = \
+                    100.0 * (overall[0] - prev_overall[0]) / overall_total
+
+            cpus = self._cpus
+            base = (self._ticks % self._slots) * cpus
+            for core in range(cpus):
+                busy = total = 0
+                if core in cores and core in prev_cores:
+                    busy = max(0, cores[core][0] - prev_cores[core][0])
+                    total = max(0, cores[core][1] - prev_cores[core][1])
+                self._busy[base + core] = busy
+                self._total[base + core] = total
+
+            self._ticks += 1
+            for window, ticks in enumerate(self._window_ticks):
+                busy_sums = self._busy_sums[window]
+                total_sums = self._total_sums[window]
+                # Slot leaving the window, once it has filled up
+                old = (self._ticks - 1 - ticks) % self._slots * cpus \
+                    if self._ticks > ticks else None
+                for core in range(cpus):
+                    busy_sums[core] += self._busy[base + core]
+                    total_sums[core] += self._total[base + core]
+                    if old is not None:
+                        busy_sums[core] -= self._busy[old + core]
+                        total_sums[core] -= self._total[old + core]
+
+    @property
+    def cpu_usage(self):
+        """Overall cpu usage in percent over the last tick."""
+        return self._cpu_usage
+
+    def load_averages(self):
+        """Returns the 1, 5 and 15 minute load of each core in percent.
+
+        Windows not filled yet average the ticks sampled so far.
+        """
+        with self._lock:
+            if not self._ticks:
+                return [[self.NOT_SAMPLED] * self._cpus for _ in self.WINDOWS]
+            return [[100.0 * busy / total if total > 0 else 0.0
+                     for busy, total in zip(self._busy_sums[window],
+                                            self._total_sums[window])]
+                    for window in range(len(self.WINDOWS))]
@@ -17,28 +17,142 @@
 # please email opensource@seagate.com or cortx-questions@seagate.com.
 
 import json
-import shlex
-from cortx.utils.process import PipedProcess, SimpleProcess
+import os
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from framework.utils.service_logging import logger
 
 
 class DriveUtils:
     """Base class for drive related utility functions."""
 
+    SYSFS_BLOCK = "/sys/block"
+    # SCSI peripheral device type of disks, what lsscsi reports as 'disk'
+    SCSI_TYPE_DISK = "0"
+    MAX_WORKERS = 8
+    # Seconds a single smartctl run may take
+    SMARTCTL_TIMEOUT = 60
+    # Seconds SMART data of a drive is reused for
+    CACHE_TTL = 300
+
+    # (serial, device type): (time read, smartctl --json output)
+    _smart_cache = {}
+    _smart_cache_lock = threading.Lock()
+
+    @classmethod
+    def get_drives(cls):
+        """Return {drive path: serial or None} of disks found in sysfs."""
+        drives = {}
+        try:
+            names = sorted(os.listdir(cls.SYSFS_BLOCK))
+        except OSError as err:
+            logger.error(f"DriveUtils, failed to list {cls.SYSFS_BLOCK}: {err}")
+            return drives
+        for name in names:
+            device_dir = os.path.join(cls.SYSFS_BLOCK, name, "device")
+            if name.startswith("nvme"):
+                # Namespaces only, the controller has no block device
+                if not os.path.isdir(device_dir):
+                    continue
+            elif cls._read_sysfs(os.path.join(device_dir, "type")) != \
+                    cls.SCSI_TYPE_DISK:
+                continue
+            drives[f"/dev/{name}"] = cls._read_serial(device_dir)
+        return drives
+
     @staticmethod
-    def get_smart_data():
+    def _read_sysfs(path, binary=False):
+        try:
+            with open(path, "rb" if binary else "r") as f:
+                return f.read() if binary else f.read().strip()
+        except OSError:
+            return None
+
+    @classmethod
+    def _read_serial(cls, device_dir):
+        """Serial number of a drive as smartctl reports it, if known."""
+        # NVMe controllers expose it directly
+        serial = cls._read_sysfs(os.path.join(device_dir, "serial"))
+        if serial:
+            return serial
+        # Unit serial number VPD page, 4 bytes header then the serial
+        vpd = cls._read_sysfs(os.path.join(device_dir, "vpd_pg80"), True)
+        if vpd and len(vpd) > 4:
+            return vpd[4:].decode(errors="ignore").strip("\0 ") or None
+        return None
+
+    @classmethod
+    def get_cached_smart_data(cls, serial, device_type=None,
+                              max_age=CACHE_TTL):
+        """Return SMART data of serial read within max_age seconds, or None."""
+        with cls._smart_cache_lock:
+            entry = cls._smart_cache.get((serial, device_type))
+        if entry and time.monotonic() - entry[0] <= max_age:
+            return entry[1]
+        return None
+
+    @classmethod
+    def read_smart_data(cls, drive_path, device_type=None, serial=None,
+                        sudo=False, timeout=SMARTCTL_TIMEOUT,
+                        max_age=CACHE_TTL):
+        """Return 'smartctl -a --json' output of drive_path.
+
+        Recent data of the drive serial is reused. device_type is passed
+        to smartctl -d, None lets smartctl detect it.
+        """
+        if serial:
+            cached = cls.get_cached_smart_data(serial, device_type, max_age)
+            if cached is not None:
+                return cached
+        smartctl_cmd = ["smartctl", "-a", drive_path, "--json"]
+        if device_type:
+            smartctl_cmd[1:1] = ["-d", device_type]
+        if sudo:
+            smartctl_cmd.insert(0, "sudo")
+        smartctl_response = subprocess.run(
+            smartctl_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            timeout=timeout).stdout
+        smartctl_response = json.loads(smartctl_response)
+        smartctl_response["drive_path"] = drive_path
+        serial = smartctl_response.get("serial_number") or serial
+        if serial:
+            with cls._smart_cache_lock:
+                cls._smart_cache[(serial, device_type)] = \
+                    (time.monotonic(), smartctl_response)
+        return smartctl_response
+
+    @classmethod
+    def iter_smart_data(cls, max_workers=MAX_WORKERS,
+                        timeout=SMARTCTL_TIMEOUT, max_age=CACHE_TTL):
+        """Yield SMART data of every disk as soon as it has been read.
+
+        Up to max_workers smartctl run at a time. Drives failing or not
+        answering within timeout seconds are logged and skipped.
+        """
+        drives = cls.get_drives()
+        if not drives:
+            return
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(drives)),
+                                thread_name_prefix="smartctl") as executor:
+            futures = {executor.submit(cls.read_smart_data, drive_path,
+                                       serial=serial, timeout=timeout,
+                                       max_age=max_age): drive_path
+                       for drive_path, serial in drives.items()}
+            for future in as_completed(futures):
+                try:
+                    yield future.result()
+                except subprocess.TimeoutExpired:
+                    logger.error(f"DriveUtils, smartctl timed out after "
+                                 f"{timeout}s for {futures[future]}")
+                except Exception as err:
+                    logger.error(f"DriveUtils, failed to read SMART data of "
+                                 f"{futures[future]}: {err}")
+
+    @classmethod
+    def get_smart_data(cls):
         """Extract drive SMART test data using smartctl."""
-        response = []
-        lsscsi_cmd = "lsscsi | grep disk"
-        lsscsi_response, _, _ = PipedProcess(lsscsi_cmd).run()
-        lsscsi_response = lsscsi_response.decode()
-        for res in lsscsi_response.split("\n"):
-            drive_path = res.strip().split(' ')[-1]
-            if drive_path not in ["", "-"]:
-                smartctl_cmd = " ".join(
-                        ["smartctl", "-a", drive_path, "--json"])
-                smartctl_cmd = shlex.split(smartctl_cmd)
-                smartctl_response, _, _ = SimpleProcess(smartctl_cmd).run()
-                smartctl_response = json.loads(smartctl_response)
-                smartctl_response["drive_path"] = drive_path
-                response.append(smartctl_response)
-        return response
+        return sorted(cls.iter_smart_data(),
+                      key=lambda res: res["drive_path"])
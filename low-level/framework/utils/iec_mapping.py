@@ -0,0 +1,163 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+"""
+ ****************************************************************************
+  Description:       In memory index of the IEC mapping CSV files.
+
+                    The 'components' file maps a component id to a name,
+                    and a file per component name maps the full
+                    component+module+event code to module and event names.
+                    All files are loaded into dicts once and again only
+                    when one of them changed. The index is saved pickled
+                    next to the IEM data, with the file modification times
+                    it was built from, so later starts skip the CSV parsing.
+ ****************************************************************************
+"""
+
+import csv
+import os
+import pickle
+import threading
+import time
+
+from framework.utils.service_logging import logger
+
+
+class IECMapping(object):
+    """O(1) lookups of IEC component, module and event names."""
+
+    COMPONENTS_FILE = "components"
+    # Seconds between checks of the mapping files for changes
+    CHECK_INTERVAL = 30
+    PICKLE_VERSION = 1
+
+    def __init__(self, mapping_dir, cache_path=None):
+        self._mapping_dir = mapping_dir
+        self._cache_path = cache_path
+        self._lock = threading.Lock()
+        # Component id: name
+        self._components = {}
+        # Component name: {code: (module name, event name)}
+        self._events = {}
+        self._mtimes = None
+        self._next_check = 0
+
+    def _file_mtimes(self):
+        """{file name: mtime} of the components file and the files of the
+        components it lists, None for missing ones."""
+        names = [self.COMPONENTS_FILE] + sorted(set(self._components.values()))
+        mtimes = {}
+        for name in names:
+            try:
+                mtimes[name] = os.stat(
+                    os.path.join(self._mapping_dir, name)).st_mtime_ns
+            except OSError:
+                mtimes[name] = None
+        return mtimes
+
+    def _check(self):
+        """Reload the index if a mapping file changed since it was built."""
+        now = time.monotonic()
+        if now < self._next_check:
+            return
+        with self._lock:
+            if now < self._next_check:
+                return
+            self._next_check = now + self.CHECK_INTERVAL
+            if self._mtimes is None and self._load_pickle():
+                return
+            if self._mtimes != self._file_mtimes():
+                self._load()
+
+    def _read_csv(self, name):
+        path = os.path.join(self._mapping_dir, name)
+        if not os.path.exists(path):
+            return []
+        with open(path, newline='') as f:
+            return [row for row in csv.reader(f) if row]
+
+    def _load(self):
+        components = {}
+        for row in self._read_csv(self.COMPONENTS_FILE):
+            # First match wins, as with the former linear scan
+            if len(row) >= 2:
+                components.setdefault(row[0], row[1])
+        events = {}
+        for component in set(components.values()):
+            component_events = events[component] = {}
+            for row in self._read_csv(component):
+                if len(row) >= 3:
+                    component_events.setdefault(row[0], (row[1], row[2]))
+        self._components = components
+        self._events = events
+        self._mtimes = self._file_mtimes()
+        logger.info(f"IECMapping, loaded {len(components)} components and "
+                    f"{sum(map(len, events.values()))} events")
+        self._save_pickle()
+
+    def _load_pickle(self):
+        """Use the saved index if the mapping files did not change since."""
+        if not self._cache_path:
+            return False
+        try:
+            with open(self._cache_path, "rb") as f:
+                version, mtimes, components, events = pickle.load(f)
+        except FileNotFoundError:
+            return False
+        except Exception as err:
+            logger.warn(f"IECMapping, ignoring {self._cache_path}: {err}")
+            return False
+        if version != self.PICKLE_VERSION:
+            return False
+        self._components = components
+        if mtimes != self._file_mtimes():
+            return False
+        self._events = events
+        self._mtimes = mtimes
+        return True
+
+    def _save_pickle(self):
+        if not self._cache_path:
+            return
+        tmp_path = f"{self._cache_path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self._cache_path), exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                pickle.dump((self.PICKLE_VERSION, self._mtimes,
+                             self._components, self._events), f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._cache_path)
+        except OSError as err:
+            logger.warn(f"IECMapping, failed to save {self._cache_path}: {err}")
+
+    def get_component(self, component_id):
+        """Return the name of component_id, None if it is not mapped."""
+        self._check()
+        return self._components.get(component_id)
+
+    def decode(self, code):
+        """Return (component, module, event) names of an IEC code.
+
+        Ids are returned for parts that are not mapped.
+        """
+        self._check()
+        component_id, module_id, event_id = code[:3], code[3:6], code[6:]
+        component = self._components.get(component_id)
+        if not component:
+            return component_id, module_id, event_id
+        module, event = self._events.get(component, {}).get(
+            code, (module_id, event_id))
+        return component, module, event
@@ -16,6 +16,8 @@
 import re
 import os
 import shlex
+import threading
+import time
 
 from framework.utils.ipmi import IPMI
 from framework.utils.service_logging import logger
@@ -46,11 +48,26 @@ class IPMITool(IPMI):
     MANUFACTURER = "Manufacturer Name"
     ACTIVE_IPMI_TOOL = None
     VM_ERROR = 'Could not open device at'
+    SENSOR_ID = "Sensor ID"
+    LOCATING_SENSOR_RECORD = "Locating sensor record"
+    # Sensor properties that follow the sensor state. Everything else in
+    # 'sensor get' output (thresholds, entity and sensor type) is static
+    # SDR data, cached until the SDR repository changes.
+    DYNAMIC_PROPS = {"Sensor Reading", "Status", "States Asserted",
+                     "Assertion Events"}
+    COMMON_PROPS = {"Sensor ID", "Entity ID"}
+    # Seconds between 'sdr info' checks for SDR repository changes
+    SDR_CHECK_INTERVAL = 60
 
     def __new__(cls):
         """new method"""
         if cls._instance is None:
             cls._instance = super(IPMITool, cls).__new__(cls)
+            cls._instance._sdr_lock = threading.Lock()
+            # sensor_id: (common, static specific) properties
+            cls._instance._sdr_cache = {}
+            cls._instance._sdr_signature = None
+            cls._instance._sdr_checked = 0
         return cls._instance
 
     def get_manufacturer_name(self):
@@ -162,6 +179,135 @@ class IPMITool(IPMI):
 
         return (common, specific)
 
+    def get_sensor_props_many(self, sensor_ids):
+        """Returns get_sensor_props() of many sensors with a single
+           'ipmitool sensor get' call
+           Params : self, sensor_ids
+           Output Format : dictionary of sensor_id to (common, specific),
+                           sensors which could not be read are left out
+        """
+        sensor_ids = list(dict.fromkeys(sensor_ids))
+        if not sensor_ids:
+            return {}
+        props = {}
+        if len(sensor_ids) == 1 or self._is_simulator_active():
+            # ipmisimtool reads one sensor per call
+            for sensor_id in sensor_ids:
+                common, specific = self.get_sensor_props(sensor_id)
+                if common is not False:
+                    props[sensor_id] = (common, specific)
+            self._update_sdr_cache(props)
+            return props
+
+        ids = " ".join(shlex.quote(sensor_id) for sensor_id in sensor_ids)
+        # Records of the sensors found are printed even if one is not
+        props_list_out, error, retcode = self._run_ipmitool_subcommand(
+            f"sensor get {ids}", keep_output=True)
+        if retcode != 0:
+            logger.warn(f"ipmitool sensor get command failed: {error}")
+
+        for sensor_id, record in \
+                self.parse_sensor_records(props_list_out, sensor_ids).items():
+            common = {key: record.pop(key) for key in
+                      self.COMMON_PROPS & record.keys()}
+            props[sensor_id] = (common, record)
+        # Read the sensors left out one by one, so that each failing
+        # sensor gets its own error
+        for sensor_id in sensor_ids:
+            if sensor_id not in props:
+                common, specific = self.get_sensor_props(sensor_id)
+                if common is not False:
+                    props[sensor_id] = (common, specific)
+        self._update_sdr_cache(props)
+        return props
+
+    def get_sensor_static_props_many(self, sensor_ids):
+        """Returns static properties such as thresholds of many sensors,
+           from the SDR cache and one 'ipmitool sensor get' call for the
+           sensors not cached yet
+           Output Format : dictionary of sensor_id to (common, specific)
+        """
+        self._check_sdr_change()
+        with self._sdr_lock:
+            props = {sensor_id: self._sdr_cache[sensor_id]
+                     for sensor_id in sensor_ids
+                     if sensor_id in self._sdr_cache}
+        missing = [sensor_id for sensor_id in sensor_ids
+                   if sensor_id not in props]
+        if missing:
+            self.get_sensor_props_many(missing)
+            with self._sdr_lock:
+                props.update({sensor_id: self._sdr_cache[sensor_id]
+                              for sensor_id in missing
+                              if sensor_id in self._sdr_cache})
+        return props
+
+    def _update_sdr_cache(self, props):
+        with self._sdr_lock:
+            for sensor_id, (common, specific) in props.items():
+                self._sdr_cache[sensor_id] = (dict(common), {
+                    key: val for key, val in specific.items()
+                    if key not in self.DYNAMIC_PROPS})
+
+    def _check_sdr_change(self):
+        """Drops the static properties cache when 'sdr info' shows an
+           addition to or erase of the SDR repository"""
+        now = time.monotonic()
+        if self._sdr_checked and \
+                now - self._sdr_checked < self.SDR_CHECK_INTERVAL:
+            return
+        self._sdr_checked = now
+        output, _, retcode = self._run_ipmitool_subcommand("sdr info")
+        if retcode != 0:
+            return
+        # 'Most recent Addition' and 'Most recent Erase' timestamps
+        output = [line for line in output.split("\n")
+                  if "Most recent" in line]
+        with self._sdr_lock:
+            if output != self._sdr_signature:
+                if self._sdr_signature is not None:
+                    logger.info("SDR repository changed, dropping cached "
+                                "sensor properties")
+                self._sdr_cache.clear()
+                self._sdr_signature = output
+
+    @classmethod
+    def parse_sensor_records(cls, output, sensor_ids):
+        """Splits 'ipmitool sensor get' or 'sdr get' output of several
+           sensors into one dict of properties per requested sensor id.
+           Continuation lines of multi line values are joined with newlines.
+        """
+        records = []
+        record = None
+        curr_key = None
+        for prop in output.split("\n"):
+            if prop.strip() == '' or \
+                    prop.startswith(cls.LOCATING_SENSOR_RECORD):
+                continue
+            key, sep, val = prop.partition(":")
+            if sep and '[' not in key:
+                curr_key, val = key.strip(), val.strip()
+                if curr_key == cls.SENSOR_ID:
+                    record = {}
+                    records.append(record)
+                if record is not None:
+                    record[curr_key] = val
+            elif record is not None and curr_key in record:
+                record[curr_key] += "\n" + prop
+
+        # 'Sensor ID' reads like 'PS1 Status (0xc8)'
+        by_id = {}
+        for record in records:
+            sensor_id = re.sub(r"\s*\(0x[0-9a-fA-F]+\)$", "",
+                               record.get(cls.SENSOR_ID, ""))
+            by_id[sensor_id] = record
+        if not set(sensor_ids) & by_id.keys() and \
+                len(records) == len(sensor_ids):
+            # IDs printed differently, records come in request order
+            return dict(zip(sensor_ids, records))
+        return {sensor_id: by_id[sensor_id] for sensor_id in sensor_ids
+                if sensor_id in by_id}
+
     def get_fru_list_by_type(self, fru_list, sensor_id_map):
         """Returns FRU instances list using ipmitool sdr type command
             Params : self, fru_list, sensor_id_map
@@ -174,18 +320,19 @@ class IPMITool(IPMI):
                 for fru in fru_detail}
         return sensor_id_map
 
-    def _run_ipmitool_subcommand(self, subcommand, grep_args=None):
-        """Executes ipmitool sub-commands, and optionally greps the output."""
+    def _run_ipmitool_subcommand(self, subcommand, grep_args=None,
+                                 keep_output=False):
+        """Executes ipmitool sub-commands, and optionally greps the output.
+           On failure without stderr the output is returned as the error,
+           unless keep_output is set.
+        """
         self.ACTIVE_IPMI_TOOL = self.IPMITOOL
         host_conf_cmd = ""
 
         # Set ipmitool to ipmisimtool if activated.
-        if os.path.exists(f"{DATA_PATH}/server/activate_ipmisimtool"):
-            cmd = self.IPMISIMTOOL + " sel info"
-            _, _, retcode = SimpleProcess(cmd).run()
-            if retcode in [0, 2]:
-                self.ACTIVE_IPMI_TOOL = self.IPMISIMTOOL
-                logger.debug("IPMI simulator is activated.")
+        if self._is_simulator_active():
+            self.ACTIVE_IPMI_TOOL = self.IPMISIMTOOL
+            logger.debug("IPMI simulator is activated.")
 
         # Fetch channel info from config file and cache.
         _channel_interface = Conf.get(SSPL_CONF, "%s>%s" %
@@ -230,7 +377,7 @@ class IPMITool(IPMI):
             out = '\n'.join(final_list)
 
         # Assign error_msg to err from output
-        if retcode and not error:
+        if retcode and not error and not keep_output:
             out, error = error, out
         # Remove '\n' from error, for matching errors to error stings.
         if error:
@@ -238,6 +385,14 @@ class IPMITool(IPMI):
 
         return out, error, retcode
 
+    def _is_simulator_active(self):
+        """Returns True if ipmisimtool is activated and usable."""
+        if os.path.exists(f"{DATA_PATH}/server/activate_ipmisimtool"):
+            cmd = self.IPMISIMTOOL + " sel info"
+            _, _, retcode = SimpleProcess(cmd).run()
+            return retcode in [0, 2]
+        return False
+
     def load_server_fru_list(self):
         """Get Server FRU list and merge it with server_fru_list,
         maintained in global config, with which FRU list can be extended
@@ -0,0 +1,95 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+"""
+ ****************************************************************************
+  Description:       Runs tasks on a small thread pool in order per key.
+
+                    Tasks of a key form a lane that at most one worker
+                    drains at a time, in submission order, while lanes of
+                    other keys run on the other workers. Submitting blocks
+                    once max_pending tasks are queued or running, which
+                    bounds the work taken on.
+ ****************************************************************************
+"""
+
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from framework.utils.service_logging import logger
+
+
+class KeyedExecutor(object):
+    """Thread pool keeping the order of tasks with the same key."""
+
+    def __init__(self, workers, max_pending, name="keyed"):
+        self._executor = ThreadPoolExecutor(max_workers=workers,
+                                            thread_name_prefix=name)
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        # Key: deque of (func, args), the head is the running task
+        self._lanes = {}
+        self._pending = 0
+
+    @property
+    def pending(self):
+        """Number of tasks queued or running."""
+        return self._pending
+
+    def submit(self, key, func, *args):
+        """Run func(*args) after the tasks submitted before with key.
+
+        Blocks while max_pending tasks are pending.
+        """
+        self._slots.acquire()
+        with self._lock:
+            self._pending += 1
+            lane = self._lanes.get(key)
+            if lane is not None:
+                lane.append((func, args))
+                return
+            self._lanes[key] = deque([(func, args)])
+        self._executor.submit(self._run_lane, key)
+
+    def wait_idle(self, timeout=None):
+        """Wait until no task is pending, False if timeout expired first."""
+        with self._idle:
+            return self._idle.wait_for(lambda: not self._pending, timeout)
+
+    def shutdown(self):
+        """Stop taking tasks, returns without waiting for pending ones."""
+        self._executor.shutdown(wait=False)
+
+    def _run_lane(self, key):
+        lane = self._lanes[key]
+        while True:
+            func, args = lane[0]
+            try:
+                func(*args)
+            except Exception as err:
+                logger.exception(f"KeyedExecutor, task of {key} failed: {err}")
+            with self._lock:
+                lane.popleft()
+                self._pending -= 1
+                if not self._pending:
+                    self._idle.notify_all()
+                done = not lane
+                if done:
+                    del self._lanes[key]
+            self._slots.release()
+            if done:
+                return
@@ -0,0 +1,151 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+"""
+ ****************************************************************************
+  Description:       Follows a log file by byte offset, surviving rotation.
+
+                    The position reached is saved as "<inode> <offset>" in a
+                    checkpoint file, so a restart resumes with a single seek
+                    instead of scanning the log. Checkpoints are written
+                    once per batch of lines, not per line.
+ ****************************************************************************
+"""
+
+import os
+
+from framework.utils.service_logging import logger
+
+
+class LogTailer(object):
+    """Reads complete lines appended to a log file."""
+
+    DEFAULT_BATCH_SIZE = 1000
+
+    def __init__(self, log_path, checkpoint_path):
+        self._log_path = log_path
+        self._checkpoint_path = checkpoint_path
+        self._file = None
+        self._inode = None
+        # Offset of the first byte not returned yet
+        self._offset = 0
+        self._saved = None
+
+    @property
+    def position(self):
+        """(inode, offset) reached in the log file."""
+        return self._inode, self._offset
+
+    def open(self, start_after=None):
+        """Open the log and go to the checkpointed position.
+
+        A checkpoint of another inode means the log was rotated meanwhile,
+        it is then read from the start. Without a valid checkpoint,
+        start_after(checkpoint content) may return the offset to start at.
+        """
+        self.close()
+        self._file = open(self._log_path, "rb")
+        self._inode = os.fstat(self._file.fileno()).st_ino
+        self._offset = 0
+
+        checkpoint = self._read_checkpoint()
+        try:
+            inode, offset = (int(field) for field in checkpoint.split())
+        except ValueError:
+            if start_after is not None and checkpoint:
+                self._offset = start_after(checkpoint)
+        else:
+            if inode == self._inode and \
+                    offset <= os.fstat(self._file.fileno()).st_size:
+                self._offset = offset
+        self._file.seek(self._offset)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def scan_offset(self, keep_line):
+        """Return the offset of the first line keep_line(line) is True for.
+
+        Used once to convert a checkpoint of an older format.
+        """
+        offset = 0
+        with open(self._log_path, "rb") as log_file:
+            for line in log_file:
+                if keep_line(line.decode(errors="replace").rstrip()):
+                    break
+                offset += len(line)
+        return offset
+
+    def read_lines(self, max_lines=DEFAULT_BATCH_SIZE):
+        """Return up to max_lines complete lines appended since last read.
+
+        After the log was rotated the rest of the old file is returned
+        first, then the new file is followed from its start.
+        """
+        if self._file is None:
+            self.open()
+        lines = self._read(max_lines)
+        if len(lines) < max_lines and self._rotated():
+            # Old file is drained, move on to the new one
+            self.close()
+            self._file = open(self._log_path, "rb")
+            self._inode = os.fstat(self._file.fileno()).st_ino
+            self._offset = 0
+            lines.extend(self._read(max_lines - len(lines)))
+        return lines
+
+    def _read(self, max_lines):
+        if os.fstat(self._file.fileno()).st_size < self._offset:
+            logger.info(f"LogTailer, {self._log_path} was truncated")
+            self._offset = 0
+        self._file.seek(self._offset)
+        lines = []
+        while len(lines) < max_lines:
+            line = self._file.readline()
+            if not line.endswith(b"\n"):
+                # Nothing more or a line still being written
+                break
+            self._offset += len(line)
+            lines.append(line.decode(errors="replace").rstrip())
+        return lines
+
+    def _rotated(self):
+        try:
+            return os.stat(self._log_path).st_ino != self._inode
+        except FileNotFoundError:
+            # Rotated, the new log is not created yet
+            return False
+
+    def save_checkpoint(self):
+        """Write the current position, when it changed since last save."""
+        position = f"{self._inode} {self._offset}"
+        if position == self._saved:
+            return
+        tmp_path = f"{self._checkpoint_path}.tmp"
+        with open(tmp_path, "w") as checkpoint_file:
+            checkpoint_file.write(position)
+        os.replace(tmp_path, self._checkpoint_path)
+        self._saved = position
+
+    def _read_checkpoint(self):
+        try:
+            with open(self._checkpoint_path, "r") as checkpoint_file:
+                checkpoint = checkpoint_file.read().strip()
+        except FileNotFoundError:
+            return ""
+        self._saved = checkpoint
+        return checkpoint
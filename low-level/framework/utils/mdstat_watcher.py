@@ -0,0 +1,90 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+"""
+ ****************************************************************************
+  Description:       Waits for md events on /proc/mdstat.
+
+                    The kernel flags POLLPRI|POLLERR on an open /proc/mdstat
+                    once an array changes state, e.g. a drive failed, was
+                    removed or added, or a resync started or finished. The
+                    flag is cleared by reading the file again. Regular files
+                    never flag these events, so the watcher just idles on
+                    them and the caller's periodic check does the work.
+ ****************************************************************************
+"""
+
+import select
+import threading
+
+from framework.utils.service_logging import logger
+
+
+class MdstatWatcher(object):
+    """Calls on_change() from a thread of its own on every md event."""
+
+    # Milliseconds a poll() waits before checking for stop()
+    POLL_TIMEOUT = 5000
+
+    def __init__(self, path, on_change):
+        self._path = path
+        self._on_change = on_change
+        self._file = None
+        self._poller = None
+        self._thread = None
+        self._stopped = threading.Event()
+
+    def start(self):
+        """Begin watching, False if the file can not be polled."""
+        if not hasattr(select, "poll"):
+            return False
+        try:
+            self._file = open(self._path, "rb", buffering=0)
+            # Events are flagged against what was read last
+            self._file.read()
+        except OSError as err:
+            logger.warn(f"MdstatWatcher, can not watch {self._path}: {err}")
+            return False
+        self._poller = select.poll()
+        self._poller.register(self._file.fileno(),
+                              select.POLLPRI | select.POLLERR)
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._watch, daemon=True,
+                                        name=f"MdstatWatcher-{self._path}")
+        self._thread.start()
+        return True
+
+    def stop(self):
+        """Stop watching, returns without waiting for the thread."""
+        self._stopped.set()
+
+    def _watch(self):
+        try:
+            while not self._stopped.is_set():
+                if not self._poller.poll(self.POLL_TIMEOUT):
+                    continue
+                if self._stopped.is_set():
+                    break
+                # Reading again clears the event
+                self._file.seek(0)
+                self._file.read()
+                try:
+                    self._on_change()
+                except Exception as err:
+                    logger.error(f"MdstatWatcher, change callback failed: {err}")
+        except OSError as err:
+            logger.error(f"MdstatWatcher, stopped watching {self._path}: {err}")
+        finally:
+            self._file.close()
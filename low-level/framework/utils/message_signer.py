@@ -0,0 +1,82 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+"""
+ ****************************************************************************
+  Description:       Signs and verifies messages with libsspl_sec.
+
+                    A session token is valid for session_length seconds, so
+                    it is generated once and reused until shortly before it
+                    expires, instead of asking the key manager for a new one
+                    per message. The token and signature buffers are
+                    allocated once. Messages are signed over their
+                    serialized JSON bytes.
+ ****************************************************************************
+"""
+
+import ctypes
+import json
+import threading
+import time
+
+
+class MessageSigner(object):
+    """Signs messages as one user with a cached session token."""
+
+    # Seconds before expiry a session token is renewed, at most a tenth of
+    # the session length
+    RENEW_MARGIN = 60
+
+    def __init__(self, sec_lib, username, authn_token, session_length,
+                 clock=time.monotonic):
+        self._lib = sec_lib
+        self._username = username.encode()
+        self._authn_token = authn_token.encode()
+        self._session_length = int(session_length)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._token = ctypes.create_string_buffer(
+            sec_lib.sspl_get_token_length())
+        self._sig = ctypes.create_string_buffer(sec_lib.sspl_get_sig_length())
+        self._renew_at = None
+
+    def _renew_token(self, now):
+        # Length includes the 0 terminator, as for strings
+        self._lib.sspl_generate_session_token(
+            self._username, len(self._authn_token) + 1, self._authn_token,
+            self._session_length, self._token)
+        margin = min(self.RENEW_MARGIN, self._session_length / 10)
+        self._renew_at = now + self._session_length - margin
+
+    def sign(self, payload):
+        """Return the signature of payload, the serialized message bytes."""
+        with self._lock:
+            now = self._clock()
+            if self._renew_at is None or now >= self._renew_at:
+                self._renew_token(now)
+            self._lib.sspl_sign_message(len(payload), payload,
+                                        self._username, self._token,
+                                        self._sig)
+            return str(self._sig.raw, encoding='utf-8')
+
+
+def render_message(json_msg, body):
+    """Return json_msg as JSON, body being its "message" member already
+    serialized, so the member is not rendered a second time."""
+    header = json.dumps({key: value for key, value in json_msg.items()
+                         if key != "message"})
+    if header == "{}":
+        return f'{{"message": {body}}}'
+    return f'{header[:-1]}, "message": {body}}}'
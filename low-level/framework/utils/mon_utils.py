@@ -19,12 +19,28 @@
  ****************************************************************************
 """
 
+import re
+import threading
+import time
 import uuid
+
 from framework.utils.service_logging import logger
 
 
+# One subscript of a key path, e.g. ['health'], ["serial-number"] or [0]
+KEY_PATH_ITEM = re.compile(
+    r"""\s*\[\s*(?:'([^']*)'|"([^"]*)"|(-?\d+))\s*\]\s*""")
+
+
 class MonUtils():
     """Base class for all the monitor utilities."""
+
+    # key path: getter, see compile_key_path()
+    _key_getters = {}
+    _key_getters_lock = threading.Lock()
+    # Keys of collect_concurrently collectors that did not return yet
+    _collectors_in_flight = set()
+    _collectors_lock = threading.Lock()
     def __init__(self):
         """Init method."""
         super(MonUtils, self).__init__()
@@ -41,16 +57,66 @@ class MonUtils():
     @staticmethod
     def normalize_kv(item, input_v, replace_v):
         """Normalize all values coming from input as per requirement."""
-        if isinstance(item, dict):
-            return {key: MonUtils.normalize_kv(value, input_v, replace_v)
-                for key, value in item.items()}
-        elif isinstance(item, list):
-            return [MonUtils.normalize_kv(_, input_v, replace_v) for _ in item]
-        elif item in input_v if isinstance(input_v, list) else item == input_v:
-            return replace_v
+        if isinstance(input_v, list):
+            try:
+                input_v = frozenset(input_v)
+            except TypeError:
+                # Unhashable values, compared one by one
+                pass
         else:
+            input_v = (input_v,)
+
+        def normalize(item):
+            if isinstance(item, dict):
+                return {key: normalize(value) for key, value in item.items()}
+            elif isinstance(item, list):
+                return [normalize(value) for value in item]
+            try:
+                if item in input_v:
+                    return replace_v
+            except TypeError:
+                # Unhashable item, it can not be one of hashable input_v
+                pass
             return item
 
+        return normalize(item)
+
+    @staticmethod
+    def compile_key_path(key_path):
+        """
+        Return a function getting the value at key_path of its argument.
+        key_path: subscripts as in resource_indexing_map.
+               Examples:
+                    "['health']['specifics'][0]['serial-number']"
+        Getters are compiled once per key path. ValueError is raised for
+        anything else than string and integer subscripts.
+        """
+        getter = MonUtils._key_getters.get(key_path)
+        if getter is not None:
+            return getter
+        keys = []
+        position = 0
+        while position < len(key_path):
+            match = KEY_PATH_ITEM.match(key_path, position)
+            if not match:
+                raise ValueError(f"Invalid key path: {key_path}")
+            single, double, index = match.groups()
+            keys.append(int(index) if index is not None else
+                        single if single is not None else double)
+            position = match.end()
+        if not keys:
+            raise ValueError(f"Invalid key path: {key_path}")
+        keys = tuple(keys)
+
+        def getter(item):
+            for key in keys:
+                item = item[key]
+            return item
+
+        with MonUtils._key_getters_lock:
+            MonUtils._key_getters[key_path] = getter
+        return getter
+
     @staticmethod
     def sort_by_specific_kv(data, key_path, log):
         """
@@ -66,7 +132,8 @@ class MonUtils():
         sorted_data = []
         try:
             if key_path and data:
-                sorted_data = sorted(data, key=lambda k: eval(f'{k}{key_path}'))
+                sorted_data = sorted(data,
+                                     key=MonUtils.compile_key_path(key_path))
             else:
                 sorted_data = data
         except Exception as err:
@@ -75,3 +142,82 @@ class MonUtils():
                 key_path, data, err)
             logger.error(log.svc_log(f"{msg}"))
         return sorted_data
+
+    @staticmethod
+    def collect_concurrently(collectors, timeout, log, timeouts=None):
+        """
+        Call each collector on a thread of its own and gather the results.
+        collectors: dictionary of key and function without arguments.
+        timeout: seconds a collector may take, counted from the start of
+                 the collection. timeouts overrides it per key.
+        log: log object.
+
+        Results of collectors that raised or did not return in time are
+        None, the others are returned anyway. A collector that timed out
+        is left running on a daemon thread, so it does not hold up the
+        exit of the process, and is not started again for its key until
+        it returned.
+        Returns dictionaries of result and of metadata by key,
+               Example metadata:
+                    {"status": "Timeout", "latency": 30.001}
+               status is one of OK, Error, Timeout or Busy, a previous
+               run of the collector being still in flight, latency in
+               seconds.
+        """
+        timeouts = timeouts or {}
+        results = {}
+        metadata = {}
+
+        def run(key, collector, slot, done):
+            collector_start = time.monotonic()
+            try:
+                slot["result"] = collector()
+            except Exception as err:
+                slot["error"] = err
+            finally:
+                slot["latency"] = time.monotonic() - collector_start
+                with MonUtils._collectors_lock:
+                    MonUtils._collectors_in_flight.discard(key)
+                done.set()
+
+        start = time.monotonic()
+        runs = {}
+        for key, collector in collectors.items():
+            with MonUtils._collectors_lock:
+                busy = key in MonUtils._collectors_in_flight
+                if not busy:
+                    MonUtils._collectors_in_flight.add(key)
+            if busy:
+                results[key] = None
+                metadata[key] = {"status": "Busy", "latency": 0}
+                logger.error(log.svc_log(
+                    f"{key} is still running since an earlier request"))
+                continue
+            slot, done = {}, threading.Event()
+            threading.Thread(target=run, args=(key, collector, slot, done),
+                             name=f"collector-{key}", daemon=True).start()
+            runs[key] = (slot, done)
+        # Wait in order of deadline so each gets its own timeout
+        for key in sorted(runs, key=lambda k: timeouts.get(k, timeout)):
+            slot, done = runs[key]
+            deadline = start + timeouts.get(key, timeout)
+            results[key] = None
+            if not done.wait(max(deadline - time.monotonic(), 0)):
+                status = "Timeout"
+                latency = time.monotonic() - start
+                logger.error(log.svc_log(
+                    f"{key} did not complete within {timeouts.get(key, timeout)}s"))
+            else:
+                latency = slot["latency"]
+                err = slot.get("error")
+                if err is None:
+                    results[key] = slot["result"]
+                    status = "OK"
+                else:
+                    status = "Error"
+                    logger.error(log.svc_log(
+                        f"{err.__class__.__name__}:{err}"))
+            metadata[key] = {"status": status, "latency": round(latency, 3)}
+        results = {key: results[key] for key in collectors}
+        metadata = {key: metadata[key] for key in collectors}
+        return results, metadata
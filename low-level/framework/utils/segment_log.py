@@ -0,0 +1,455 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+"""
+ ****************************************************************************
+  Description:       Append-only, segment file based persistent FIFO log.
+
+                     Records are appended to fixed size segment files named
+                     after the sequence number of their first record. The
+                     consumer position (head) is kept in memory and
+                     checkpointed periodically, so a crash can only cause
+                     already consumed messages to be replayed, never lose
+                     messages that were appended.
+ ****************************************************************************
+"""
+
+import errno
+import json
+import os
+import struct
+import threading
+import time
+import zlib
+from collections import deque
+from itertools import islice
+
+from framework.utils.service_logging import logger
+
+
+class SegmentLog(object):
+    """Persistent FIFO of str/bytes records stored in segment files."""
+
+    # Record header: payload length, crc32 of payload, payload type
+    HEADER = struct.Struct(">IIB")
+    TYPE_BYTES = 0
+    TYPE_STR = 1
+
+    SEGMENT_SUFFIX = ".seg"
+    CHECKPOINT_FILE = "checkpoint"
+
+    FSYNC_ALWAYS = "always"
+    FSYNC_INTERVAL = "interval"
+    FSYNC_NEVER = "never"
+    FSYNC_POLICIES = (FSYNC_ALWAYS, FSYNC_INTERVAL, FSYNC_NEVER)
+
+    DEFAULT_SEGMENT_SIZE = 4 * 1024 * 1024
+    DEFAULT_FSYNC_INTERVAL = 1
+    # Consumed records between two head checkpoints
+    DEFAULT_CHECKPOINT_EVERY = 64
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls, path, **kwargs):
+        """Return the log opened on path, opening it on first use.
+
+        All users of a directory in this process must share one instance
+        as head, tail and size are only kept in memory.
+        """
+        path = os.path.realpath(path)
+        with cls._instances_lock:
+            if path not in cls._instances:
+                cls._instances[path] = cls(path, **kwargs)
+            return cls._instances[path]
+
+    def __init__(self, path, segment_size=DEFAULT_SEGMENT_SIZE,
+                 fsync_policy=FSYNC_ALWAYS,
+                 fsync_interval=DEFAULT_FSYNC_INTERVAL,
+                 checkpoint_every=DEFAULT_CHECKPOINT_EVERY):
+        if fsync_policy not in self.FSYNC_POLICIES:
+            logger.warn(f"SegmentLog, invalid fsync policy '{fsync_policy}',"
+                        f" using '{self.FSYNC_ALWAYS}'")
+            fsync_policy = self.FSYNC_ALWAYS
+        self._path = path
+        self._segment_size = int(segment_size)
+        self._fsync_policy = fsync_policy
+        self._fsync_interval = float(fsync_interval)
+        self._checkpoint_every = max(1, int(checkpoint_every))
+        self._checkpoint_path = os.path.join(path, self.CHECKPOINT_FILE)
+        self._lock = threading.RLock()
+
+        # Base sequence numbers of segment files, oldest first
+        self._segments = []
+        self._writer_fd = None
+        self._writer_size = 0
+        self._last_fsync = 0
+        self._unsynced = False
+        self._reader = None
+        self._reader_base = None
+
+        # Sequence number of the oldest unconsumed record and its position
+        self._head = 0
+        self._read_pos = None
+        # Sequence number of the next record to be appended
+        self._tail = 0
+        self._count = 0
+        self._size = 0
+        self._deletes_since_checkpoint = 0
+        # Records read ahead of head: (item, size, position after record)
+        self._readahead = deque()
+
+        self._recover()
+
+    @property
+    def count(self):
+        """Number of unconsumed records."""
+        return self._count
+
+    @property
+    def size(self):
+        """Payload bytes held by unconsumed records."""
+        return self._size
+
+    @property
+    def head(self):
+        return self._head
+
+    @property
+    def tail(self):
+        return self._tail
+
+    def is_empty(self):
+        return self._count == 0
+
+    def append(self, items):
+        """Append items in a single write and apply the fsync policy.
+
+        Returns the payload size of each appended item.
+        """
+        if not items:
+            return []
+        with self._lock:
+            sizes = []
+            chunks = []
+            chunk_len = 0
+            for item in items:
+                if isinstance(item, str):
+                    payload = item.encode("utf-8")
+                    rtype = self.TYPE_STR
+                else:
+                    payload = bytes(item)
+                    rtype = self.TYPE_BYTES
+                record = self.HEADER.pack(
+                    len(payload), zlib.crc32(payload), rtype) + payload
+                if self._writer_fd is None or (self._writer_size + chunk_len
+                        + len(record) > self._segment_size and
+                        (self._writer_size + chunk_len) > 0):
+                    self._write(chunks)
+                    chunks, chunk_len = [], 0
+                    self._roll_segment()
+                chunks.append(record)
+                chunk_len += len(record)
+                self._tail += 1
+                self._count += 1
+                self._size += len(payload)
+                sizes.append(len(payload))
+            self._write(chunks)
+            self._sync(force=False)
+            return sizes
+
+    def peek(self, count=1):
+        """Return up to count oldest records without consuming them."""
+        with self._lock:
+            self._fill_readahead(count)
+            return [entry[0] for entry in islice(self._readahead, count)]
+
+    def consume(self, count=1):
+        """Drop up to count oldest records, returns number of records dropped."""
+        with self._lock:
+            self._fill_readahead(count)
+            dropped = 0
+            while dropped < count and self._readahead:
+                _, size, pos = self._readahead.popleft()
+                self._read_pos = pos
+                self._head = pos[0] + pos[2]
+                self._count -= 1
+                self._size -= size
+                dropped += 1
+            self._deletes_since_checkpoint += dropped
+            if self._count == 0:
+                self._reset()
+            else:
+                self._retire_segments()
+                if self._deletes_since_checkpoint >= self._checkpoint_every:
+                    self._write_checkpoint()
+            return dropped
+
+    def flush(self):
+        """Force appended records and the consumer position to disk."""
+        with self._lock:
+            self._sync(force=True)
+            self._write_checkpoint()
+
+    def close(self):
+        with self._lock:
+            self.flush()
+            if self._writer_fd is not None:
+                os.close(self._writer_fd)
+                self._writer_fd = None
+            self._close_reader()
+
+    def _segment_file(self, base):
+        return os.path.join(self._path, "%020d%s" % (base, self.SEGMENT_SUFFIX))
+
+    def _write(self, chunks):
+        if chunks:
+            data = b"".join(chunks)
+            while data:
+                written = os.write(self._writer_fd, data)
+                data = data[written:]
+                self._writer_size += written
+            self._unsynced = True
+
+    def _sync(self, force):
+        if not self._unsynced or self._writer_fd is None:
+            return
+        now = time.time()
+        if force or self._fsync_policy == self.FSYNC_ALWAYS or \
+                (self._fsync_policy == self.FSYNC_INTERVAL and
+                 now - self._last_fsync >= self._fsync_interval):
+            os.fsync(self._writer_fd)
+            self._last_fsync = now
+            self._unsynced = False
+
+    def _roll_segment(self):
+        """Close the active segment and start a new one at tail."""
+        if self._writer_fd is not None:
+            self._sync(force=self._fsync_policy != self.FSYNC_NEVER)
+            os.close(self._writer_fd)
+        self._segments.append(self._tail)
+        self._writer_fd = os.open(self._segment_file(self._tail),
+                                  os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        self._writer_size = 0
+        if self._read_pos is None:
+            self._read_pos = (self._tail, 0, 0)
+            self._head = self._tail
+        if self._fsync_policy != self.FSYNC_NEVER:
+            self._sync_dir()
+
+    def _sync_dir(self):
+        try:
+            fd = os.open(self._path, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        except OSError as err:
+            logger.debug(f"SegmentLog, directory fsync failed: {err}")
+
+    def _open_reader(self, base):
+        if self._reader_base != base:
+            self._close_reader()
+            self._reader = open(self._segment_file(base), "rb")
+            self._reader_base = base
+        return self._reader
+
+    def _close_reader(self):
+        if self._reader is not None:
+            self._reader.close()
+        self._reader = None
+        self._reader_base = None
+
+    def _read_record(self, fh):
+        """Read one record at the current file position.
+
+        Returns (item, size) or None on end of segment or a torn record.
+        """
+        header = fh.read(self.HEADER.size)
+        if len(header) < self.HEADER.size:
+            return None
+        length, crc, rtype = self.HEADER.unpack(header)
+        payload = fh.read(length)
+        if len(payload) < length or zlib.crc32(payload) != crc:
+            return None
+        if rtype == self.TYPE_STR:
+            return payload.decode("utf-8"), length
+        return payload, length
+
+    def _fill_readahead(self, count):
+        """Read records following the read ahead buffer until it holds count."""
+        while len(self._readahead) < min(count, self._count):
+            base, offset, index = self._readahead[-1][2] if self._readahead \
+                else self._read_pos
+            fh = self._open_reader(base)
+            fh.seek(offset)
+            record = self._read_record(fh)
+            if record is None:
+                # End of this segment, continue with the next one
+                pos = self._segments.index(base)
+                if pos + 1 >= len(self._segments):
+                    logger.error("SegmentLog, log ended before expected record"
+                                 f" count, dropping {self._count - len(self._readahead)}"
+                                 " unreadable records")
+                    self._count = len(self._readahead)
+                    self._size = sum(entry[1] for entry in self._readahead)
+                    break
+                next_base = self._segments[pos + 1]
+                if self._readahead:
+                    item, size, _ = self._readahead.pop()
+                    self._readahead.append((item, size, (next_base, 0, 0)))
+                else:
+                    self._read_pos = (next_base, 0, 0)
+                    self._head = next_base
+                continue
+            item, size = record
+            self._readahead.append(
+                (item, size, (base, fh.tell(), index + 1)))
+
+    def _retire_segments(self):
+        """Delete segment files which hold consumed records only."""
+        base = self._read_pos[0]
+        retired = False
+        while self._segments and self._segments[0] < base:
+            old = self._segments.pop(0)
+            if self._reader_base == old:
+                self._close_reader()
+            self._remove(self._segment_file(old))
+            retired = True
+        if retired:
+            # Retired files must never be referenced by the checkpoint
+            self._write_checkpoint()
+
+    def _reset(self):
+        """Drop all segments once every record has been consumed."""
+        self._readahead.clear()
+        self._close_reader()
+        if self._writer_fd is not None:
+            os.close(self._writer_fd)
+            self._writer_fd = None
+        for base in self._segments:
+            self._remove(self._segment_file(base))
+        self._segments = []
+        self._head = self._tail
+        self._read_pos = None
+        self._count = 0
+        self._size = 0
+        self._unsynced = False
+        self._write_checkpoint()
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except OSError as err:
+            if err.errno != errno.ENOENT:
+                logger.warn(f"SegmentLog, failed to remove {path}: {err}")
+
+    def _write_checkpoint(self):
+        data = {"head": self._head, "tail": self._tail}
+        if self._read_pos is not None:
+            data["segment"], data["offset"], _ = self._read_pos
+        tmp_path = self._checkpoint_path + ".tmp"
+        try:
+            with open(tmp_path, "w") as fh:
+                json.dump(data, fh)
+                if self._fsync_policy != self.FSYNC_NEVER:
+                    fh.flush()
+                    os.fsync(fh.fileno())
+            os.replace(tmp_path, self._checkpoint_path)
+            self._deletes_since_checkpoint = 0
+        except OSError as err:
+            logger.warn(f"SegmentLog, failed to write checkpoint: {err}")
+
+    def _read_checkpoint(self):
+        try:
+            with open(self._checkpoint_path) as fh:
+                return json.load(fh)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as err:
+            logger.warn(f"SegmentLog, ignoring unreadable checkpoint: {err}")
+            return {}
+
+    def _recover(self):
+        """Rebuild head, tail, count and size from checkpoint and segments.
+
+        Segments are replayed sequentially from the checkpointed head. A torn
+        record at the end of the newest segment is truncated away.
+        """
+        os.makedirs(self._path, exist_ok=True)
+        self._remove(self._checkpoint_path + ".tmp")
+        self._segments = sorted(
+            int(name[:-len(self.SEGMENT_SUFFIX)])
+            for name in os.listdir(self._path)
+            if name.endswith(self.SEGMENT_SUFFIX) and
+            name[:-len(self.SEGMENT_SUFFIX)].isdigit())
+        checkpoint = self._read_checkpoint()
+        self._tail = int(checkpoint.get("tail", 0))
+        if not self._segments:
+            self._head = self._tail
+            return
+
+        head = int(checkpoint.get("head", self._segments[0]))
+        # Segments entirely before the checkpointed head are consumed
+        while len(self._segments) > 1 and self._segments[1] <= head:
+            self._remove(self._segment_file(self._segments.pop(0)))
+        head = max(head, self._segments[0])
+        self._head = head
+
+        for pos, base in enumerate(self._segments):
+            last = pos == len(self._segments) - 1
+            index = 0
+            with open(self._segment_file(base), "rb") as fh:
+                if base == self._segments[0] and \
+                        checkpoint.get("segment") == base and \
+                        checkpoint.get("offset") is not None and \
+                        head == int(checkpoint["head"]):
+                    # Resume directly at the checkpointed offset
+                    fh.seek(int(checkpoint["offset"]))
+                    index = head - base
+                    if self._read_pos is None:
+                        self._read_pos = (base, fh.tell(), index)
+                while True:
+                    offset = fh.tell()
+                    record = self._read_record(fh)
+                    if record is None:
+                        break
+                    if base + index >= head:
+                        if self._read_pos is None:
+                            self._read_pos = (base, offset, index)
+                        self._count += 1
+                        self._size += record[1]
+                    index += 1
+                end = offset
+            if last:
+                if end < os.path.getsize(self._segment_file(base)):
+                    logger.warn("SegmentLog, truncating torn record in"
+                                f" {self._segment_file(base)} at {end}")
+                    os.truncate(self._segment_file(base), end)
+                self._tail = max(self._tail, base + index)
+                self._writer_fd = os.open(self._segment_file(base),
+                                          os.O_WRONLY | os.O_APPEND)
+                self._writer_size = end
+            elif end < os.path.getsize(self._segment_file(base)):
+                logger.error("SegmentLog, skipping corrupted records in"
+                             f" {self._segment_file(base)} after offset {end}")
+
+        if self._count == 0:
+            self._reset()
+        elif self._read_pos is None:
+            self._read_pos = (self._segments[0], 0, 0)
+        logger.info(f"SegmentLog, recovered {self._count} records"
+                    f" ({self._size} bytes) from {self._path}")
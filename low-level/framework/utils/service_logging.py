@@ -25,8 +25,13 @@ import syslog
 from cortx.utils.log import Log
 
 
+# Level logging was initialized with, see debug_enabled()
+_log_level = "INFO"
+
+
 def init_logging(service_name, file_path, log_level="INFO"):
     """Initialize logging for SSPL component."""
+    global _log_level
     # Log rotation is configured within cortx-utils with
     # following attributes:
     #   backup_count: 10,
@@ -41,6 +46,15 @@ def init_logging(service_name, file_path, log_level="INFO"):
     except Exception as err:
         syslog.syslog(f"[ Error ] CORTX Logger Init failed with error {err}")
         sys.exit(os.EX_SOFTWARE)
+    _log_level = str(log_level).upper()
+
+
+def debug_enabled():
+    """True if debug messages are logged.
+
+    Lets callers skip building debug messages that would be dropped.
+    """
+    return _log_level == "DEBUG"
 
 
 logger = Log
@@ -0,0 +1,110 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+"""
+ ****************************************************************************
+  Description:       Thread safe TTL cache with single-flight loading.
+
+                     Concurrent callers asking for the same missing key wait
+                     for one loader call and share its result instead of
+                     issuing their own request.
+ ****************************************************************************
+"""
+
+import threading
+import time
+
+
+class _InFlight(object):
+    """Result holder for a load in progress."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class SingleFlightCache(object):
+    """Cache of loader results, each valid for ttl seconds."""
+
+    def __init__(self, ttl, clock=time.monotonic):
+        self._ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key: (value, expiry time)
+        self._entries = {}
+        # key: _InFlight
+        self._inflight = {}
+        # Bumped by invalidate() so loads started before it are not cached
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def ttl(self):
+        return self._ttl
+
+    def get(self, key, loader, ttl=None, cacheable=None):
+        """Return the cached value of key, calling loader() once on a miss.
+
+        cacheable(value) decides whether a loaded value is stored, so that
+        failures are retried by the next caller. Callers waiting on an
+        in-flight load get its result, or its exception, either way.
+        """
+        ttl = self._ttl if ttl is None else ttl
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > self._clock():
+                self.hits += 1
+                return entry[0]
+            flight = self._inflight.get(key)
+            owner = flight is None
+            if owner:
+                flight = _InFlight()
+                self._inflight[key] = flight
+                generation = self._generation
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        if not owner:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            flight.value = loader()
+        except Exception as err:
+            flight.error = err
+            raise
+        finally:
+            with self._lock:
+                if flight.error is None and generation == self._generation \
+                        and ttl > 0 and \
+                        (cacheable is None or cacheable(flight.value)):
+                    self._entries[key] = (flight.value, self._clock() + ttl)
+                self._inflight.pop(key, None)
+            flight.done.set()
+        return flight.value
+
+    def invalidate(self, key=None):
+        """Drop key, or every entry when key is None."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+            self._generation += 1
@@ -0,0 +1,112 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+"""
+ ****************************************************************************
+  Description:       In memory snapshots of health and manifest data.
+
+                    A snapshot of a resource, e.g. disk, is served until
+                    its TTL expires or the resource is invalidated.
+                    Invalidation bumps a version file per resource, so
+                    sensors of sspl-ll can invalidate the snapshots of
+                    resource map queries made by other processes. Checking
+                    the version costs a stat() per lookup.
+ ****************************************************************************
+"""
+
+import copy
+import os
+import threading
+import time
+
+from framework.base.sspl_constants import DATA_PATH
+from framework.utils.service_logging import logger
+
+VERSION_DIR = os.path.join(DATA_PATH, "resource_map")
+
+
+def _version_path(resource):
+    return os.path.join(VERSION_DIR, f"{resource}.version")
+
+
+def get_version(resource):
+    """Return the current version of resource, None if never invalidated."""
+    try:
+        stat = os.stat(_version_path(resource))
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns
+
+
+def invalidate(*resources):
+    """Make snapshots of resources stale in every process."""
+    for resource in resources:
+        path = _version_path(resource)
+        tmp_path = f"{path}.tmp"
+        try:
+            os.makedirs(VERSION_DIR, exist_ok=True)
+            with open(tmp_path, "w") as f:
+                f.write(str(time.time()))
+            # A new inode each time, so the version changes even within
+            # the mtime granularity
+            os.replace(tmp_path, path)
+        except OSError as err:
+            logger.warn(f"SnapshotCache, failed to invalidate {resource}: {err}")
+
+
+class SnapshotCache(object):
+    """Per resource snapshots of data returned by a loader function."""
+
+    def __init__(self, default_ttl, ttls=None):
+        """default_ttl and ttls, overriding it by resource, are in seconds.
+
+        A TTL of 0 disables the cache of a resource.
+        """
+        self._default_ttl = default_ttl
+        self._ttls = ttls or {}
+        self._lock = threading.Lock()
+        # resource: (version, expiry time, data)
+        self._snapshots = {}
+
+    def get_ttl(self, resource):
+        return self._ttls.get(resource, self._default_ttl)
+
+    def get(self, resource, loader):
+        """Return the snapshot of resource, taken with loader() if needed.
+
+        A copy is returned so callers can modify it.
+        """
+        ttl = self.get_ttl(resource)
+        if not ttl:
+            return loader()
+        version = get_version(resource)
+        now = time.monotonic()
+        with self._lock:
+            snapshot = self._snapshots.get(resource)
+        if snapshot is not None and snapshot[0] == version and now < snapshot[1]:
+            return copy.deepcopy(snapshot[2])
+
+        data = loader()
+        with self._lock:
+            self._snapshots[resource] = (version, now + ttl, data)
+        return copy.deepcopy(data)
+
+    def clear(self, resource=None):
+        """Drop the snapshot of resource, or all, in this process only."""
+        with self._lock:
+            if resource is None:
+                self._snapshots.clear()
+            else:
+                self._snapshots.pop(resource, None)
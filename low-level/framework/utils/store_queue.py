@@ -23,40 +23,99 @@ import os
 import sys
 
 from framework.base.sspl_constants import DATA_PATH
-from framework.utils.conf_utils import SSPL_CONF, Conf
+from framework.utils.conf_utils import EGRESSPROCESSOR, SSPL_CONF, Conf
 from framework.utils.config_reader import ConfigReader
+from framework.utils.segment_log import SegmentLog
 from framework.utils.service_logging import logger
 from framework.utils.store_factory import store
 
 
 class StoreQueue:
+    """Persistent FIFO of messages which could not be sent on the message bus.
 
-    PROCESSOR    = 'EgressProcessor'
+    Two backends are supported, selected by 'persistent_queue_backend':
+      store       - one store key per message, counters kept in the store.
+      segment_log - batched appends to segment files with in-memory
+                    counters, see framework.utils.segment_log.
+    """
+
+    PROCESSOR    = EGRESSPROCESSOR
     LIMIT_CONSUL_MEMORY  = 'limit_consul_memory'
+    QUEUE_BACKEND        = 'persistent_queue_backend'
+    QUEUE_FSYNC          = 'persistent_queue_fsync'
+    QUEUE_FSYNC_INTERVAL = 'persistent_queue_fsync_interval'
+    QUEUE_SEGMENT_SIZE   = 'persistent_queue_segment_size'
     CACHE_DIR_NAME       = "SSPL_UNSENT_MESSAGES"
+    SEGMENT_LOG_DIR_NAME = "LOG"
+
+    BACKEND_STORE = 'store'
+    BACKEND_SEGMENT_LOG = 'segment_log'
 
     def __init__(self):
         self._max_size = int(Conf.get(SSPL_CONF, f"{self.PROCESSOR}>{self.LIMIT_CONSUL_MEMORY}", 50000000))
 
         self.cache_dir_path = os.path.join(DATA_PATH, self.CACHE_DIR_NAME)
         self.SSPL_MEMORY_USAGE = os.path.join(self.cache_dir_path, 'SSPL_MEMORY_USAGE')
+        self.SSPL_MESSAGE_HEAD_INDEX = os.path.join(self.cache_dir_path, 'SSPL_MESSAGE_HEAD_INDEX')
+        self.SSPL_MESSAGE_TAIL_INDEX = os.path.join(self.cache_dir_path, 'SSPL_MESSAGE_TAIL_INDEX')
+        self.SSPL_UNSENT_MESSAGES = os.path.join(self.cache_dir_path, 'MESSAGES')
+
+        self._log = None
+        backend = Conf.get(SSPL_CONF, f"{self.PROCESSOR}>{self.QUEUE_BACKEND}",
+                           self.BACKEND_SEGMENT_LOG)
+        if backend == self.BACKEND_SEGMENT_LOG:
+            self._log = SegmentLog.get_instance(
+                os.path.join(self.cache_dir_path, self.SEGMENT_LOG_DIR_NAME),
+                segment_size=Conf.get(SSPL_CONF,
+                    f"{self.PROCESSOR}>{self.QUEUE_SEGMENT_SIZE}",
+                    SegmentLog.DEFAULT_SEGMENT_SIZE),
+                fsync_policy=Conf.get(SSPL_CONF,
+                    f"{self.PROCESSOR}>{self.QUEUE_FSYNC}",
+                    SegmentLog.FSYNC_ALWAYS),
+                fsync_interval=Conf.get(SSPL_CONF,
+                    f"{self.PROCESSOR}>{self.QUEUE_FSYNC_INTERVAL}",
+                    SegmentLog.DEFAULT_FSYNC_INTERVAL))
+            self._migrate_store_messages()
+            return
+
         self._current_size = store.get(self.SSPL_MEMORY_USAGE)
         if self._current_size is None:
             store.put(0, self.SSPL_MEMORY_USAGE)
 
-        self.SSPL_MESSAGE_HEAD_INDEX = os.path.join(self.cache_dir_path, 'SSPL_MESSAGE_HEAD_INDEX')
         self._head = store.get(self.SSPL_MESSAGE_HEAD_INDEX)
         if self._head is None:
             store.put(0, self.SSPL_MESSAGE_HEAD_INDEX)
 
-        self.SSPL_MESSAGE_TAIL_INDEX = os.path.join(self.cache_dir_path, 'SSPL_MESSAGE_TAIL_INDEX')
         self._tail = store.get(self.SSPL_MESSAGE_TAIL_INDEX)
         if self._tail is None:
             store.put(0, self.SSPL_MESSAGE_TAIL_INDEX)
-        self.SSPL_UNSENT_MESSAGES = os.path.join(self.cache_dir_path, 'MESSAGES')
+
+    def _migrate_store_messages(self):
+        """Move messages left by the store backend into the segment log."""
+        head = store.get(self.SSPL_MESSAGE_HEAD_INDEX)
+        tail = store.get(self.SSPL_MESSAGE_TAIL_INDEX)
+        if not isinstance(head, int) or not isinstance(tail, int) or \
+                head >= tail:
+            return
+        items = []
+        for index in range(head, tail):
+            item = store.get(f"{self.SSPL_UNSENT_MESSAGES}/{index}")
+            if item is not None:
+                items.append(item)
+        self._log.append(items)
+        self._log.flush()
+        for index in range(head, tail):
+            store.delete(f"{self.SSPL_UNSENT_MESSAGES}/{index}")
+        store.put(0, self.SSPL_MESSAGE_HEAD_INDEX)
+        store.put(0, self.SSPL_MESSAGE_TAIL_INDEX)
+        store.put(0, self.SSPL_MEMORY_USAGE)
+        logger.info(f"StoreQueue, migrated {len(items)} unsent messages"
+                    " to segment log")
 
     @property
     def current_size(self):
+        if self._log is not None:
+            return self._log.size
         return store.get(self.SSPL_MEMORY_USAGE)
 
     @current_size.setter
@@ -80,6 +139,8 @@ class StoreQueue:
         store.put(index, self.SSPL_MESSAGE_TAIL_INDEX)
 
     def is_empty(self):
+        if self._log is not None:
+            return self._log.is_empty()
         if self.tail == self.head:
             self.head = 0
             self.tail = 0
@@ -92,6 +153,13 @@ class StoreQueue:
         return (self.current_size + size_of_item) >= self._max_size
 
     def _create_space(self, size_of_item, reclaimed_space=0):
+        if self._log is not None:
+            dropped = 0
+            while self._log.size and \
+                    (self._log.size + size_of_item) >= self._max_size:
+                dropped += self._log.consume(1)
+            logger.debug(f"StoreQueue, _create_space, removed {dropped} old messages")
+            return
         if (self.current_size - reclaimed_space + size_of_item) >= self._max_size:
             reclaimed_space += sys.getsizeof(self.get())
             self._create_space(size_of_item, reclaimed_space)
@@ -99,12 +167,28 @@ class StoreQueue:
             return
 
     def get(self):
+        if self._log is not None:
+            items = self._log.peek(1)
+            return items[0] if items else None
         if self.is_empty():
             return
         item = store.get(f"{self.SSPL_UNSENT_MESSAGES}/{self.head}")
         return item
 
+    def get_many(self, count):
+        """Return up to count oldest messages without removing them."""
+        if self._log is not None:
+            return self._log.peek(count)
+        items = []
+        head, tail = self.head, self.tail
+        for index in range(head, min(head + count, tail)):
+            items.append(store.get(f"{self.SSPL_UNSENT_MESSAGES}/{index}"))
+        return items
+
     def delete(self):
+        if self._log is not None:
+            self._log.consume(1)
+            return
         if self.is_empty():
             return
         item = store.get(f"{self.SSPL_UNSENT_MESSAGES}/{self.head}")
@@ -112,13 +196,42 @@ class StoreQueue:
         self.head += 1
         self.current_size -= sys.getsizeof(item)
 
+    def delete_many(self, count):
+        """Remove up to count oldest messages."""
+        if self._log is not None:
+            self._log.consume(count)
+            return
+        for _ in range(count):
+            if self.is_empty():
+                return
+            self.delete()
+
     def put(self, item):
-        size_of_item = sys.getsizeof(item)
-        if self.is_full(size_of_item):
-            logger.debug("StoreQueue, put, consul memory usage exceded limit, \
-                removing old message")
-            self._create_space(size_of_item)
-        store.put(item, f"{self.SSPL_UNSENT_MESSAGES}/{self.tail}", pickled=False)
-        self.tail += 1
-        self.current_size += size_of_item
-        logger.debug("StoreQueue, put, current memory usage %s" % self.current_size)
+        self.put_many([item])
+
+    def put_many(self, items):
+        """Append messages, written as a single batch by the segment log."""
+        if self._log is not None:
+            size_of_items = sum(len(item) for item in items)
+            if self.is_full(size_of_items):
+                logger.debug("StoreQueue, put_many, persistent memory usage"
+                             " exceeded limit, removing old messages")
+                self._create_space(size_of_items)
+            self._log.append(items)
+            logger.debug("StoreQueue, put_many, current memory usage %s" % self._log.size)
+            return
+        for item in items:
+            size_of_item = sys.getsizeof(item)
+            if self.is_full(size_of_item):
+                logger.debug("StoreQueue, put, consul memory usage exceded limit, \
+                    removing old message")
+                self._create_space(size_of_item)
+            store.put(item, f"{self.SSPL_UNSENT_MESSAGES}/{self.tail}", pickled=False)
+            self.tail += 1
+            self.current_size += size_of_item
+            logger.debug("StoreQueue, put, current memory usage %s" % self.current_size)
+
+    def flush(self):
+        """Persist buffered writes and the queue position."""
+        if self._log is not None:
+            self._log.flush()
@@ -21,7 +21,11 @@
 """
 
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import Timeout, ConnectionError, HTTPError
 from framework.base.sspl_constants import SSPL_LOG_PATH
 from framework.utils.service_logging import init_logging, logger
@@ -45,11 +49,56 @@ class WebServices(object):
 
     LOOPBACK = "127.0.0.1"
 
-    def __init__(self):
+    # Keep-alive connections kept, and requests in flight, per host
+    MAX_CONNECTIONS_PER_HOST = 4
+
+    def __init__(self, max_connections_per_host=MAX_CONNECTIONS_PER_HOST):
         super(WebServices, self).__init__()
 
         init_logging("sspl", SSPL_LOG_PATH)
         self.http_methods = [self.HTTP_GET, self.HTTP_POST]
+        self._max_connections = max_connections_per_host
+        self._session = None
+        self._executor = None
+        self._lock = threading.Lock()
+
+    @property
+    def session(self):
+        """Pooled keep-alive session shared by all requests."""
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    session = requests.Session()
+                    # Block instead of opening extra connections beyond the
+                    # per host limit when all pooled ones are busy
+                    adapter = HTTPAdapter(pool_connections=2,
+                                          pool_maxsize=self._max_connections,
+                                          pool_block=True)
+                    session.mount("http://", adapter)
+                    session.mount("https://", adapter)
+                    self._session = session
+        return self._session
+
+    @property
+    def executor(self):
+        """Bounded thread pool for concurrent requests."""
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self._max_connections,
+                        thread_name_prefix="ws_request")
+        return self._executor
+
+    def close(self):
+        """Release pooled connections and worker threads."""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
 
     def ws_request(self, method, url, hdrs, postdata, tout):
         """Make webservice request"""
@@ -57,9 +106,9 @@ class WebServices(object):
 
         try:
             if method == self.HTTP_GET:
-                wsresponse = requests.get(url, headers=hdrs, timeout=tout)
+                wsresponse = self.session.get(url, headers=hdrs, timeout=tout)
             elif method == self.HTTP_POST:
-                wsresponse = requests.post(url, headers=hdrs, data=postdata,
+                wsresponse = self.session.post(url, headers=hdrs, data=postdata,
                                timeout=tout)
 
             wsresponse.raise_for_status()
@@ -110,6 +159,22 @@ class WebServices(object):
 
         return wsresponse
 
+    def ws_request_many(self, requests_list):
+        """Make several webservice requests concurrently.
+
+        requests_list holds (method, url, hdrs, postdata, tout) tuples,
+        responses are returned in the same order.
+        """
+        return self.map_concurrent(
+            lambda req: self.ws_request(*req), requests_list)
+
+    def map_concurrent(self, func, items):
+        """Call func on each item using the bounded pool, results in order."""
+        items = list(items)
+        if len(items) <= 1:
+            return [func(item) for item in items]
+        return list(self.executor.map(func, items))
+
     def ws_get(self, url, headers, timeout):
         """Webservice GET request"""
         return  self.ws_request(self.HTTP_GET, url, headers, None, timeout)
@@ -21,11 +21,10 @@
 """
 
 import os
-import json
-from jsonschema import Draft3Validator
-from jsonschema import validate
 
 from json_msgs.messages.base_msg import BaseMsg
+from json_msgs.messages.schema_registry import (get_validator,
+                                                validation_enabled)
 from json_msgs.schemas import actuators
 from framework.base.sspl_constants import RESOURCE_PATH
 
@@ -43,14 +42,11 @@ class BaseActuatorMsg(BaseMsg):
         """Reads in the json schema for all actuator response messages"""
         super(BaseActuatorMsg, self).__init__()
 
-        # Read in the schema for validating messages
+        # Actuator schema validator, read and checked once per process
         fileName = os.path.join(RESOURCE_PATH + '/actuators',
                                 self.JSON_ACTUATOR_SCHEMA)
-        with open(fileName, 'r') as f:
-            self._schema = json.load(f)
-
-        # Validate the schema
-        Draft3Validator.check_schema(self._schema)
+        self._validator = get_validator("actuator_response_type", fileName)
+        self._schema = self._validator.schema
 
     def validateMsg(self, _jsonMsg):
         """Validate the json message against the schema"""
@@ -59,5 +55,6 @@ class BaseActuatorMsg(BaseMsg):
         self.prepare_message(_jsonMsg, "actuator_response_type")
 
         _jsonMsg = self.normalize_kv(_jsonMsg)
-        validate(_jsonMsg, self._schema)
+        if validation_enabled():
+            self._validator.validate(_jsonMsg)
         return _jsonMsg
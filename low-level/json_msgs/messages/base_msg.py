@@ -21,12 +21,11 @@
 """
 
 import abc
-from framework.utils.service_logging import logger
+from framework.utils.service_logging import logger, debug_enabled
 from framework.utils.conf_utils import (GLOBAL_CONF, SITE_ID_KEY,
         RACK_ID_KEY, NODE_ID_KEY, CLUSTER_ID_KEY, Conf)
 from framework.base.sspl_constants import (DEFAULT_DC, DEFAULT_RACK,
         DEFAULT_SN, DEFAULT_CLUSTER)
-from cortx.utils.kv_store import KvPayload
 
 class BaseMsg(metaclass=abc.ABCMeta):
     '''
@@ -37,6 +36,8 @@ class BaseMsg(metaclass=abc.ABCMeta):
     SCHEMA_VERSION  = "1.0.0"
     SSPL_VERSION    = "2.0.0"
 
+    # site_id, rack_id, node_id and cluster_id of this node, read once
+    _identity = None
 
     def __init__(self):
         pass
@@ -45,28 +46,32 @@ class BaseMsg(metaclass=abc.ABCMeta):
     def getJson(self):
         raise NotImplementedError("Subclasses should implement this!")
 
+    @classmethod
+    def get_identity(cls):
+        """Returns the common key fields of this node, read once"""
+        if BaseMsg._identity is None:
+            BaseMsg._identity = {
+                "site_id": Conf.get(GLOBAL_CONF, SITE_ID_KEY, DEFAULT_DC),
+                "node_id": Conf.get(GLOBAL_CONF, NODE_ID_KEY, DEFAULT_SN),
+                "rack_id": Conf.get(GLOBAL_CONF, RACK_ID_KEY, DEFAULT_RACK),
+                "cluster_id": Conf.get(GLOBAL_CONF, CLUSTER_ID_KEY,
+                                       DEFAULT_CLUSTER)
+                }
+        return BaseMsg._identity
+
     def prepare_message(self, jsonMsg, message_type):
         """Adds all common key fields to the JsonMsg"""
         try:
-            if jsonMsg.get("message").get(
-                message_type).get("info") is None:
+            info = jsonMsg.get("message").get(message_type).get("info")
+            if info is None:
                 return
-            payload = KvPayload(jsonMsg)
-            if payload.get(f"message>{message_type}>info>site_id") is None:
-                jsonMsg["message"][message_type]["info"]["site_id"] = Conf.get(
-                    GLOBAL_CONF, SITE_ID_KEY, DEFAULT_DC)
-            if payload.get(f"message>{message_type}>info>node_id") is None:
-                jsonMsg["message"][message_type]["info"]["node_id"] = Conf.get(
-                    GLOBAL_CONF, NODE_ID_KEY, DEFAULT_SN)
-            if payload.get(f"message>{message_type}>info>rack_id") is None:
-                jsonMsg["message"][message_type]["info"]["rack_id"] = Conf.get(
-                    GLOBAL_CONF, RACK_ID_KEY, DEFAULT_RACK)
-            if payload.get(f"message>{message_type}>info>cluster_id") is None:
-                jsonMsg["message"][message_type]["info"]["cluster_id"] = Conf.get(
-                    GLOBAL_CONF, CLUSTER_ID_KEY, DEFAULT_CLUSTER)
-            if payload.get(f"message>{message_type}>info>fru") is None:
-                jsonMsg["message"][message_type]["info"]["fru"] = "false"
-            logger.debug("prepare_message, jsonMsg: %s" % jsonMsg)
+            for key, value in self.get_identity().items():
+                if info.get(key) is None:
+                    info[key] = value
+            if info.get("fru") is None:
+                info["fru"] = "false"
+            if debug_enabled():
+                logger.debug(f"prepare_message, jsonMsg: {jsonMsg}")
         except KeyError as ex:
             logger.exception(f"Failed to prepare json message. JsonMsg:{jsonMsg}."
                          f"Error:{str(ex)}")
@@ -0,0 +1,95 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+"""
+ ****************************************************************************
+  Description:       Process wide registry of compiled JSON schema
+                    validators for transmitted messages.
+
+                    Each schema is read and checked once, on first use by a
+                    message type, instead of on every message construction.
+                    Validation of outgoing messages can be restricted to
+                    debug log level with SSPL_LL_SETTING>message_validation.
+ ****************************************************************************
+"""
+
+import json
+import threading
+
+from jsonschema import Draft3Validator
+
+from framework.utils.service_logging import logger
+
+# Validate every outgoing message
+VALIDATE_ALWAYS = "always"
+# Validate only when SYSTEM_INFORMATION>log_level is DEBUG
+VALIDATE_DEBUG = "debug"
+
+_validators = {}
+_validators_lock = threading.Lock()
+_validation_mode = None
+
+
+def get_validator(message_type, schema_file):
+    """Return the Draft3Validator of schema_file, compiled once per process.
+
+    Validators are keyed by message type, e.g. sensor_response_type, and
+    schema file, so a message type can only use one schema at a time.
+    """
+    key = (message_type, schema_file)
+    validator = _validators.get(key)
+    if validator is None:
+        with _validators_lock:
+            validator = _validators.get(key)
+            if validator is None:
+                with open(schema_file, 'r') as f:
+                    # Remove tabs and newlines
+                    schema = json.loads(' '.join(f.read().split()))
+                Draft3Validator.check_schema(schema)
+                validator = Draft3Validator(schema)
+                _validators[key] = validator
+    return validator
+
+
+def get_validation_mode():
+    """Return the configured message_validation mode, read once."""
+    global _validation_mode
+    if _validation_mode is None:
+        # Imported here as reading sspl config needs cortx-utils
+        from framework.utils.conf_utils import (SSPL_CONF, Conf, LOG_LEVEL,
+                                                SSPL_LL_SETTING,
+                                                SYSTEM_INFORMATION)
+        mode = Conf.get(SSPL_CONF, f"{SSPL_LL_SETTING}>message_validation",
+                        VALIDATE_ALWAYS)
+        if mode not in (VALIDATE_ALWAYS, VALIDATE_DEBUG):
+            logger.warn(f"Invalid message_validation '{mode}', "
+                        f"using '{VALIDATE_ALWAYS}'")
+            mode = VALIDATE_ALWAYS
+        if mode == VALIDATE_DEBUG and Conf.get(SSPL_CONF,
+                f"{SYSTEM_INFORMATION}>{LOG_LEVEL}", "INFO") == "DEBUG":
+            mode = VALIDATE_ALWAYS
+        _validation_mode = mode
+    return _validation_mode
+
+
+def set_validation_mode(mode):
+    """Override the configured mode, None reads the config again."""
+    global _validation_mode
+    _validation_mode = mode
+
+
+def validation_enabled():
+    """True if outgoing messages have to be validated."""
+    return get_validation_mode() == VALIDATE_ALWAYS
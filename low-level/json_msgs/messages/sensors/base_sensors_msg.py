@@ -21,11 +21,10 @@
 """
 
 import os
-import json
-from jsonschema import Draft3Validator
-from jsonschema import validate
 
 from json_msgs.messages.base_msg import BaseMsg
+from json_msgs.messages.schema_registry import (get_validator,
+                                                validation_enabled)
 from json_msgs.schemas import sensors
 from framework.base.sspl_constants import RESOURCE_PATH
 
@@ -43,17 +42,11 @@ class BaseSensorMsg(BaseMsg):
         """Reads in the json schema for all sensor response messages"""
         super(BaseSensorMsg, self).__init__()
 
-        # Read in the sensor schema for validating messages
+        # Sensor schema validator, read and checked once per process
         fileName = os.path.join(RESOURCE_PATH + '/sensors',
                                 self.JSON_SENSOR_SCHEMA)
-        with open(fileName, 'r') as f:
-            _schema = f.read()
-
-        # Remove tabs and newlines
-        self._schema = json.loads(' '.join(_schema.split()))
-
-        # Validate the schema
-        Draft3Validator.check_schema(self._schema)
+        self._validator = get_validator("sensor_response_type", fileName)
+        self._schema = self._validator.schema
 
     def validateMsg(self, _jsonMsg):
         """Validate the json message against the schema"""
@@ -62,5 +55,6 @@ class BaseSensorMsg(BaseMsg):
         self.prepare_message(_jsonMsg, "sensor_response_type")
 
         _jsonMsg = self.normalize_kv(_jsonMsg)
-        validate(_jsonMsg, self._schema)
+        if validation_enabled():
+            self._validator.validate(_jsonMsg)
         return _jsonMsg
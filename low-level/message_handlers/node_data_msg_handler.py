@@ -273,16 +273,13 @@ class NodeDataMsgHandler(ScheduledModuleThread, InternalMsgQ):
             # Delay for the desired interval if it's greater than zero
             if self._transmit_interval > 0:
                 logger.debug("self._transmit_interval:{}".format(self._transmit_interval))
-                timer = self._transmit_interval
-                while timer > 0:
-                    # See if the message queue contains an entry and process
-                    jsonMsg, _ = self._read_my_msgQ_noWait()
+                # Serve requests as soon as they arrive until data is due
+                deadline = time.monotonic() + self._transmit_interval
+                while time.monotonic() < deadline:
+                    jsonMsg, _ = self._read_my_msgQ_until(deadline)
                     if jsonMsg is not None:
                         self._process_msg(jsonMsg)
 
-                    time.sleep(1)
-                    timer -= 1
-
                 # Generate the JSON messages with data from the node and transmit on regular interval
                 self._generate_host_update()
                 self._generate_cpu_data()
@@ -32,7 +32,7 @@ import uuid
 from datetime import datetime, timedelta
 
 import dbus
-from dbus import Array, Interface, SystemBus
+from dbus import Interface, SystemBus
 from dbus.mainloop.glib import DBusGMainLoop
 from gi.repository import GObject as gobject
 from zope.interface import implementer
@@ -42,6 +42,8 @@ from framework.base.module_thread import SensorThread
 from framework.base.sspl_constants import cs_products
 from framework.messaging.egress_processor import \
     EgressProcessor
+from framework.platforms.server.udisks2 import (get_udisks2_tree,
+                                                sanitize_dbus_value)
 from framework.utils.conf_utils import DATA_PATH_KEY, SSPL_CONF, Conf
 from framework.utils.service_logging import logger
 from framework.utils.severity_reader import SeverityReader
@@ -52,6 +54,7 @@ from message_handlers.node_data_msg_handler import NodeDataMsgHandler
 from sensors.ISystem_monitor import ISystemMonitor
 from framework.utils.mon_utils import MonUtils
 from framework.utils.iem import Iem
+from framework.utils import snapshot_cache
 from framework.utils.os_utils import OSUtils
 store = file_store
 
@@ -151,6 +154,10 @@ class DiskMonitor(SensorThread, InternalMsgQ):
         # Dict of drives by device name from systemd
         self._drive_by_device_name = {}
 
+        # UDisks2 objects shared with the disk health and manifest, once
+        # watched the tree applies each signal before our callbacks
+        self._disk_tree = get_udisks2_tree()
+
         # Dict of drives by path
         self._drives = {}
 
@@ -241,9 +248,10 @@ class DiskMonitor(SensorThread, InternalMsgQ):
             self._disk_manager = Interface(disk_systemd,
                 dbus_interface='org.freedesktop.DBus.ObjectManager')
 
-            # Assign callbacks to all devices to capture signals
-            self._disk_manager.connect_to_signal('InterfacesAdded', self._interface_added)
-            self._disk_manager.connect_to_signal('InterfacesRemoved', self._interface_removed)
+            # Keep the object tree up to date and assign callbacks to
+            # capture signals of all devices
+            self._disk_tree.watch(self._bus, self._disk_manager)
+            self._disk_tree.add_listener(self._interface_added, self._interface_removed)
 
             # Notify DiskMsgHandler of available drives and schedule SMART tests
             self._init_drives()
@@ -363,7 +371,7 @@ class DiskMonitor(SensorThread, InternalMsgQ):
             self._log_debug(f"_processMsg, sensor_request_type: {sensor_request_type}, uuid: {uuid}")
 
             # Refresh the set of managed systemd objects
-            self._disk_objects = self._disk_manager.GetManagedObjects()
+            self._disk_objects = self._disk_tree.get_objects()
 
             # Get a list of all the drive devices available in systemd
             re_drive = re.compile('(?P<path>.*?/drives/(?P<id>.*))')
@@ -476,42 +484,27 @@ class DiskMonitor(SensorThread, InternalMsgQ):
     def _update_by_id_paths(self):
         """Updates the global dict of by-id symlinks for each drive"""
 
-        # Refresh the set of managed systemd objects
-        self._disk_objects = self._disk_manager.GetManagedObjects()
-
-        # Get a list of all the block devices available in systemd
-        re_blocks = re.compile('(?P<path>.*?/block_devices/(?P<id>.*))')
-        block_devs = [m.groupdict() for m in
-                      [re_blocks.match(path) for path in list(self._disk_objects.keys())]
-                      if m]
+        # Refresh the set of managed systemd objects, the tree is kept
+        # up to date by signals so this is no D-Bus round trip
+        self._disk_objects = self._disk_tree.get_objects()
 
         # Retrieve the by-id symlink for each drive and save in a dict with the drive path as key
-        for block_dev in block_devs:
-            try:
-                if self._disk_objects[block_dev['path']].get('org.freedesktop.UDisks2.Block') is not None:
-                    # Obtain the list of symlinks for the block device
-                    udisk_block = self._disk_objects[block_dev['path']]["org.freedesktop.UDisks2.Block"]
-                    symlinks = self._sanitize_dbus_value(udisk_block["Symlinks"])
-
-                    # Parse out the wwn symlink if it exists otherwise use the by-id
-                    for symlink in symlinks:
-                        if "wwwn" in symlink:
-                            self._drive_by_id[udisk_block["Drive"]] = symlink
-                        elif "by-id" in symlink:
-                            self._drive_by_id[udisk_block["Drive"]] = symlink
-                        # TODO:  Improve logic for getting resource_id
-                        # Current approch for getting resource_id is to check "phy" in by-path
-                        # symlink. If "phy" is in by-path use path of that drive for resource_id
-                        elif "by-path" in symlink:
-                            if "phy" in symlink:
-                                self._drive_by_path[udisk_block["Drive"]] = symlink[len("/dev/disk/by-path/"):]
-
-                    # Maintain a dict of device names
-                    device = self._sanitize_dbus_value(udisk_block["Device"])
-                    self._drive_by_device_name[udisk_block["Drive"]] = device
-
-            except Exception as ae:
-                self._log_debug("block_dev unusable: %r" % ae)
+        for drive_path, (device, symlinks) in self._disk_tree.get_drive_blocks().items():
+            # Parse out the wwn symlink if it exists otherwise use the by-id
+            for symlink in symlinks:
+                if "wwwn" in symlink:
+                    self._drive_by_id[drive_path] = symlink
+                elif "by-id" in symlink:
+                    self._drive_by_id[drive_path] = symlink
+                # TODO:  Improve logic for getting resource_id
+                # Current approch for getting resource_id is to check "phy" in by-path
+                # symlink. If "phy" is in by-path use path of that drive for resource_id
+                elif "by-path" in symlink:
+                    if "phy" in symlink:
+                        self._drive_by_path[drive_path] = symlink[len("/dev/disk/by-path/"):]
+
+            # Maintain a dict of device names
+            self._drive_by_device_name[drive_path] = device
 
     def _schedule_SMART_test(self, drive_path, test_type ="short", serial_number =None):
         """Schedules a SMART test to be executed on a drive
@@ -597,12 +590,12 @@ class DiskMonitor(SensorThread, InternalMsgQ):
                     }
                 }
         """
-        drives = self._disk_manager.GetManagedObjects()
+        drives = self._disk_tree.get_drives()
 
-        return {obj_path : { self.DRIVE_DBUS_INFO: interfaces_and_property["org.freedesktop.UDisks2.Drive"],
+        return {obj_path : { self.DRIVE_DBUS_INFO: udisk_drive,
                              'node_disk': self._is_local_drive(obj_path)}
-                        for obj_path, interfaces_and_property in drives.items()
-                        if "drive" in obj_path and is_physical_drive(interfaces_and_property["org.freedesktop.UDisks2.Drive"])}
+                        for obj_path, udisk_drive in drives.items()
+                        if is_physical_drive(udisk_drive)}
 
     def _get_resource_type(self, object_path):
         if self._drives[object_path]["node_disk"]:
@@ -809,12 +802,13 @@ class DiskMonitor(SensorThread, InternalMsgQ):
                         return
                     self._smart_jobs[object_path] = None
 
-                    # Loop through all the currently managed objects and retrieve the smart status
-                    for disk_path, interfaces_and_properties in list(self._disk_objects.items()):
+                    # Loop through all the currently managed objects and retrieve the smart status,
+                    # PropertiesChanged signals keep the status in the tree current
+                    for disk_path, interfaces_and_properties in self._disk_tree.get_objects().items():
                         if disk_path in smart_job["Objects"]:
                             # Get the SMART test results and the serial number
-                            udisk_drive     = self._disk_objects[disk_path]['org.freedesktop.UDisks2.Drive']
-                            udisk_drive_ata = self._disk_objects[disk_path]['org.freedesktop.UDisks2.Drive.Ata']
+                            udisk_drive     = interfaces_and_properties['org.freedesktop.UDisks2.Drive']
+                            udisk_drive_ata = interfaces_and_properties['org.freedesktop.UDisks2.Drive.Ata']
                             smart_status    = str(udisk_drive_ata["SmartSelftestStatus"])
                             serial_number   = str(udisk_drive["Serial"])
 
@@ -958,6 +952,8 @@ class DiskMonitor(SensorThread, InternalMsgQ):
                 }
         # Send the event to disk message handler to generate json message
         self._write_internal_msgQ(DiskMsgHandler.name(), msg)
+        # Resource map queries need to see the new drive state
+        snapshot_cache.invalidate("disk", "lshw")
 
     def _notify_msg_handler_sn_device_mappings(self, disk_path, serial_number):
         """Sends an internal msg to handlers who need to maintain a
@@ -979,32 +975,6 @@ class DiskMonitor(SensorThread, InternalMsgQ):
         # Send the event to Node Data message handler to generate json message
         self._write_internal_msgQ(NodeDataMsgHandler.name(), internal_json_msg)
 
-    def _sanitize_dbus_value(self, value):
-        """Convert certain DBus type combinations so that they are easier to read"""
-        if isinstance(value, Array) and value.signature == "ay":
-            try:
-                return self._decode_ay(value)
-            except:
-                # Try an array of arrays; 'aay' which is the symlinks
-                return list(map(self._decode_ay, value or ()))
-        elif isinstance(value, Array) and value.signature == "y":
-            return bytearray(value).rstrip(bytearray((0,))).decode('utf-8')
-        else:
-            return value
-
-    def _decode_ay(self, value):
-        """Convert binary blob from DBus queries to strings"""
-        if len(value) == 0 or \
-           value is None:
-            return ''
-        elif isinstance(value, str):
-            return value
-        elif isinstance(value, bytes):
-            return value.decode('utf-8')
-        else:
-            # dbus.Array([dbus.Byte]) or any similar sequence type:
-            return bytearray(value).rstrip(bytearray((0,))).decode('utf-8')
-
     def _print_interfaces_and_properties(self, interfaces_and_properties):
         """
         Print a collection of interfaces and properties exported by some object
@@ -1016,7 +986,7 @@ class DiskMonitor(SensorThread, InternalMsgQ):
         for interface_name, properties in list(interfaces_and_properties.items()):
             self._log_debug(f"  Interface {interface_name}")
             for prop_name, prop_value in list(properties.items()):
-                prop_value = self._sanitize_dbus_value(prop_value)
+                prop_value = sanitize_dbus_value(prop_value)
                 self._log_debug(f"  {prop_name}: {prop_value}")
 
     def _getSMART_interval(self):
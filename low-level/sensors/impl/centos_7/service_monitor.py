@@ -37,6 +37,7 @@ from framework.utils.conf_utils import (SSPL_CONF, Conf)
 from framework.utils.iem import Iem
 from framework.utils.mon_utils import MonUtils
 from framework.utils.service_logging import logger
+from framework.utils import snapshot_cache
 from framework.utils.severity_reader import SeverityReader
 from framework.utils.store_factory import store
 from framework.utils.os_utils import OSUtils
@@ -555,6 +556,8 @@ class ServiceMonitor(SensorThread, InternalMsgQ):
             "alert_type"]
         self.raise_iem(service, alert_type)
         self._write_internal_msgQ(ServiceMsgHandler.name(), message)
+        # Resource map queries need to see the new service state
+        snapshot_cache.invalidate("cortx_sw_services", "external_sw_services")
         self.services[service].dump_to_cache()
 
     def suspend(self):
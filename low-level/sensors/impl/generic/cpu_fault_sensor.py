@@ -46,6 +46,7 @@ class CPUFaultSensor(SensorThread, InternalMsgQ):
 
     SENSOR_NAME = "CPUFaultSensor"
     PRIORITY = 1
+    SHARED_SCHEDULER = True
     RESOURCE_TYPE = "node:os:cpu:core"
 
     # Section in the configuration store
@@ -19,7 +19,6 @@
                     to message bus.
   ****************************************************************************
 """
-import csv
 import datetime
 import errno
 import os
@@ -27,7 +26,6 @@ import select
 import subprocess
 import threading
 import time
-from functools import lru_cache
 
 from framework.base.internal_msgQ import InternalMsgQ
 from framework.base.module_thread import SensorThread
@@ -36,6 +34,8 @@ from framework.base.sspl_constants import (PRODUCT_FAMILY,
                                            iem_severity_types,
                                            iem_source_types)
 from framework.utils.conf_utils import SSPL_CONF, Conf
+from framework.utils.iec_mapping import IECMapping
+from framework.utils.log_tailer import LogTailer
 from framework.utils.service_logging import logger
 from json_msgs.messages.sensors.iem_data import IEMDataMsg
 from framework.messaging.egress_processor import EgressProcessor
@@ -79,6 +79,8 @@ class IEMSensor(SensorThread, InternalMsgQ):
     IEC_KEYWORD = "IEC"
 
     IEC_MAPPING_DIR_PATH=f"/opt/seagate/{PRODUCT_FAMILY}/iem/iec_mapping"
+    # Pickled IEC mapping index, kept next to the timestamp file
+    IEC_MAPPING_CACHE_FILE = "iec_mapping.pickle"
 
     # Dependency list
     DEPENDENCIES = {
@@ -110,6 +112,8 @@ class IEMSensor(SensorThread, InternalMsgQ):
         self._timestamp_file_path = None
         self._iem_logs = None
         self._iem_log_file_lock = threading.Lock()
+        self._read_iem_event = None
+        self._iec_mapping = None
 
     def initialize(self, conf_reader, msgQlist, products):
         """initialize configuration reader and internal msg queues"""
@@ -127,6 +131,10 @@ class IEMSensor(SensorThread, InternalMsgQ):
 
         self._timestamp_file_path = Conf.get(SSPL_CONF, f"{self.SENSOR_NAME.upper()}>{self.TIMESTAMP_FILE_PATH_KEY}",
                 self.DEFAULT_TIMESTAMP_FILE_PATH)
+
+        self._iec_mapping = IECMapping(self.IEC_MAPPING_DIR_PATH,
+            os.path.join(os.path.dirname(self._timestamp_file_path),
+                         self.IEC_MAPPING_CACHE_FILE))
         return True
 
     def read_data(self):
@@ -141,25 +149,24 @@ class IEMSensor(SensorThread, InternalMsgQ):
         # Check for debug mode being activated
         self._read_my_msgQ_noWait()
         try:
-            with self._iem_log_file_lock:
-                self._iem_logs = open(self._log_file_path)
             self._create_file(self._timestamp_file_path)
-
-            with open(self._timestamp_file_path, "r") as timestamp_file:
-                last_processed_log_timestamp = timestamp_file.read().strip()
-
-            # Read and send unprocessed messages
+            # The timestamp file holds the position reached in the log
             with self._iem_log_file_lock:
-                for iem_log in self._iem_logs:
-                    log = iem_log.rstrip()
-                    log_timestamp = log[:log.index(" ")]
-                    if not last_processed_log_timestamp or log_timestamp > last_processed_log_timestamp:
-                        self._process_iem(log)
+                if self._iem_logs:
+                    self._iem_logs.close()
+                self._iem_logs = LogTailer(self._log_file_path,
+                                           self._timestamp_file_path)
+                self._iem_logs.open(start_after=self._get_offset_after)
 
             # Reset debug mode if persistence is not enabled
             self._disable_debug_if_persist_false()
 
-            # Read new messages
+            # Read unprocessed and new messages
+            if self._read_iem_event is not None:
+                try:
+                    self._scheduler.cancel(self._read_iem_event)
+                except ValueError:
+                    pass
             self._read_iem()
 
         except IOError as io_error:
@@ -167,20 +174,39 @@ class IEMSensor(SensorThread, InternalMsgQ):
         except Exception as exception:
             raise Exception(f"Failed in monitoring IEM, {exception.args}")
 
-        self._scheduler.enter(10, self._priority, self.run, ())
+    def _get_offset_after(self, last_processed_log_timestamp):
+        """Offset of the first log newer than a timestamp checkpoint
+        written by earlier versions"""
+        def is_newer(log):
+            return log[:log.find(" ")] > last_processed_log_timestamp
+        return self._iem_logs.scan_offset(is_newer)
 
     def _read_iem(self):
         try:
             with self._iem_log_file_lock:
-                for iem_log in self._iem_logs:
-                    self._process_iem(iem_log.rstrip())
+                while True:
+                    iem_logs = self._iem_logs.read_lines()
+                    for iem_log in iem_logs:
+                        if not iem_log:
+                            continue
+                        try:
+                            self._process_iem(iem_log)
+                        except Exception as err:
+                            # Skip it, it would fail again after restart
+                            logger.error(f"IEMSensor, failed to process "
+                                         f"'{iem_log}': {err}")
+                    # One checkpoint write per batch
+                    self._iem_logs.save_checkpoint()
+                    if len(iem_logs) < LogTailer.DEFAULT_BATCH_SIZE:
+                        break
         except IOError as io_error:
             raise Exception(
                 f"IEMSensor, self._read_iem, {io_error.args} {io_error.filename}")
         except Exception as exception:
             raise Exception(f"IEMSensor, self._read_iem, {exception.args}")
 
-        self._scheduler.enter(10, self._priority, self._read_iem, ())
+        self._read_iem_event = self._scheduler.enter(
+            10, self._priority, self._read_iem, ())
 
     def _process_iem(self, iem_log):
         log_timestamp = iem_log[:iem_log.index(" ")]
@@ -189,8 +215,6 @@ class IEMSensor(SensorThread, InternalMsgQ):
         if iem_components:
             logger.debug("IEM mesage {} {}".format(log_timestamp, iem_components))
             self._send_msg(iem_components, log_timestamp)
-        with open(self._timestamp_file_path, "w") as timestamp_file:
-            timestamp_file.write(log_timestamp)
 
     def _send_msg(self, iem_components, log_timestamp):
         """Creates JSON message from iem components and sends to message bus.
@@ -264,37 +288,11 @@ class IEMSensor(SensorThread, InternalMsgQ):
 
     def _get_component(self, component):
         "Decode a component"
-        if os.path.exists(f"{self.IEC_MAPPING_DIR_PATH}/components"):
-            with open(f"{self.IEC_MAPPING_DIR_PATH}/components", newline='') as f:
-                reader = csv.reader(f)
-                for row in reader:
-                    if component == row[0]:
-                        return row[1]
-                else:
-                    return None
-        else:
-            return None
-
+        return self._iec_mapping.get_component(component)
 
-    @lru_cache(maxsize=32)
     def _decode_msg(self, code):
         "Decode a msg"
-
-        component_id, module_id, event_id = code[:3], code[3:6], code[6:]
-        component = self._get_component(component_id)
-        if component:
-            if os.path.exists(f"{self.IEC_MAPPING_DIR_PATH}/{component}"):
-                with open(f"{self.IEC_MAPPING_DIR_PATH}/{component}", newline='') as f:
-                    reader = csv.reader(f)
-                    for row in reader:
-                        if code == row[0]:
-                            return component, row[1], row[2]
-                    else:
-                       return component, module_id, event_id
-            else:
-                return component, module_id, event_id
-        else:
-            return component_id, module_id, event_id
+        return self._iec_mapping.decode(code)
 
     def _get_iem(self, log):
         """Returns a string starting from the word <IEC> from a syslog
@@ -395,11 +393,9 @@ class IEMSensor(SensorThread, InternalMsgQ):
             return None
 
     def refresh_file(self):
-        if os.path.exists(self._log_file_path):
-            with self._iem_log_file_lock:
-                if self._iem_logs:
-                    self._iem_logs.close()
-                    self._iem_logs = open(self._log_file_path)
+        """Called once the log is rotated. LogTailer notices the new inode
+        itself and reads the rest of the old log first."""
+        logger.debug(f"IEMSensor, {self._log_file_path} rotated")
 
     def shutdown(self):
         """Clean up scheduler queue and gracefully shutdown thread"""
@@ -24,7 +24,6 @@ import math
 import os
 import re
 import subprocess as sp
-import threading
 import time
 from datetime import datetime
 
@@ -34,13 +33,13 @@ from zope.interface import implementer
 from framework.base.debug import Debug
 from framework.utils.conf_utils import SSPL_CONF, Conf
 from framework.utils.config_reader import ConfigReader
+from framework.utils.cpu_load_sampler import CPULoadSampler
 from framework.utils.service_logging import logger
 from framework.utils.sysfs_interface import SysFS
 from framework.utils.tool_factory import ToolFactory
 from framework.utils.os_utils import OSUtils
 from sensors.INode_data import INodeData
-from framework.platforms.server.network import Network
-from framework.platforms.server.error import NetworkError
+from framework.platforms.server.network import InterfaceStateProvider
 
 
 @implementer(INodeData)
@@ -52,6 +51,9 @@ class NodeData(Debug):
 
     # conf attribute initialization
     PROBE = 'probe'
+    CPU_SAMPLE_INTERVAL = 'cpu_sample_interval'
+    BMC_LAN_CACHE_TTL = 'bmc_lan_cache_ttl'
+    DEFAULT_BMC_LAN_CACHE_TTL = 300
 
     @staticmethod
     def name():
@@ -73,14 +75,23 @@ class NodeData(Debug):
         self.cpus = psutil.cpu_count()
         self.host_id = self.os_utils.get_fqdn()
 
-        # Calculate the load averages on separate blocking threads
+        # Sample /proc/stat periodically for the per core load averages
         self.load_1min_average  = []
         self.load_5min_average  = []
         self.load_15min_average = []
         self.prev_bmcip = None
-        load_1min_avg  = threading.Thread(target=self._load_1min_avg).start()
-        load_5min_avg  = threading.Thread(target=self._load_5min_avg).start()
-        load_15min_avg = threading.Thread(target=self._load_15min_avg).start()
+        # 'ipmitool lan print' output and when it was read
+        self._bmc_lan_info = None
+        self._bmc_lan_read_time = 0
+        self._bmc_lan_cache_ttl = int(Conf.get(SSPL_CONF,
+            f"{self.name().capitalize()}>{self.BMC_LAN_CACHE_TTL}",
+            self.DEFAULT_BMC_LAN_CACHE_TTL))
+        self._if_state = InterfaceStateProvider()
+        sample_interval = int(Conf.get(SSPL_CONF,
+            f"{self.name().capitalize()}>{self.CPU_SAMPLE_INTERVAL}",
+            CPULoadSampler.DEFAULT_INTERVAL))
+        self._cpu_load_sampler = CPULoadSampler(self.cpus, sample_interval)
+        self._cpu_load_sampler.start()
 
         self.conf_reader = ConfigReader()
 
@@ -196,7 +207,9 @@ class NodeData(Debug):
         self.softirq_time   = int(cpu_data[6])
         self.steal_time     = int(cpu_data[7])
 
-        self.cpu_usage = psutil.cpu_percent(interval=1, percpu=False)
+        self.cpu_usage = self._cpu_load_sampler.cpu_usage
+        self.load_1min_average, self.load_5min_average, \
+            self.load_15min_average = self._cpu_load_sampler.load_averages()
         # Array to hold data about each CPU core
         self.cpu_core_data = []
         index = 0
@@ -222,10 +235,11 @@ class NodeData(Debug):
         # Array to hold data about each network interface
         self.if_data = []
         bmc_data = self._get_bmc_info()
+        # Read state and addresses of all interfaces once for this cycle
+        self._if_state.refresh()
         for interface, if_data in net_data.items():
             self._log_debug("_get_if_data, interface: %s %s" % (interface, net_data))
-            nw_status = self._fetch_nw_status()
-            nw_cable_conn_status = self.fetch_nw_cable_conn_status(interface)
+            nw_status, ipv4, nw_cable_conn_status = self._if_state.get(interface)
             if_data = {"ifId" : interface,
                        "networkErrors"      : (net_data[interface].errin +
                                                net_data[interface].errout),
@@ -235,41 +249,26 @@ class NodeData(Debug):
                        "droppedPacketsOut"  : net_data[interface].dropout,
                        "packetsOut"         : net_data[interface].packets_sent,
                        "trafficOut"         : net_data[interface].bytes_sent,
-                       "nwStatus"           : nw_status[interface][0],
-                       "ipV4"               : nw_status[interface][1],
+                       "nwStatus"           : nw_status,
+                       "ipV4"               : ipv4,
                        "nwCableConnStatus"  : nw_cable_conn_status
                        }
             self.if_data.append(if_data)
         self.if_data.append(bmc_data)
 
-    def _fetch_nw_status(self):
-        nw_dict = {}
-        nws = os.popen("ip --br a | awk '{print $1, $2, $3}'").read().split('\n')[:-1]
-        for nw in nws:
-            if nw.split(' ')[2]:
-                ip = nw.split(' ')[2].split("/")[0]
-            else:
-                ip = ""
-            nw_dict[nw.split(' ')[0]] = [nw.split(' ')[1], ip]
-        logger.debug("network info going is : {}".format(nw_dict))
-        return nw_dict
-
     def fetch_nw_cable_conn_status(self, interface):
-        carrier_status = None
-        try:
-            carrier_status = Network().get_link_state(interface)
-        except NetworkError as err:
-            # NetworkError i.e. all OSError exceptions indicate that
-            # the carrier file is not available to access which
-            # constitute the UNKOWN status for network cable.
-            logger.debug(err)
-            carrier_status = "UNKNOWN"
-        except Exception as e:
-            # All other exceptions are unexpected and are logged as errors.
-            logger.excpetion(
-                "Problem occured while reading from nw carrier file:"
-                f" {self.nw_interface_path}/{interface}/carrier. Error: {e}")
-        return carrier_status
+        """Returns the carrier state of interface read by the last refresh"""
+        return self._if_state.get(interface)[2]
+
+    def _get_bmc_lan_info(self):
+        """Returns 'ipmitool lan print' output, read again once it is
+           older than bmc_lan_cache_ttl seconds"""
+        now = time.monotonic()
+        if self._bmc_lan_info is None or \
+                now - self._bmc_lan_read_time >= self._bmc_lan_cache_ttl:
+            self._bmc_lan_info = sp.Popen("sudo ipmitool lan print", shell=True, stdout=sp.PIPE, stderr=sp.PIPE).communicate()[0].decode().strip()
+            self._bmc_lan_read_time = now
+        return self._bmc_lan_info
 
     def _get_bmc_info(self):
         """
@@ -278,7 +277,7 @@ class NodeData(Debug):
         """
         try:
             bmcdata = {'ifId': 'ebmc0', 'ipV4Prev': "", 'ipV4': "", 'nwStatus': "DOWN", 'nwCableConnStatus': 'UNKNOWN'}
-            ipdata = sp.Popen("sudo ipmitool lan print", shell=True, stdout=sp.PIPE, stderr=sp.PIPE).communicate()[0].decode().strip()
+            ipdata = self._get_bmc_lan_info()
             bmcip = re.findall("\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}", ipdata)
             if bmcip:
                 bmcip = bmcip[0]
@@ -296,6 +295,8 @@ class NodeData(Debug):
                     bmcdata['nwStatus'] = "UP"
                 else:
                     logger.warn("BMC Host:{0} is not reachable".format(bmcip))
+                    # The address may have changed, read it again next time
+                    self._bmc_lan_info = None
         except Exception as e:
             logger.error("Exception occurs while fetching bmc_info:{}".format(e))
         return bmcdata
@@ -305,39 +306,3 @@ class NodeData(Debug):
         self.total_space = int(psutil.disk_usage("/")[0])//int(self.units_factor)
         self.free_space  = int(psutil.disk_usage("/")[2])//int(self.units_factor)
         self.disk_used_percentage  = psutil.disk_usage("/")[3]
-
-    def _load_1min_avg(self):
-        """Loop forever calculating the one minute average load"""
-        # Initialize list to -1 indicating the time interval has not occurred yet
-        index = 0
-        while index < self.cpus:
-            self.load_1min_average.append(-1)
-            index += 1
-
-        while True:
-            # API call blocks for one minute and then returns the value
-            self.load_1min_average = psutil.cpu_percent(interval=1, percpu=True)
-
-    def _load_5min_avg(self):
-        """Loop forever calculating the five minute average load"""
-        # Initialize list to -1 indicating the time interval has not occurred yet
-        index = 0
-        while index < self.cpus:
-            self.load_5min_average.append(-1)
-            index += 1
-
-        while True:
-            # API call blocks for five minutes and then returns the value
-            self.load_5min_average = psutil.cpu_percent(interval=5, percpu=True)
-
-    def _load_15min_avg(self):
-        """Loop forever calculating the fifteen minute average load"""
-        # Initialize list to -1 indicating the time interval has not occurred yet
-        index = 0
-        while index < self.cpus:
-            self.load_15min_average.append(-1)
-            index += 1
-
-        while True:
-            # API call blocks for fifteen minutes and then returns the value
-            self.load_15min_average = psutil.cpu_percent(interval=15, percpu=True)
@@ -23,6 +23,7 @@ import calendar
 import json
 import os
 import re
+import shlex
 import subprocess
 import time
 import uuid
@@ -84,6 +85,7 @@ class NodeHWsensor(SensorThread, InternalMsgQ):
 
     SENSOR_NAME = "NodeHWsensor"
     PRIORITY = 1
+    SHARED_SCHEDULER = True
 
 
     sel_event_info = ""
@@ -108,8 +110,13 @@ class NodeHWsensor(SensorThread, InternalMsgQ):
     SEL_INFO_PERC_USED = "Percent Used"
     SEL_INFO_FREESPACE = "Free Space"
     SEL_INFO_ENTRIES = "Entries"
+    SEL_INFO_OVERFLOW = "Overflow"
+    SEL_ENTRY_SIZE = 16
+    # Entries listed before the new ones, the last processed one among them
+    SEL_LIST_MARGIN = 10
 
-    # This file stores the last index from the SEL list for which we have issued an event.
+    # This file stores the last index from the SEL list for which we have issued an event,
+    # followed by the number of SEL entries there were when that list was fetched.
     INDEX_FILE = "last_sel_index"
     LIST_FILE  = "sel_list"
     LIST_FILE_COLLECT = "sel_list_collect"
@@ -180,6 +187,10 @@ class NodeHWsensor(SensorThread, InternalMsgQ):
             self.TYPE_CURRENT: self._parse_current_info,
         }
         self.faulty_resources = {}
+        # SEL entry count when the SEL list being processed was fetched
+        # and the index of the last entry listed
+        self._sel_entries_listed = None
+        self._sel_index_listed = None
 
         # Flag to indicate suspension of module
         self._suspended = False
@@ -230,10 +241,13 @@ class NodeHWsensor(SensorThread, InternalMsgQ):
 
         self.list_file_collect_name = os.path.join(CACHE_DIR_NAME, self.LIST_FILE_COLLECT)
 
-    def _write_index_file(self, index):
+    def _write_index_file(self, index, sel_entries=None):
         if not isinstance(index, int):
             index = int(index, base=16)
-        literal = "{0:x}\n".format(index)
+        if sel_entries is None:
+            literal = "{0:x}\n".format(index)
+        else:
+            literal = "{0:x} {1}\n".format(index, sel_entries)
 
         with self._get_file(self.index_file_name) as index_file :
             index_file.seek(0)
@@ -242,10 +256,13 @@ class NodeHWsensor(SensorThread, InternalMsgQ):
             index_file.flush()
 
     def _read_index_file(self):
+        """Returns the last processed SEL index and the SEL entry count it
+        was read at, None if unknown"""
         with self._get_file(self.index_file_name) as index_file :
             index_file.seek(0)
-            index_line = index_file.readline().strip()
-            return int(index_line, base=16)
+            fields = index_file.readline().split()
+            sel_entries = int(fields[1]) if len(fields) > 1 else None
+            return int(fields[0], base=16), sel_entries
 
     def initialize(self, conf_reader, msgQlist, products):
         """initialize configuration reader and internal msg queues"""
@@ -366,19 +383,88 @@ class NodeHWsensor(SensorThread, InternalMsgQ):
             if retcode == 0:
                 self.get_channel_alert(ACTIVE_CHANNEL, self._channel_interface)
 
+    def _get_new_sel_entry_count(self):
+        """Returns the number of SEL entries logged since the last processed
+        list, or None when the whole SEL has to be listed"""
+        self._sel_entries_listed = None
+        info_dict = self._get_sel_info()
+        if info_dict is None or \
+                self.IPMISIMTOOL in self.ipmi_client.ACTIVE_IPMI_TOOL:
+            return None
+        try:
+            sel_entries = int(info_dict[self.SEL_INFO_ENTRIES])
+        except (KeyError, ValueError):
+            return None
+        self._sel_entries_listed = sel_entries
+
+        # A full SEL in circular mode overwrites its oldest entries, the
+        # count stays the same as entries get logged
+        if info_dict.get(self.SEL_INFO_OVERFLOW) == "true":
+            return None
+        try:
+            free = int(re.sub('[A-Za-z]+', '',
+                              info_dict[self.SEL_INFO_FREESPACE]))
+            if free < self.SEL_ENTRY_SIZE:
+                return None
+        except (KeyError, ValueError):
+            pass
+
+        _, entries_seen = self._read_index_file()
+        if entries_seen is None or sel_entries < entries_seen:
+            # Unknown or the SEL got cleared, list everything
+            return None
+        return sel_entries - entries_seen
+
+    def _list_sel(self, sel_list):
+        """Returns the lines of an 'ipmitool sel list' command"""
+        res, err, retcode = self._run_ipmitool_subcommand(sel_list)
+        if retcode != 0:
+            msg = f"{self.ipmi_client.ACTIVE_IPMI_TOOL} sel list command failed: {err}"
+            raise Exception(msg)
+        return [line for line in res.split("\n") if line.strip()]
+
+    @staticmethod
+    def _sel_list_indexes(sel_list):
+        return [line.split("|", 1)[0].strip() for line in sel_list]
+
     def _update_list_file(self):
+        self._sel_index_listed = None
+        new_entries = self._get_new_sel_entry_count()
+        if new_entries == 0:
+            # Nothing logged since the last poll, self.list_file is empty
+            return
+
+        last_index, _ = self._read_index_file()
+        last_index = "{0:x}".format(last_index)
+        sel_list = None
+        if new_entries is not None:
+            # Fetch only the tail of the SEL. It has to reach back to the
+            # last processed entry, otherwise the SEL got cleared or
+            # rotated since and new entries may be missing from it.
+            sel_list = self._list_sel(
+                f"sel list last {new_entries + self.SEL_LIST_MARGIN}")
+            if last_index not in self._sel_list_indexes(sel_list):
+                logger.info("Last processed SEL entry not listed, "
+                            "listing the whole SEL")
+                sel_list = None
+        if sel_list is None:
+            sel_list = self._list_sel("sel list")
+
+        indexes = self._sel_list_indexes(sel_list)
+        if last_index in indexes:
+            # The last processed entry may be of a device type filtered
+            # out below, drop the entries up to it here
+            sel_list = sel_list[indexes.index(last_index) + 1:]
+
+        # make sel list filter only for available frus. no extra data needed
+        # 'Power Supply|Power Unit|Fan|Drive Slot / Bay'
+        available_fru = re.compile('|'.join(self.fru_types.keys()))
         with open(self.list_file_collect_name, self.UPDATE_CREATE_MODE) as f:
-            # make sel list filter only for available frus. no extra data needed
-            # 'Power Supply|Power Unit|Fan|Drive Slot / Bay'
-            f.seek(0)
-            f.truncate()
-            available_fru = '|'.join(self.fru_types.keys())
-            _, err, retcode = self._run_ipmitool_subcommand(
-                    "sel list", grep_args=f"{available_fru}",
-                    out_file=f)
-            if retcode != 0:
-                msg = f"{self.ipmi_client.ACTIVE_IPMI_TOOL} sel list command failed: {err}"
-                raise Exception(msg)
+            if not self.channel_err:
+                f.writelines(line + "\n" for line in sel_list
+                             if available_fru.search(line))
+                if indexes:
+                    self._sel_index_listed = indexes[-1]
 
         # os.rename() is required to be atomic on POSIX,
         # (from here: https://docs.python.org/2/library/os.html#os.rename)
@@ -390,12 +476,25 @@ class NodeHWsensor(SensorThread, InternalMsgQ):
         self.list_file.close()
         self.list_file = self._get_file(self.list_file_name)
 
+    def _get_sel_info(self):
+        """Returns the 'sel info' fields as a dict, None on failure"""
+        sel_info, err, retcode = self._run_ipmitool_subcommand("sel info")
+        if retcode != 0:
+            logger.error(f"ipmitool sel info command failed,  \
+                with err {err}")
+            return None
+
+        info_dict = {}
+        for info in sel_info.split("\n"):
+            if ':' in info:
+                key, val = [f.strip() for f in info.split(":", 1)]
+                info_dict[key] = val
+        return info_dict
+
     def _check_and_clear_sel(self):
         """ Clear SEL Table if SEL used memory seen above threshold
             SEL_USAGE_THRESHOLD """
 
-        info_dict = {}
-
         if self.sel_last_queried:
             last_checked = time.time() - self.sel_last_queried
 
@@ -403,23 +502,13 @@ class NodeHWsensor(SensorThread, InternalMsgQ):
                 return
 
         try:
-            sel_info, err, retcode = self._run_ipmitool_subcommand("sel info")
-            if retcode != 0:
-                logger.error(f"ipmitool sel info command failed,  \
-                    with err {err}")
+            info_dict = self._get_sel_info()
+            if info_dict is None:
                 return (False)
 
             # record SEL last queried time
             self.sel_last_queried = time.time()
 
-            key = val = None
-            info_list = sel_info.split("\n")
-
-            for info in info_list:
-                if ':' in info:
-                    key, val = [f.strip() for f in info.split(":", 1)]
-                    info_dict[key] = val
-
             if self.SEL_INFO_PERC_USED in info_dict:
                 '''strip '%' or any unwanted char from value'''
                 info_dict[self.SEL_INFO_PERC_USED] = re.sub('%', '',
@@ -523,8 +612,9 @@ class NodeHWsensor(SensorThread, InternalMsgQ):
 
         # Copying object to avoid RuntimeError: dictionary changed size during iteration
         faulty_res = self.faulty_resources.copy()
+        sensors_props = self._get_sensor_sdr_props_many(list(faulty_res))
         for sensor_id in faulty_res:
-            dynamic, static = self._get_sensor_sdr_props(sensor_id)
+            dynamic, static = sensors_props.get(sensor_id, (None, None))
             if dynamic and 'States Asserted' in dynamic:
                 #  'States Asserted': 'Power Supply, Presence detected'
                 resource_state = re.sub(',  +', ', ', re.sub('[\[\]]','',
@@ -570,32 +660,38 @@ class NodeHWsensor(SensorThread, InternalMsgQ):
                 sel_event: {(index, date, event_time, device_id, device_type, sensor_num, event, status)}, ignoring event")
 
     def _get_sel_event(self):
-        last_index = self._read_index_file()
-
-        # TODO: See if the following 2 loops can be reduced to
-        # a single loop using mmap() and a fixed file format like
-        # the one produced by the 'ipmitool sel file' or
-        # 'ipmitool sel writeraw' commands.
-        found = False
-        self.list_file.seek(0, os.SEEK_SET)
-        for line in self.list_file:
-            if not found:
-                if line.split("|")[0].strip() == "{0:x}".format(last_index):
-                    found = True
-                continue
+        """Returns the SEL events after the last processed index and the
+        index of the last event per device type"""
+        last_index, _ = self._read_index_file()
+        return self._parse_sel_list(self.list_file, "{0:x}".format(last_index))
 
-            yield self._make_sel_event(line)
+    @staticmethod
+    def _parse_sel_list(list_file, last_index):
+        """Single pass over an 'ipmitool sel list' output file.
+
+        Only the lines after the last processed index are parsed. If that
+        index is not in the file, all of it is new, as the SEL has been
+        cleared or rotated beyond it, or only new entries were listed.
+        """
+        lines = []
+        list_file.seek(0, os.SEEK_SET)
+        for line in list_file:
+            if line.split("|", 1)[0].strip() == last_index:
+                lines.clear()
+                continue
+            lines.append(line)
 
-        if not found:
-            # This can mean one of a few things:
-            # 1. The SEL has been cleared beyond the last index we saw
-            # 2. It has rotated to beyond the last index we saw
-            # 3. self.list_file is empty
-            self.list_file.seek(0, os.SEEK_SET)
-            for line in self.list_file:
-                yield self._make_sel_event(line)
+        events = []
+        last_fru_index = {}
+        for line in lines:
+            sel_event = NodeHWsensor._make_sel_event(line)
+            # sel_event[4] is the device type, sel_event[0] the index
+            last_fru_index[sel_event[4]] = sel_event[0]
+            events.append(sel_event)
+        return events, last_fru_index
 
-    def _make_sel_event(self, sel_line):
+    @staticmethod
+    def _make_sel_event(sel_line):
         # Separate out the components of the sel event
         # Sample sel event which gets parsed
         # 2 | 04/16/2019 | 05:29:09 | Fan #0x30 | Lower Non-critical going low  | Asserted
@@ -621,15 +717,14 @@ class NodeHWsensor(SensorThread, InternalMsgQ):
         """See if there is any new event gets generated in the sel and notify
             node data message handler for generating JSON message"""
 
-        last_fru_index = {}
-        last_index = None
-        for (index, date, event_time, device_id, device_type, sensor_num, event, status) \
-                in self._get_sel_event():
-            last_fru_index[device_type] = index
-            last_index = index
+        sel_events, last_fru_index = self._get_sel_event()
+        # Entries of other device types are filtered out of the list file,
+        # the last index listed is recorded to find it in the next list
+        last_index = self._sel_index_listed or \
+            (sel_events[-1][0] if sel_events else None)
 
         for (index, date, event_time, device_id, device_type, sensor_num, event, status) \
-                in self._get_sel_event():
+                in sel_events:
 
             is_last = (last_fru_index[device_type] == index)
             logger.debug(f"_notify_NodeDataMsgHandler '{device_type}': is_last: \
@@ -647,8 +742,11 @@ class NodeHWsensor(SensorThread, InternalMsgQ):
                     logger.error(f"_notify_NodeDataMsgHandler, error {e} while processing \
                         sel_event: {(index, date, event_time, device_id, device_type, sensor_num, event, status)}, ignoring event")
 
-        if last_index is not None:
-            self._write_index_file(last_index)
+        if last_index is None:
+            last_index, _ = self._read_index_file()
+        self._write_index_file(last_index, self._sel_entries_listed)
+        self._sel_entries_listed = None
+        self._sel_index_listed = None
         self.list_file.seek(0)
         self.list_file.truncate()
 
@@ -885,6 +983,45 @@ class NodeHWsensor(SensorThread, InternalMsgQ):
 
         return (dynamic, static_keys)
 
+    def _get_sensor_sdr_props_many(self, sensor_ids):
+        """_get_sensor_sdr_props() of many sensors with one 'sdr get' call.
+           Returns a dict of sensor id to (dynamic, static) properties,
+           sensors which could not be read are left out"""
+        if not sensor_ids:
+            return {}
+        props = {}
+        if len(sensor_ids) == 1 or \
+                self.IPMISIMTOOL in self.ipmi_client.ACTIVE_IPMI_TOOL:
+            # ipmisimtool reads one sensor per call
+            for sensor_id in sensor_ids:
+                sensor_props = self._get_sensor_sdr_props(sensor_id)
+                if sensor_props:
+                    props[sensor_id] = sensor_props
+            return props
+
+        ids = " ".join(shlex.quote(sensor_id) for sensor_id in sensor_ids)
+        # Records of the sensors found are printed even if one is not.
+        # Errors are left to the sensors read again below, so that one
+        # unknown sensor neither drops the batch nor raises an IEM.
+        props_list_out, err, retcode = \
+            self.ipmi_client._run_ipmitool_subcommand(
+                f"sdr get {ids}", keep_output=True)
+        if retcode != 0:
+            logger.warn(f"ipmitool sdr get command failed: {err}")
+
+        records = self.ipmi_client.parse_sensor_records(
+            props_list_out, sensor_ids)
+        for sensor_id, static_keys in records.items():
+            dynamic = {key: static_keys.pop(key) for key in
+                       self.DYNAMIC_KEYS & static_keys.keys()}
+            props[sensor_id] = (dynamic, static_keys)
+        for sensor_id in sensor_ids:
+            if sensor_id not in props:
+                sensor_props = self._get_sensor_sdr_props(sensor_id)
+                if sensor_props:
+                    props[sensor_id] = sensor_props
+        return props
+
     def _get_sensor_props(self, sensor_id):
         """get all the properties of a sensor.
            Returns a tuple (common, specific) where
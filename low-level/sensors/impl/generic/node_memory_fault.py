@@ -46,6 +46,7 @@ class MemFaultSensor(SensorThread, InternalMsgQ):
 
     SENSOR_NAME = "MemFaultSensor"
     PRIORITY = 1
+    SHARED_SCHEDULER = True
     RESOURCE_TYPE = "node:os:memory"
 
     # section in the configuration store
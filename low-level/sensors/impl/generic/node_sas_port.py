@@ -71,6 +71,7 @@ class SASPortSensor(SensorThread, InternalMsgQ):
 
     SENSOR_NAME = "SASPortSensor"
     PRIORITY = 1
+    SHARED_SCHEDULER = True
     RESOURCE_TYPE = "node:interface:sas"
 
     # section in the configuration store
@@ -22,6 +22,7 @@
 import json
 import os
 import subprocess
+import threading
 import time
 import uuid
 
@@ -35,6 +36,8 @@ from framework.utils.conf_utils import (GLOBAL_CONF, SSPL_CONF, Conf,
 from framework.utils.service_logging import logger
 from framework.utils.severity_reader import SeverityReader
 from framework.utils.os_utils import OSUtils
+from framework.utils.mdstat_watcher import MdstatWatcher
+from framework.utils import snapshot_cache
 # Modules that receive messages from this module
 from message_handlers.node_data_msg_handler import NodeDataMsgHandler
 from sensors.Iraid import IRAIDsensor
@@ -49,6 +52,7 @@ class RAIDsensor(SensorThread, InternalMsgQ):
 
     SENSOR_NAME       = "RAIDsensor"
     PRIORITY          = 1
+    SHARED_SCHEDULER  = True
     RESOURCE_TYPE     = "node:os:raid_data"
 
     # Section and keys in configuration file
@@ -71,6 +75,11 @@ class RAIDsensor(SensorThread, InternalMsgQ):
 
     CACHE_DIR_NAME  = "server"
 
+    # Seconds between checks of the status file, the longer one applies
+    # while md events on it are watched
+    POLL_INTERVAL = 30
+    WATCHED_POLL_INTERVAL = 300
+
     # Dependency list
     DEPENDENCIES = {
                     "init": ["DiskMonitor"],
@@ -99,6 +108,10 @@ class RAIDsensor(SensorThread, InternalMsgQ):
         self._suspended = False
         self.os_utils = OSUtils()
 
+        # Set by the MdstatWatcher thread, see _on_mdstat_event()
+        self._mdstat_changed = threading.Event()
+        self._mdstat_watcher = None
+
     def initialize(self, conf_reader, msgQlist, product):
         """initialize configuration reader and internal msg queues"""
 
@@ -131,6 +144,14 @@ class RAIDsensor(SensorThread, InternalMsgQ):
 
         self._prev_drive_dict = {}
 
+        # (mdX line, status line) of each array as last processed
+        self._md_arrays = {}
+        self._identity = {}
+
+        # Parsed RAID_CONF_FILE and the mtime it was parsed at
+        self._conf_device_list = None
+        self._raid_conf_mtime = None
+
         self.prev_alert_type = {}
         self._node_id = Conf.get(GLOBAL_CONF, NODE_ID_KEY,'SN01')
 
@@ -170,20 +191,42 @@ class RAIDsensor(SensorThread, InternalMsgQ):
             }
             store.put(self.persistent_raid_data, self.RAID_SENSOR_DATA_PATH)
 
+        # React to degrade events right away instead of on the next check,
+        # only possible when run() is not blocked sleeping on its own thread
+        if self.uses_shared_scheduler():
+            watcher = MdstatWatcher(self._RAID_status_file, self._on_mdstat_event)
+            if watcher.start():
+                self._mdstat_watcher = watcher
+                logger.info(f"Watching {self._RAID_status_file} for md events")
+
         return True
 
     def read_data(self):
         """Return the Current RAID status information"""
         return self._RAID_status
 
+    def _on_mdstat_event(self):
+        """Called by the MdstatWatcher thread on an md event"""
+        self._mdstat_changed.set()
+        self._scheduler.wake(self.run)
+
+    def _poll_interval(self):
+        if self._mdstat_changed.is_set():
+            # An event came in while run() was already going
+            return 0
+        if self._mdstat_watcher is not None:
+            return self.WATCHED_POLL_INTERVAL
+        return self.POLL_INTERVAL
+
     def run(self):
         """Run the sensor on its own thread"""
 
         # Do not proceed if module is suspended
         if self._suspended == True:
-            self._scheduler.enter(30, self._priority, self.run, ())
+            self._scheduler.enter(self.POLL_INTERVAL, self._priority, self.run, ())
             return
 
+        self._mdstat_changed.clear()
 
         # Check for debug mode being activated
         self._read_my_msgQ_noWait()
@@ -197,8 +240,9 @@ class RAIDsensor(SensorThread, InternalMsgQ):
         # Reset debug mode if persistence is not enabled
         self._disable_debug_if_persist_false()
 
-        # Fire every 30 seconds to see if there's a change in RAID status file
-        self._scheduler.enter(30, self._priority, self.run, ())
+        # Fire again later to see if there's a change in RAID status file,
+        # or right away on an md event
+        self._scheduler.enter(self._poll_interval(), self._priority, self.run, ())
 
     def _notify_NodeDataMsgHandler(self):
         """See if the status files changed and notify node data message handler
@@ -228,8 +272,9 @@ class RAIDsensor(SensorThread, InternalMsgQ):
         # checks mdadm conf file for missing raid array and send json message to NodeDataMsgHandler
         self._process_missing_md_devices(md_device_list, drive_dict)
 
+        # Only arrays that changed since last time are in drive_dict
         for device in md_device_list:
-            if drive_dict:
+            if device in drive_dict:
                 if len(drive_dict[device]) < self._total_drives[device] and \
                     device in self.prev_alert_type and self.prev_alert_type[device] != self.MISSING:
                     self.alert_type = self.MISSING
@@ -283,55 +328,64 @@ class RAIDsensor(SensorThread, InternalMsgQ):
                                 self._prev_drive_dict[device] = drive_dict[device]
                                 self._send_json_msg(self.alert_type, resource_id, device, self._drives[device])
 
+    @staticmethod
+    def _split_mdstat(contents):
+        """Returns {device: (mdX line, status line)} of each array"""
+        arrays = {}
+        device = None
+        for line in contents.strip().split("\n"):
+            # The line following the mdXXX : ... contains the [UU] status
+            if device is not None:
+                arrays[device] = (arrays[device][0], line)
+                device = None
+
+            fields = line.split(" ")
+            if "md" in fields[0]:
+                device = f"/dev/{fields[0]}"
+                arrays[device] = (line, "")
+        return arrays
+
     def _process_mdstat(self):
-        """Parse out status' and path info for each drive"""
-        # Replace new line chars with spaces
-        mdstat = self._RAID_status_contents.strip().split("\n")
+        """Parse out status' and path info for each drive of the arrays
+            changed since last time. Arrays whose mdX and status lines are
+            the same, e.g. only the resync progress moved, are skipped.
+
+            Returns the list of all arrays and the drives and status change
+            of the changed ones.
+        """
+        arrays = self._split_mdstat(self._RAID_status_contents)
         md_device_list = []
         drive_dict = {}
-        monitored_device = mdstat
         drive_status_changed = {}
         self._devices.clear()
-        # Array of optional identity json sections for drives in array
-        self._identity = {}
-
-        # Read in each line looking for a 'mdXXX' value
-        md_line_parsed = False
-
-        for line in monitored_device:
-            # The line following the mdXXX : ... contains the [UU] status that we need
-            if md_line_parsed is True:
-                # Format is [x/y][UUUU____...]
-                drive_status_changed[self._device] = self._parse_raid_status(line, self._device)
-                # Reset in case their are multiple configs in file
-                md_line_parsed = False
-
-            # Break the  line apart into separate fields
-            fields = line.split(" ")
-
-            # Parse out status' and path info for each drive
-            if "md" in fields[0]:
-                self._device = f"/dev/{fields[0]}"
-                self._devices.append(self._device)
-                self._log_debug(f"md device found: {self._device}")
-                md_device_list.append(self._device)
-                drive_dict[self._device] = []
-                if self._device not in self.prev_alert_type:
-                    self.prev_alert_type[self._device] = None
-                if self._device not in self._faulty_drive_list:
-                    self._faulty_drive_list[self._device] = {}
-
-                # Parse out raid drive paths if they're present
-                self._identity[self._device] = {}
-                for field in fields:
-                    if "[" in field:
-                        if field not in drive_dict[self._device]:
-                            index = field.find("[")
-                            drive_name = field[:index]
-                            drive_dict[self._device].append(drive_name)
-                        self._add_drive(field, self._device)
-                md_line_parsed = True
 
+        for device, (md_line, status_line) in arrays.items():
+            self._devices.append(device)
+            md_device_list.append(device)
+            if device not in self.prev_alert_type:
+                self.prev_alert_type[device] = None
+            if device not in self._faulty_drive_list:
+                self._faulty_drive_list[device] = {}
+
+            if self._md_arrays.get(device) == (md_line, status_line):
+                continue
+            self._log_debug(f"md device changed: {device}")
+
+            # Parse out raid drive paths if they're present
+            drive_dict[device] = []
+            self._identity[device] = {}
+            for field in md_line.split(" "):
+                if "[" in field:
+                    if field not in drive_dict[device]:
+                        index = field.find("[")
+                        drive_name = field[:index]
+                        drive_dict[device].append(drive_name)
+                    self._add_drive(field, device)
+
+            # Format is [x/y][UUUU____...]
+            drive_status_changed[device] = self._parse_raid_status(status_line, device)
+
+        self._md_arrays = arrays
         return md_device_list, drive_dict, drive_status_changed
 
     def _add_drive(self, field, device):
@@ -427,6 +481,38 @@ class RAIDsensor(SensorThread, InternalMsgQ):
             logger.warn(f"_process_missing_md_devices, MDRaid configuration file {self.RAID_CONF_FILE} is missing")
             return
 
+        conf_device_list = self._get_conf_device_list()
+        if conf_device_list is None:
+            return
+
+        # compare conf file raid array list with mdstat raid array list
+        for device in conf_device_list:
+            if device not in md_device_list and device not in self._faulty_device_list:
+                # add that missing raid array entry into the list of raid devices
+                self.alert_type = self.FAULT
+                self._faulty_device_list.add(device)
+                self._send_json_msg(self.alert_type, device, device, self.RAID_DOWN_DRIVE_STATUS)
+
+            elif device in md_device_list and device in self._faulty_device_list:
+                # add that missing raid array entry into the list of raid devices
+                self.alert_type = self.FAULT_RESOLVED
+                self._map_drive_status(device, drive_dict, "Down/Recovery")
+                self._faulty_device_list.remove(device)
+                self._send_json_msg(self.alert_type, device, device, self._drives[device])
+
+    def _get_conf_device_list(self):
+        """Returns the arrays listed in the md raid configuration file,
+            parsed again only when its mtime changed. None if an entry
+            could not be parsed.
+        """
+        try:
+            mtime = os.stat(self.RAID_CONF_FILE).st_mtime_ns
+        except OSError as err:
+            logger.warn(f"_get_conf_device_list, {self.RAID_CONF_FILE}: {err}")
+            return None
+        if mtime == self._raid_conf_mtime:
+            return self._conf_device_list
+
         conf_device_list = []
         with open(self.RAID_CONF_FILE, 'r') as raid_conf_file:
             raid_conf_data = raid_conf_file.read().strip().split("\n")
@@ -442,24 +528,14 @@ class RAIDsensor(SensorThread, InternalMsgQ):
                     else:
                         conf_device_list.append(raid_conf_field[1])
             except Exception as ae:
-                self._log_debug(f"_process_missing_md_devices, error retrieving raid entry    \
+                self._log_debug(f"_get_conf_device_list, error retrieving raid entry    \
                  from {self.RAID_CONF_FILE} file: {str(ae)}")
-                return
+                conf_device_list = None
+                break
 
-        # compare conf file raid array list with mdstat raid array list
-        for device in conf_device_list:
-            if device not in md_device_list and device not in self._faulty_device_list:
-                # add that missing raid array entry into the list of raid devices
-                self.alert_type = self.FAULT
-                self._faulty_device_list.add(device)
-                self._send_json_msg(self.alert_type, device, device, self.RAID_DOWN_DRIVE_STATUS)
-
-            elif device in md_device_list and device in self._faulty_device_list:
-                # add that missing raid array entry into the list of raid devices
-                self.alert_type = self.FAULT_RESOLVED
-                self._map_drive_status(device, drive_dict, "Down/Recovery")
-                self._faulty_device_list.remove(device)
-                self._send_json_msg(self.alert_type, device, device, self._drives[device])
+        self._conf_device_list = conf_device_list
+        self._raid_conf_mtime = mtime
+        return conf_device_list
 
     def _map_drive_status(self, device, drives, drv_status):
         for drv in self._drives[device]:
@@ -528,6 +604,8 @@ class RAIDsensor(SensorThread, InternalMsgQ):
 
         # Send the event to node data message handler to generate json message and send out
         self._write_internal_msgQ(NodeDataMsgHandler.name(), internal_json_msg)
+        # Resource map queries need to see the new array state
+        snapshot_cache.invalidate("raid")
         # Save the state to Persistent Cache.
         self.persistent_raid_data = {
                 '_RAID_status_contents' : self._RAID_status_contents,
@@ -579,4 +657,6 @@ class RAIDsensor(SensorThread, InternalMsgQ):
                                                         '/proc/mdstat')
     def shutdown(self):
         """Clean up scheduler queue and gracefully shutdown thread"""
+        if self._mdstat_watcher is not None:
+            self._mdstat_watcher.stop()
         super(RAIDsensor, self).shutdown()
@@ -18,6 +18,7 @@
 import errno
 import re
 import socket
+import threading
 import time
 from pathlib import Path
 
@@ -34,9 +35,10 @@ from framework.platforms.server.sas import SAS
 from framework.platforms.server.software import BuildInfo, Service
 from framework.utils.mon_utils import MonUtils
 from framework.utils.conf_utils import (GLOBAL_CONF, NODE_TYPE_KEY, SSPL_CONF,
-                                        Conf)
+                                        Conf, RESOURCE_MAP)
 from framework.utils.ipmi_client import IpmiFactory
 from framework.utils.service_logging import CustomLog, logger
+from framework.utils.snapshot_cache import SnapshotCache
 from framework.utils.tool_factory import ToolFactory
 from server.server_resource_map import ServerResourceMap
 
@@ -49,10 +51,24 @@ class ServerHealth():
 
     name = "server_health"
 
+    # Seconds a collector may take, see RESOURCE_MAP in sspl.conf
+    COLLECTOR_TIMEOUT = 30
+    # Seconds health data of a resource is served from memory
+    CACHE_TTL = 30
+
+    # Shared by the instances created per rpath query
+    _snapshots = None
+
+    # psutil.cpu_percent() measures since its previous call, so
+    # concurrent samplers must take turns
+    _cpu_usage_lock = threading.Lock()
+
     def __init__(self):
         """Initialize server."""
         super().__init__()
         self.log = CustomLog(const.HEALTH_SVC_NAME)
+        # Collector metadata of the last hw or sw query
+        self.metadata = None
         server_type = Conf.get(GLOBAL_CONF, NODE_TYPE_KEY)
         Platform.validate_server_type_support(self.log, ResourceMapError, server_type)
         self.sysfs = ToolFactory().get_instance('sysfs')
@@ -84,9 +100,41 @@ class ServerHealth():
         self.service = Service()
         self.resource_indexing_map = ServerResourceMap.resource_indexing_map\
             ["health"]
+        self.collector_timeout = int(Conf.get(SSPL_CONF,
+            f"{RESOURCE_MAP}>collector_timeout", self.COLLECTOR_TIMEOUT))
+        self.collector_timeouts = Conf.get(SSPL_CONF,
+            f"{RESOURCE_MAP}>collector_timeouts", None) or {}
+        if ServerHealth._snapshots is None:
+            ServerHealth._snapshots = SnapshotCache(
+                int(Conf.get(SSPL_CONF, f"{RESOURCE_MAP}>health_cache_ttl",
+                             self.CACHE_TTL)),
+                Conf.get(SSPL_CONF, f"{RESOURCE_MAP}>cache_ttls", None))
+
+    def _get_snapshot(self, resource, method):
+        """Return data of resource from memory or else from method()."""
+        return self._snapshots.get(resource, method)
+
+    def _collect(self, collectors):
+        """Run {(res_type, fru): method} concurrently.
+
+        Returns results and metadata by "res_type>fru", see
+        MonUtils.collect_concurrently.
+        """
+        keyed = {f"{res_type}>{fru}":
+                 lambda fru=fru, method=method: self._get_snapshot(fru, method)
+                 for (res_type, fru), method in collectors.items()}
+        timeouts = {f"{res_type}>{fru}": int(self.collector_timeouts[fru])
+                    for res_type, fru in collectors
+                    if fru in self.collector_timeouts}
+        return MonUtils.collect_concurrently(keyed, self.collector_timeout,
+                                             self.log, timeouts)
 
     def get_data(self, rpath):
-        """Fetch health information for given rpath."""
+        """Fetch health information for given rpath.
+
+        For hw and sw the status and latency of each collector are left in
+        self.metadata, the server response carries them under "metadata".
+        """
         logger.info(self.log.svc_log(
             f"Get Health data for rpath:{rpath}"))
         info = {}
@@ -99,14 +147,24 @@ class ServerHealth():
             info = self.get_server_health_info()
             resource_found = True
         elif leaf_node in self.server_resources:
-            for resource, method in self.server_resources[leaf_node].items():
-                try:
-                    info.update({resource: method()})
-                    resource_found = True
-                except Exception as err:
-                    logger.error(
-                        self.log.svc_log(f"{err.__class__.__name__}: {err}"))
-                    info = None
+            start = time.monotonic()
+            results, metadata = self._collect({
+                (leaf_node, resource): method for resource, method
+                in self.server_resources[leaf_node].items()})
+            # The response holds resources only, collector metadata is
+            # kept beside it
+            self.metadata = {
+                "collection_time": round(time.monotonic() - start, 3),
+                "collectors": metadata
+            }
+            logger.info(self.log.svc_log(
+                f"Collected {leaf_node} health: {self.metadata}"))
+            if any(value["status"] == "OK" for value in metadata.values()):
+                info = {resource: results[f"{leaf_node}>{resource}"]
+                        for resource in self.server_resources[leaf_node]}
+                resource_found = True
+            else:
+                info = None
         else:
             for node in nodes:
                 resource, _ = ServerResourceMap.get_node_info(node)
@@ -118,7 +176,7 @@ class ServerHealth():
                                 f"No mapping function found for {res_type}"))
                         continue
                     try:
-                        info = method()
+                        info = self._get_snapshot(resource, method)
                         resource_found = True
                     except Exception as err:
                         logger.error(
@@ -202,22 +260,29 @@ class ServerHealth():
         except Exception as err:
             logger.error(self.log.svc_log(
                 f"Unable to get build info due to {err}"))
-        info["resource_usage"] = {}
-        info["resource_usage"]["cpu_usage"] = self.get_cpu_overall_usage()
-        info["resource_usage"]["disk_usage"] = self.get_disk_overall_usage()
-        info["resource_usage"]["memory_usage"] = self.get_memory_overall_usage()
-
+        # Collect everything concurrently, collectors that fail or time
+        # out are None in the response
+        collectors = {
+            ("resource_usage", "cpu_usage"): self.get_cpu_overall_usage,
+            ("resource_usage", "disk_usage"): self.get_disk_overall_usage,
+            ("resource_usage", "memory_usage"): self.get_memory_overall_usage
+        }
         for res_type in self.server_resources:
-            info.update({res_type: {}})
             for fru, method in self.server_resources[res_type].items():
-                try:
-                    info[res_type].update({fru: method()})
-                    unhealthy_resource_found = self._is_any_resource_unhealthy(
-                        fru, info[res_type])
-                except Exception as err:
-                    logger.error(
-                        self.log.svc_log(f"{err.__class__.__name__}:{err}"))
-                    info[res_type].update({fru: None})
+                collectors[(res_type, fru)] = method
+        start = time.monotonic()
+        results, metadata = self._collect(collectors)
+
+        for res_type, fru in collectors:
+            info.setdefault(res_type, {})[fru] = results[f"{res_type}>{fru}"]
+            if res_type in self.server_resources and \
+                    info[res_type][fru] is not None and \
+                    self._is_any_resource_unhealthy(fru, info[res_type]):
+                unhealthy_resource_found = True
+        info["metadata"] = {
+            "collection_time": round(time.monotonic() - start, 3),
+            "collectors": metadata
+        }
 
         info["uid"] = socket.getfqdn()
         info["last_updated"] = int(time.time())
@@ -236,10 +301,11 @@ class ServerHealth():
         """Get CPU usage list."""
         i = 0
         cpu_usage = None
-        while i < index:
-            cpu_usage = psutil.cpu_percent(interval=None, percpu=percpu)
-            time.sleep(1)
-            i = i + 1
+        with ServerHealth._cpu_usage_lock:
+            while i < index:
+                cpu_usage = psutil.cpu_percent(interval=None, percpu=percpu)
+                time.sleep(1)
+                i = i + 1
         return cpu_usage
 
     def get_cpu_list(self, mode):
@@ -332,15 +398,17 @@ class ServerHealth():
             f"Disk Health Data:{disk_data}"))
         return disk_data
 
-    def format_ipmi_platform_sensor_reading(self, reading):
+    def format_ipmi_platform_sensor_reading(self, reading, sensor_props=None):
         """
         builds json response from ipmi tool response.
         reading arg sample: ('CPU1 Temp', '01', 'ok', '3.1', '36 degrees C').
+        sensor_props are the sensor thresholds, read when not given.
         """
 
         uid = '_'.join(reading[0].split())
         sensor_id = reading[0]
-        sensor_props = self._ipmi.get_sensor_props(sensor_id)
+        if sensor_props is None:
+            sensor_props = self._ipmi.get_sensor_props(sensor_id)
         lower_critical = sensor_props[1].get('Lower Critical', 'NA')
         upper_critical = sensor_props[1].get('Upper Critical', 'NA')
         lower_non_recoverable = sensor_props[1].get('Lower Non-Recoverable', 'NA')
@@ -371,9 +439,13 @@ class ServerHealth():
             if not sensor_reading:
                 logger.debug(self.log.svc_log(f"No sensor data received for :{sensor}"))
                 continue
+            # Thresholds are static SDR data, cached by the ipmi client
+            sensors_props = self._ipmi.get_sensor_static_props_many(
+                [reading[0] for reading in sensor_reading])
             for reading in sensor_reading:
                 response[sensor].append(
-                    self.format_ipmi_platform_sensor_reading(reading)
+                    self.format_ipmi_platform_sensor_reading(
+                        reading, sensors_props.get(reading[0], ({}, {})))
                 )
         logger.debug(self.log.svc_log(
             f"Platform Sensor Health Data:{response}"))
@@ -450,10 +522,12 @@ class ServerHealth():
             msg = "Failed to get Fan sensor reading using ipmitool"
             logger.error(self.log.svc_log(msg))
             return
+        sensors_props = self._ipmi.get_sensor_static_props_many(
+            [fan_reading[0] for fan_reading in sensor_reading])
         for fan_reading in sensor_reading:
             sensor_id = fan_reading[0]
             fan_dict = self.get_health_template(sensor_id, is_fru=True)
-            sensor_props = self._ipmi.get_sensor_props(sensor_id)
+            sensor_props = sensors_props.get(sensor_id, ({}, {}))
             status = 'OK' if fan_reading[2] == 'ok' else 'NA'
             lower_critical = sensor_props[1].get('Lower Critical', 'NA')
             upper_critical = sensor_props[1].get('Upper Critical', 'NA')
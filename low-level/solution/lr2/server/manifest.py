@@ -23,11 +23,13 @@ import os
 from cortx.utils.process import SimpleProcess
 from cortx.utils.kv_store import KvStoreFactory
 from cortx.utils.discovery.error import ResourceMapError
-from framework.utils.conf_utils import GLOBAL_CONF, Conf, NODE_TYPE_KEY
+from framework.utils.conf_utils import (GLOBAL_CONF, SSPL_CONF, Conf,
+    NODE_TYPE_KEY, RESOURCE_MAP)
 from framework.base.sspl_constants import (MANIFEST_SVC_NAME, LSHW_FILE,
     MANIFEST_OUTPUT_FILE, HEALTH_UNDESIRED_VALS)
 from framework.utils.service_logging import CustomLog, logger
 from framework.utils.mon_utils import MonUtils
+from framework.utils.snapshot_cache import SnapshotCache
 from framework.platforms.server.software import Service
 from framework.platforms.server.platform import Platform
 from server.server_resource_map import ServerResourceMap
@@ -41,6 +43,12 @@ class ServerManifest():
 
     name = "server_manifest"
 
+    # Seconds manifest data of a resource is served from memory
+    CACHE_TTL = 600
+
+    # Shared by the instances created per rpath query
+    _snapshots = None
+
     def __init__(self):
         """Initialize server manifest."""
         super().__init__()
@@ -85,6 +93,14 @@ class ServerManifest():
         fw_resources = {
             'bmc': self.get_bmc_version_info
         }
+        if ServerManifest._snapshots is None:
+            ServerManifest._snapshots = SnapshotCache(
+                int(Conf.get(SSPL_CONF, f"{RESOURCE_MAP}>manifest_cache_ttl",
+                             self.CACHE_TTL)),
+                Conf.get(SSPL_CONF, f"{RESOURCE_MAP}>cache_ttls", None))
+        for resources in (sw_resources, fw_resources):
+            for resource, method in resources.items():
+                resources[resource] = self._get_snapshot_method(resource, method)
         # Extracting resource type for 'self.class_mapping' dictionary values
         # and adding to hw_resources for function mapping.
         hw_resources = {value[len('hw>'):-len('[%s]>%s')]: \
@@ -99,6 +115,10 @@ class ServerManifest():
         self.resource_indexing_map = ServerResourceMap.resource_indexing_map\
             ["manifest"]
 
+    def _get_snapshot_method(self, resource, method):
+        """Wrap method to return data of resource from memory if possible."""
+        return lambda: self._snapshots.get(resource, method)
+
     def get_data(self, rpath):
         """Fetch manifest information for given rpath."""
         logger.info(self.log.svc_log(
@@ -183,7 +203,11 @@ class ServerManifest():
         return server
 
     def get_server_hw_info(self):
-        """Get server hw information."""
+        """Get server hw information, lshw runs only when it is not
+        in memory."""
+        return self._snapshots.get("lshw", self._get_server_hw_info)
+
+    def _get_server_hw_info(self):
         cls_res_cnt = {}
         lshw_data = {}
         data, output_file = self.set_lshw_input_data()
@@ -34,6 +34,9 @@ class StorageHealth():
     """Provides storage resource related information."""
 
     name = "storage_health"
+    ENCL_SWEEP_FRUS = ["enclosures", "controllers", "power-supplies",
+        "sensors", "volumes", "disk-groups", "drives", "network-parameters",
+        "expander-ports", "fan-modules"]
 
     def __init__(self):
         """Initialize storage."""
@@ -193,6 +196,11 @@ class StorageHealth():
 
     def get_storage_health_info(self):
         """Get overall storage enclosure information."""
+        # Fetch all cli apis concurrently, the per resource methods below
+        # are then served from the enclosure response cache. Without the
+        # cache they would request all of them again.
+        if enclosure.ws_cache.ttl:
+            enclosure.get_realstor_encl_data_many(self.ENCL_SWEEP_FRUS)
         enclosures = self.get_enclosures_info()
         storage = []
         for encl in enclosures:
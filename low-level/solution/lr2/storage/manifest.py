@@ -33,6 +33,8 @@ class StorageManifest():
     """Provides storage manifest related information."""
 
     name = "storage_manifest"
+    ENCL_SWEEP_FRUS = ["enclosures", "frus", "controllers", "power-supplies",
+        "drives", "fan-modules", "versions"]
 
     def __init__(self):
         """Initialize storage."""
@@ -116,6 +118,11 @@ class StorageManifest():
 
     def get_storage_manifest_info(self):
         """Get storage enclosure information."""
+        # Fetch all cli apis concurrently, the per resource methods below
+        # are then served from the enclosure response cache. Without the
+        # cache they would request all of them again.
+        if ENCL.ws_cache.ttl:
+            ENCL.get_realstor_encl_data_many(self.ENCL_SWEEP_FRUS)
         storage = []
         info = {}
         for res_type in self.storage_resources:
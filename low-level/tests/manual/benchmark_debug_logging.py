@@ -0,0 +1,99 @@
+#!/usr/bin/python3.6
+
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+"""
+ ****************************************************************************
+  Description:       Measures the per message cost of Debug._log_debug with
+                    debug logging disabled, as called for every message
+                    written to and read from internal queues. It compares
+                    the former eager formatting with % arguments and
+                    callables passed through.
+
+  Usage:             python3 benchmark_debug_logging.py [calls]
+ ****************************************************************************
+"""
+
+import logging
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", ".."))
+from framework.base import debug
+from framework.base.debug import Debug
+
+# Standard library logger at INFO, so only formatting and the level check
+# of a dropped debug call are measured
+logger = logging.getLogger("benchmark_debug_logging")
+logger.setLevel(logging.INFO)
+debug.logger = logger
+
+# A sensor response of typical size as it travels between modules
+JSON_MSG = {
+    "username": "sspl-ll", "signature": "N/A", "time": "1614252436",
+    "expires": 3600, "title": "SSPL Sensor Response",
+    "description": "Seagate Storage Platform Library - Sensor Response",
+    "message": {
+        "sspl_ll_msg_header": {"schema_version": "1.0.0",
+                               "sspl_version": "2.0.0",
+                               "msg_version": "1.0.0"},
+        "sensor_response_type": {
+            "alert_type": "fault", "severity": "critical",
+            "alert_id": "16142524361", "host_id": "srvnode-1",
+            "info": {"resource_type": "enclosure:hw:disk",
+                     "resource_id": "disk_00.12", "event_time": "1614252436",
+                     "site_id": "DC01", "rack_id": "RC01", "node_id": "SN01",
+                     "cluster_id": "CC01", "description": "Disk missing"},
+            "specific_info": {"durable-id": "disk_00.%d" % slot
+                              for slot in range(20)}}}}
+
+
+class Module(Debug):
+
+    @staticmethod
+    def name():
+        return "EgressProcessor"
+
+
+def eager(module):
+    """Debug._log_debug as it was, kept here as the baseline"""
+    def _log_debug(message):
+        logger.debug(module.name() + ", " + message)
+    _log_debug("_write_internal_msgQ: From %s, To %s, Msg:%s" %
+               (module.name(), "EgressProcessor", JSON_MSG))
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    module = Module()
+    cases = [
+        ("eager % formatting", lambda: eager(module)),
+        ("% args passed through", lambda: module._log_debug(
+            "_write_internal_msgQ: From %s, To %s, Msg:%s",
+            module.name(), "EgressProcessor", JSON_MSG)),
+        ("callable", lambda: module._log_debug(
+            lambda: f"_write_internal_msgQ, Msg:{JSON_MSG}")),
+    ]
+    print(f"Debug disabled, {calls} calls")
+    for name, func in cases:
+        elapsed = timeit.timeit(func, number=calls) / calls
+        print(f"{name:24} {elapsed * 1e6:9.3f} us/message")
+
+
+if __name__ == "__main__":
+    main()
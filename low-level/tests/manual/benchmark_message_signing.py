@@ -0,0 +1,111 @@
+#!/usr/bin/python3.6
+
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+"""
+ ****************************************************************************
+  Description:       Measures signing and serializing an outgoing message, as
+                    EgressProcessor._add_signature did before and does with
+                    MessageSigner, and the payload rendering of
+                    IngressProcessor verification. The 'none' libsspl_sec
+                    backend generates tokens without asking the key manager,
+                    so the saving per message is a lower bound.
+
+  Usage:             python3 benchmark_message_signing.py [messages] [library]
+ ****************************************************************************
+"""
+
+import ctypes
+import json
+import os
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", ".."))
+from framework.utils.message_signer import MessageSigner, render_message
+
+USERNAME = "sspl-ll"
+AUTHN_TOKEN = "ALOIUD986798df69a8koDISLKJ282983"
+EXPIRES = 3600
+
+# A sensor response of typical size
+JSON_MSG = {
+    "username": "sspl-ll", "signature": "N/A", "time": "1614252436",
+    "expires": 3600, "title": "SSPL Sensor Response",
+    "description": "Seagate Storage Platform Library - Sensor Response",
+    "message": {
+        "sspl_ll_msg_header": {"schema_version": "1.0.0",
+                               "sspl_version": "2.0.0",
+                               "msg_version": "1.0.0"},
+        "sensor_response_type": {
+            "alert_type": "fault", "severity": "critical",
+            "alert_id": "16142524361", "host_id": "srvnode-1",
+            "info": {"resource_type": "enclosure:hw:disk",
+                     "resource_id": "disk_00.12", "event_time": "1614252436",
+                     "site_id": "DC01", "rack_id": "RC01", "node_id": "SN01",
+                     "cluster_id": "CC01", "description": "Disk missing"},
+            "specific_info": {"durable-id": "disk_00.%d" % slot
+                              for slot in range(20)}}}}
+
+
+def sign_before(sec_lib, json_msg):
+    """EgressProcessor._add_signature and json.dumps as they were"""
+    json_msg["username"] = USERNAME
+    json_msg["expires"] = EXPIRES
+    json_msg["time"] = str(int(time.time()))
+    token = ctypes.create_string_buffer(sec_lib.sspl_get_token_length())
+    sec_lib.sspl_generate_session_token(USERNAME, len(AUTHN_TOKEN) + 1,
+                                        AUTHN_TOKEN, EXPIRES, token)
+    sig = ctypes.create_string_buffer(sec_lib.sspl_get_sig_length())
+    sec_lib.sspl_sign_message(len(json_msg) + 1, str(json_msg), USERNAME,
+                              token, sig)
+    json_msg["signature"] = str(sig.raw, encoding='utf-8')
+    return json.dumps(json_msg)
+
+
+def sign_after(signer, json_msg):
+    """EgressProcessor._add_signature with a MessageSigner"""
+    json_msg["username"] = USERNAME
+    json_msg["expires"] = EXPIRES
+    json_msg["time"] = str(int(time.time()))
+    body = json.dumps(json_msg.get("message"))
+    json_msg["signature"] = signer.sign(body.encode())
+    return render_message(json_msg, body)
+
+
+def main():
+    messages = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    sec_lib = ctypes.cdll.LoadLibrary(
+        sys.argv[2] if len(sys.argv) > 2 else 'libsspl_sec.so.0')
+    signer = MessageSigner(sec_lib, USERNAME, AUTHN_TOKEN, EXPIRES)
+    message = JSON_MSG["message"]
+    cases = [
+        ("egress, before", lambda: sign_before(sec_lib, dict(JSON_MSG))),
+        ("egress, MessageSigner", lambda: sign_after(signer, dict(JSON_MSG))),
+        ("ingress, str(message)", lambda: str(message)),
+        ("ingress, json bytes", lambda: json.dumps(message).encode()),
+    ]
+    print(f"{messages} messages")
+    for name, func in cases:
+        elapsed = timeit.timeit(func, number=messages)
+        print(f"{name:24} {elapsed / messages * 1e6:9.2f} us/message"
+              f" {messages / elapsed:12.0f} messages/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/python3.6
+
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+"""
+ ****************************************************************************
+  Description:       Measures messages/sec of building and serializing
+                    RealStorDiskDataMsg, IEMDataMsg and NodeIPMIDataMsg
+                    (NodeHWDataMsg) messages. It compares the former per
+                    message schema load and jsonschema.validate() with the
+                    process wide compiled validators, with validation on and
+                    with message_validation set to debug.
+
+  Usage:             python3 benchmark_message_validation.py [messages]
+ ****************************************************************************
+"""
+
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", ".."))
+from jsonschema import Draft3Validator, validate
+
+from json_msgs.messages import schema_registry
+from json_msgs.messages.base_msg import BaseMsg
+from json_msgs.messages.sensors import base_sensors_msg
+from json_msgs.messages.sensors.base_sensors_msg import BaseSensorMsg
+from json_msgs.messages.sensors.iem_data import IEMDataMsg
+from json_msgs.messages.sensors.node_hw_data import NodeIPMIDataMsg
+from json_msgs.messages.sensors.realstor_disk_data import RealStorDiskDataMsg
+
+SCHEMA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                          "..", "..", "json_msgs", "schemas")
+
+DISK_INFO = {"resource_type": "enclosure:hw:disk", "fru": "true",
+             "event_time": "1614252436", "resource_id": "disk_00.12"}
+DISK_SPECIFIC_INFO = {"health-reason": "The disk is missing.",
+                      "durable-id": "disk_00.12", "serial-number": "ZC18AD",
+                      "health": "Fault", "status": "Missing", "size": "N/A"}
+IEM_INFO = {"event_time": "1614252436", "description": "Test IEM",
+            "impact": "NA", "recommendation": "NA", "alert_type": "get",
+            "severity": "info", "source_id": "S", "component_id": "SSP",
+            "module_id": "SSP", "event_id": "001", "IEC": "IS01000001"}
+NODE_FRU = {"alert_type": "fault", "severity": "critical",
+            "alert_id": "16142524361", "host_id": "srvnode-1",
+            "info": {"resource_type": "node:fru:fan",
+                     "resource_id": "Fan 1A", "event_time": "1614252436"},
+            "specific_info": {"fru_id": "Fan 1A", "Sensor Reading": "N/A"}}
+
+MESSAGES = [
+    ("RealStorDiskDataMsg",
+     lambda: RealStorDiskDataMsg("srvnode-1", "fault", "16142524361",
+                                 "critical", DISK_INFO, DISK_SPECIFIC_INFO)),
+    ("IEMDataMsg", lambda: IEMDataMsg(IEM_INFO)),
+    ("NodeIPMIDataMsg", lambda: NodeIPMIDataMsg(NODE_FRU)),
+]
+
+
+def legacy_validate_msg(self, _jsonMsg):
+    """BaseSensorMsg.validateMsg() as it was, kept here as the baseline"""
+    fileName = os.path.join(base_sensors_msg.RESOURCE_PATH + '/sensors',
+                            self.JSON_SENSOR_SCHEMA)
+    with open(fileName, 'r') as f:
+        _schema = f.read()
+    schema = json.loads(' '.join(_schema.split()))
+    Draft3Validator.check_schema(schema)
+    self.prepare_message(_jsonMsg, "sensor_response_type")
+    _jsonMsg = self.normalize_kv(_jsonMsg)
+    validate(_jsonMsg, schema)
+    return _jsonMsg
+
+
+def rate(make_msg, count):
+    start = time.perf_counter()
+    for _ in range(count):
+        make_msg().getJson()
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    base_sensors_msg.RESOURCE_PATH = SCHEMA_DIR
+    # Avoid reading sspl config for the identity fields
+    BaseMsg._identity = {"site_id": "DC01", "node_id": "SN01",
+                         "rack_id": "RC01", "cluster_id": "CC01"}
+    validate_msg = BaseSensorMsg.validateMsg
+
+    print(f"{count} messages per run, messages/sec")
+    print(f"{'':22}{'legacy':>10}{'compiled':>10}{'debug only':>12}")
+    for name, make_msg in MESSAGES:
+        BaseSensorMsg.validateMsg = legacy_validate_msg
+        legacy = rate(make_msg, count)
+        BaseSensorMsg.validateMsg = validate_msg
+        schema_registry.set_validation_mode(schema_registry.VALIDATE_ALWAYS)
+        compiled = rate(make_msg, count)
+        schema_registry.set_validation_mode(schema_registry.VALIDATE_DEBUG)
+        debug_only = rate(make_msg, count)
+        print(f"{name:22}{legacy:10.0f}{compiled:10.0f}{debug_only:12.0f}")
+
+
+if __name__ == "__main__":
+    main()
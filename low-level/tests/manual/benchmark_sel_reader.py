@@ -0,0 +1,102 @@
+#!/usr/bin/python3.6
+
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+"""
+ ****************************************************************************
+  Description:       Times NodeHWsensor SEL list processing on a synthetic
+                    SEL, comparing the former two pass scan of the full list
+                    with the single pass parser on the full list and on the
+                    tail fetched with 'sel list last <n>'.
+
+  Usage:             python3 benchmark_sel_reader.py [entries] [new_entries]
+ ****************************************************************************
+"""
+
+import os
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", ".."))
+from sensors.impl.generic.node_hw import NodeHWsensor
+
+DEVICES = ["Fan #0x30", "Power Supply #0x51", "Power Unit #0x52",
+           "Drive Slot / Bay #0x60"]
+
+
+def write_sel(path, first, count):
+    with open(path, "w") as sel_file:
+        for index in range(first, first + count):
+            sel_file.write(
+                f"{index:x} | 04/16/2019 | 05:29:09 | "
+                f"{DEVICES[index % len(DEVICES)]} | "
+                f"Lower Non-critical going low  | Asserted\n")
+
+
+def two_pass(list_file, last_index):
+    """The scan NodeHWsensor did before, kept here as the baseline"""
+    def get_sel_event():
+        found = False
+        list_file.seek(0, os.SEEK_SET)
+        for line in list_file:
+            if not found:
+                if line.split("|")[0].strip() == last_index:
+                    found = True
+                continue
+            yield NodeHWsensor._make_sel_event(line)
+        if not found:
+            list_file.seek(0, os.SEEK_SET)
+            for line in list_file:
+                yield NodeHWsensor._make_sel_event(line)
+
+    last_fru_index = {}
+    for sel_event in get_sel_event():
+        last_fru_index[sel_event[4]] = sel_event[0]
+    return [sel_event for sel_event in get_sel_event()], last_fru_index
+
+
+def main():
+    entries = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    new_entries = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    last_index = "{0:x}".format(entries - new_entries)
+    runs = 20
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        full_path = os.path.join(tmp_dir, "sel_list")
+        tail_path = os.path.join(tmp_dir, "sel_list_tail")
+        write_sel(full_path, 1, entries)
+        write_sel(tail_path, entries - new_entries + 1, new_entries)
+
+        with open(full_path) as full, open(tail_path) as tail:
+            assert two_pass(full, last_index) == \
+                NodeHWsensor._parse_sel_list(full, last_index)
+            results = [
+                ("two pass, full list", lambda: two_pass(full, last_index)),
+                ("single pass, full list",
+                 lambda: NodeHWsensor._parse_sel_list(full, last_index)),
+                (f"single pass, last {new_entries}",
+                 lambda: NodeHWsensor._parse_sel_list(tail, last_index)),
+            ]
+            print(f"{entries} SEL entries, {new_entries} new, {runs} runs")
+            for name, func in results:
+                elapsed = timeit.timeit(func, number=runs) / runs
+                print(f"{name:28} {elapsed * 1000:9.3f} ms/poll")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/python3.6
+
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+"""
+ ****************************************************************************
+  Description:       Measures MonUtils.sort_by_specific_kv and normalize_kv
+                    on storage health payloads of the size of an enclosure
+                    with 106 drives, as built by StorageHealth from the
+                    responses in unittests/solution/lr2/storage. It compares
+                    the former eval based sort and recursive normalize with
+                    compiled key paths.
+
+  Usage:             python3 benchmark_sort_by_kv.py [drives]
+ ****************************************************************************
+"""
+
+import json
+import os
+import sys
+import timeit
+from unittest.mock import Mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", ".."))
+from framework.utils.mon_utils import MonUtils
+
+UNDESIRED_VALS = ["NA", "N/A", ""]
+LOG = Mock()
+
+
+def legacy_sort_by_specific_kv(data, key_path, log):
+    """MonUtils.sort_by_specific_kv() as it was, kept here as the baseline"""
+    return sorted(data, key=lambda k: eval(f'{k}{key_path}'))
+
+
+def legacy_normalize_kv(item, input_v, replace_v):
+    """MonUtils.normalize_kv() as it was, kept here as the baseline"""
+    if isinstance(item, dict):
+        return {key: legacy_normalize_kv(value, input_v, replace_v)
+            for key, value in item.items()}
+    elif isinstance(item, list):
+        return [legacy_normalize_kv(_, input_v, replace_v) for _ in item]
+    elif item in input_v if isinstance(input_v, list) else item == input_v:
+        return replace_v
+    else:
+        return item
+
+
+def load_drives(count):
+    """Health entries of count drives, in the format of get_drives_info()"""
+    storage_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+        "..", "..", "..", "unittests", "solution", "lr2", "storage")
+    sys.path.insert(0, storage_dir)
+    from encl_api_response import DRIVE_RESPONSE
+    drive = json.loads(DRIVE_RESPONSE)["api-response"]["drives"][0]
+    drives = []
+    for slot in reversed(range(count)):
+        specifics = dict(drive, slot=slot, health="NA",
+                         **{"durable-id": "disk_00.%02d" % slot,
+                            "serial-number": "Z4H%017d" % (slot * 7919 % count)})
+        drives.append({
+            "uid": specifics["durable-id"], "fru": "true", "last_updated": "",
+            "health": {"status": "OK", "description": "",
+                       "recommendation": "NA", "specifics": [specifics]}})
+    return drives
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 106
+    drives = load_drives(count)
+    uid_path = "['uid']"
+    serial_path = "['health']['specifics'][0]['serial-number']"
+    cases = [
+        ("sort ['uid'], eval", lambda: legacy_sort_by_specific_kv(
+            drives, uid_path, LOG)),
+        ("sort ['uid'], compiled", lambda: MonUtils.sort_by_specific_kv(
+            drives, uid_path, LOG)),
+        ("sort serial, eval", lambda: legacy_sort_by_specific_kv(
+            drives, serial_path, LOG)),
+        ("sort serial, compiled", lambda: MonUtils.sort_by_specific_kv(
+            drives, serial_path, LOG)),
+        ("normalize, recursive", lambda: legacy_normalize_kv(
+            drives, UNDESIRED_VALS, "Not Available")),
+        ("normalize, set lookup", lambda: MonUtils.normalize_kv(
+            drives, UNDESIRED_VALS, "Not Available")),
+    ]
+    print(f"{count} drives, ms per call")
+    for name, func in cases:
+        number = 20
+        elapsed = timeit.timeit(func, number=number) / number
+        print(f"{name:28} {elapsed * 1e3:9.3f}")
+
+
+if __name__ == "__main__":
+    main()
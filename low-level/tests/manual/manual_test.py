@@ -304,11 +304,11 @@ class ManualTest():
             SSPL_SEC.sspl_generate_session_token(
                                 self._signature_user, authn_token_len,
                                 self._signature_token, session_length, token)
-            # Generate the signature
-            msg_len = len(str(jsonMsg)) + 1
+            # Generate the signature over the serialized message body
+            payload = json.dumps(jsonMsg.get("message")).encode()
             sig = ctypes.create_string_buffer(SSPL_SEC.sspl_get_sig_length())
             # Calculates the security signature and stores it in sig
-            SSPL_SEC.sspl_sign_message(msg_len, str(jsonMsg), self._signature_user,
+            SSPL_SEC.sspl_sign_message(len(payload), payload, self._signature_user,
                                    token, sig)
             # Add the signature calculated using the SSPL_SEC security libs
             jsonMsg["signature"] = str(sig.raw)
@@ -571,11 +571,12 @@ class ManualTest():
             username   = ingressMsg.get("username")
             signature  = ingressMsg.get("signature")
             message    = ingressMsg.get("message")
-            msg_len    = len(message) + 1
+            # The signature covers the serialized message body
+            payload    = json.dumps(message).encode()
             try:
                 #Verifies the authenticity of an ingress message
                 if use_security_lib:
-                    assert(SSPL_SEC.sspl_verify_message(msg_len, str(message), username, signature) == 0)
+                    assert(SSPL_SEC.sspl_verify_message(len(payload), payload, username, signature) == 0)
             except:
                 print("Authentication failed on message: %s" % ingressMsg)
 
@@ -661,11 +662,12 @@ class ManualTest():
             username   = ingressMsg.get("username")
             signature  = ingressMsg.get("signature")
             message    = ingressMsg.get("message")
-            msg_len    = len(message) + 1
+            # The signature covers the serialized message body
+            payload    = json.dumps(message).encode()
             try:
                 # Verifies the authenticity of an ingress message
                 if use_security_lib:
-                    assert(SSPL_SEC.sspl_verify_message(msg_len, str(message), username, signature) == 0)
+                    assert(SSPL_SEC.sspl_verify_message(len(payload), payload, username, signature) == 0)
             except:
                 print("Authentication failed on message: %s" % ingressMsg)
 
@@ -178,10 +178,10 @@ class EgressProcessorTests(ScheduledModuleThread, InternalMsgQ):
                 self._signature_user, authn_token_len,
                 self._signature_token, session_length, token)
 
-            # Generate the signature
-            msg_len = len(self._jsonMsg) + 1
+            # Generate the signature over the serialized message body
+            payload = json.dumps(self._jsonMsg.get("message")).encode()
             sig = ctypes.create_string_buffer(SSPL_SEC.sspl_get_sig_length())
-            SSPL_SEC.sspl_sign_message(msg_len, str(self._jsonMsg),
+            SSPL_SEC.sspl_sign_message(len(payload), payload,
                                        self._signature_user,
                                        token, sig)
 
@@ -157,9 +157,10 @@ class RabbitMQingressProcessorTests(ScheduledModuleThread, InternalMsgQ):
             assert(signature is not None)
             assert(message is not None)
 
-            msg_len   = len(message) + 1
+            # The signature covers the serialized message body
+            payload   = json.dumps(message).encode()
 
-            if SSPL_SEC.sspl_verify_message(msg_len, str(message), username, signature) != 0:
+            if SSPL_SEC.sspl_verify_message(len(payload), payload, username, signature) != 0:
                 logger.error("Authentication failed on message: %s" % ingressMsg)
                 return
 
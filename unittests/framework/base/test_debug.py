@@ -0,0 +1,64 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import unittest
+from unittest.mock import Mock, patch
+
+from framework.base import debug
+from framework.base.debug import Debug
+
+
+class Module(Debug):
+
+    @staticmethod
+    def name():
+        return "Module"
+
+
+class TestDebug(unittest.TestCase):
+    """Test level gated, deferred formatting of Debug._log_debug."""
+
+    def setUp(self):
+        self.module = Module()
+        self.logger = Mock()
+        for target, value in (("logger", self.logger),
+                              ("use_journal", False),
+                              ("debug_enabled", lambda: False)):
+            patcher = patch.object(debug, target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_nothing_formatted_when_disabled(self):
+        message = Mock()
+        self.module._log_debug(message)
+        self.module._log_debug("msg: %s", Mock(__str__=message))
+        message.assert_not_called()
+        self.logger.debug.assert_not_called()
+
+    def test_args_formatted_for_module_in_debug_mode(self):
+        self.module._check_debug({"sspl_ll_debug": {"debug_component": "all"}})
+        self.module._log_debug("msg: %s, %d", "a", 1)
+        self.module._log_debug(lambda: "deferred")
+        self.logger.debug.assert_any_call("Module, msg: a, 1")
+        self.logger.debug.assert_any_call("Module, deferred")
+
+    def test_global_debug_level(self):
+        with patch.object(debug, "debug_enabled", lambda: True):
+            self.module._log_debug("100%")
+        self.logger.debug.assert_called_once_with("Module, 100%")
+
+
+if __name__ == "__main__":
+    unittest.main()
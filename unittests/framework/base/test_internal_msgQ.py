@@ -0,0 +1,69 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import queue
+import threading
+import time
+import unittest
+
+from framework.base.debug import Debug
+from framework.base.internal_msgQ import InternalMsgQ
+
+
+class Module(InternalMsgQ, Debug):
+
+    def __init__(self, name, msgQlist):
+        super(Module, self).__init__()
+        self._name = name
+        self.initialize_msgQ(msgQlist)
+
+    def name(self):
+        return self._name
+
+
+class TestInternalMsgQ(unittest.TestCase):
+    """Test timed reads of InternalMsgQ."""
+
+    def setUp(self):
+        self.msgQlist = {"reader": queue.Queue()}
+        self.reader = Module("reader", self.msgQlist)
+        self.writer = Module("writer", self.msgQlist)
+
+    def _write_later(self, module_name, msg, delay=0.05):
+        timer = threading.Timer(
+            delay, self.writer._write_internal_msgQ, (module_name, msg))
+        timer.start()
+        self.addCleanup(timer.cancel)
+
+    def test_timed_read_times_out(self):
+        start = time.monotonic()
+        self.assertEqual(self.reader._read_my_msgQ(timeout=0.1), (None, None))
+        self.assertGreaterEqual(time.monotonic() - start, 0.1)
+
+    def test_read_until_returns_on_write(self):
+        self._write_later("reader", {"request": "cpu"})
+        start = time.monotonic()
+        jsonMsg, _ = self.reader._read_my_msgQ_until(start + 5)
+        self.assertEqual(jsonMsg, {"request": "cpu"})
+        self.assertLess(time.monotonic() - start, 1)
+
+    def test_read_until_past_deadline(self):
+        self.assertEqual(
+            self.reader._read_my_msgQ_until(time.monotonic() - 1),
+            (None, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import json
+import queue
+import threading
+import unittest
+
+from framework.base.msg_queue import (MsgQueue, classify_msg, CONTROL, DEBUG,
+                                      FAULT, FAULT_RESOLVED, TELEMETRY)
+
+
+def alert(alert_type, resource_id="psu_0"):
+    return json.dumps({"message": {"sensor_response_type": {
+        "alert_type": alert_type, "severity": "critical",
+        "info": {"resource_type": "enclosure:hw:psu",
+                 "resource_id": resource_id}}}})
+
+
+def drain(q):
+    msgs = []
+    while not q.empty():
+        msgs.append(q.get_nowait()[0])
+    return msgs
+
+
+class TestMsgQueue(unittest.TestCase):
+    """Test classes, priorities and policies of MsgQueue."""
+
+    def test_classify(self):
+        self.assertEqual(classify_msg(alert("fault")),
+                         (FAULT, ("enclosure:hw:psu", "psu_0")))
+        self.assertEqual(classify_msg(json.loads(alert("insertion"))),
+                         (FAULT_RESOLVED, ("enclosure:hw:psu", "psu_0")))
+        self.assertEqual(classify_msg(alert("get")), (TELEMETRY, None))
+        self.assertEqual(classify_msg({"actuator_request_type": {"logging": {
+            "log_level": "LOG_DEBUG"}}}), (DEBUG, None))
+        self.assertEqual(classify_msg({"sspl_ll_debug": {}}), (CONTROL, None))
+        self.assertEqual(classify_msg("shutdown"), (CONTROL, None))
+
+    def test_read_by_priority(self):
+        q = MsgQueue(0)
+        for msg in (alert("get"), {"ack": 1}, alert("fault_resolved"),
+                    alert("fault", "psu_1")):
+            q.put((msg, None))
+        self.assertEqual(drain(q), [alert("fault", "psu_1"),
+                                    alert("fault_resolved"), {"ack": 1},
+                                    alert("get")])
+
+    def test_fault_keeps_order_of_resource(self):
+        q = MsgQueue(0)
+        q.put((alert("fault_resolved"), None))
+        q.put((alert("fault"), None))
+        q.put((alert("fault", "psu_1"), None))
+        self.assertEqual(drain(q), [alert("fault", "psu_1"),
+                                    alert("fault_resolved"), alert("fault")])
+        q.put((alert("fault"), None))
+        self.assertEqual(drain(q), [alert("fault")])
+
+    def test_policies_when_full(self):
+        q = MsgQueue(2)
+        event = threading.Event()
+        q.put((alert("get", "cpu_0"), event))
+        q.put((alert("get", "cpu_1"), None))
+        # Telemetry replaces its oldest message
+        q.put((alert("get", "cpu_2"), None))
+        self.assertTrue(event.is_set())
+        # Alerts evict telemetry, then overflow
+        q.put((alert("fault"), None))
+        q.put((alert("fault", "psu_1"), None))
+        q.put((alert("fault", "psu_2"), None))
+        q.put(({"actuator_request_type": {"logging": {
+            "log_level": "LOG_DEBUG"}}}, None))
+        self.assertEqual(q.qsize(), 3)
+        counters = q.get_counters()
+        self.assertEqual(counters["dropped"],
+                         {FAULT: 0, FAULT_RESOLVED: 0, CONTROL: 0,
+                          TELEMETRY: 3, DEBUG: 1})
+        self.assertEqual(counters["overflowed"][FAULT], 1)
+        self.assertEqual(counters["high_water"], 3)
+        self.assertEqual(counters["lane_high_water"][TELEMETRY], 2)
+        with q.mutex:
+            self.assertEqual(len(q.queue), 3)
+
+    def test_blocking_get(self):
+        q = MsgQueue()
+        timer = threading.Timer(0.05, q.put, ((alert("fault"), None),))
+        timer.start()
+        self.addCleanup(timer.cancel)
+        self.assertEqual(q.get(timeout=5), (alert("fault"), None))
+        self.assertRaises(queue.Empty, q.get, timeout=0.01)
+
+    def test_invalid_policy(self):
+        self.assertRaises(ValueError, MsgQueue, 10, {"telemetry": "block"})
+        self.assertRaises(ValueError, MsgQueue, 10, {"bulk": "overflow"})
+
+
+if __name__ == "__main__":
+    unittest.main()
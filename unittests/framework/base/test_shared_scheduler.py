@@ -0,0 +1,97 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import threading
+import time
+import unittest
+
+from framework.base.shared_scheduler import ModuleScheduler, SharedScheduler
+
+
+class TestSharedScheduler(unittest.TestCase):
+    """Test ModuleScheduler events running on a SharedScheduler."""
+
+    def setUp(self):
+        self.shared = SharedScheduler(workers=4)
+        self.exited = threading.Event()
+        self.exit_error = None
+
+    def _module(self, name):
+        module = ModuleScheduler(name, self.shared)
+
+        def on_exit(err):
+            self.exit_error = err
+            self.exited.set()
+        module.exit_callback = on_exit
+        return module
+
+    def test_events_run_in_time_order(self):
+        calls = []
+        module = self._module("first")
+        module.enter(0.05, 1, calls.append, ("late",))
+        module.enter(0.01, 1, calls.append, ("early",))
+        module.start()
+        self.assertTrue(self.exited.wait(2))
+        self.assertIsNone(self.exit_error)
+        self.assertListEqual(calls, ["early", "late"])
+
+    def test_module_events_never_overlap(self):
+        active = []
+        overlap = []
+        module = self._module("serial")
+
+        def action():
+            active.append(1)
+            overlap.append(len(active) > 1)
+            time.sleep(0.01)
+            active.pop()
+        for _ in range(5):
+            module.enter(0, 1, action)
+        module.start()
+        self.assertTrue(self.exited.wait(2))
+        self.assertListEqual(overlap, [False] * 5)
+
+    def test_failure_cancels_module_events(self):
+        later = []
+        module = self._module("failing")
+        module.enter(0, 1, lambda: 1 / 0)
+        module.enter(0.2, 1, later.append, (True,))
+        module.start()
+        self.assertTrue(self.exited.wait(2))
+        self.assertIsInstance(self.exit_error, ZeroDivisionError)
+        self.assertTrue(module.empty())
+        time.sleep(0.3)
+        self.assertListEqual(later, [])
+
+    def test_queue_listener_wakes_pending_run(self):
+        ran = threading.Event()
+        module = self._module("waiting")
+        module.enter(60, 1, ran.set)
+        self.shared.set_queue_listener("waiting",
+                                       lambda: module.wake(ran.set))
+        module.start()
+        self.shared.notify_queue("waiting")
+        self.assertTrue(ran.wait(2))
+
+    def test_cancel_unknown_event(self):
+        module = self._module("cancel")
+        event = module.enter(60, 1, print)
+        module.cancel(event)
+        self.assertRaises(ValueError, module.cancel, event)
+        self.assertListEqual(module.queue, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
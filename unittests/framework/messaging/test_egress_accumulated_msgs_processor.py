@@ -0,0 +1,164 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import json
+import unittest
+from unittest.mock import Mock, patch
+
+from framework.messaging import egress_accumulated_msgs_processor as module
+from framework.messaging.egress_accumulated_msgs_processor import \
+    EgressAccumulatedMsgsProcessor
+
+
+class BusError(Exception):
+    pass
+
+
+class FakeProducer(object):
+    """Records sent lists, raising BusError while fail is set."""
+
+    def __init__(self, calls):
+        self.calls = calls
+        self.fail = False
+
+    def send(self, messages):
+        if self.fail:
+            raise BusError("bus unavailable")
+        self.calls.append(("send", list(messages)))
+
+
+class FakeStoreQueue(object):
+
+    def __init__(self, items, calls):
+        self.items = list(items)
+        self.calls = calls
+
+    def is_empty(self):
+        return not self.items
+
+    def get_many(self, count):
+        return self.items[:count]
+
+    def delete_many(self, count):
+        self.calls.append(("delete_many", count))
+        del self.items[:count]
+
+
+def alert(resource_id):
+    return json.dumps({"message": {"sensor_response_type": {
+        "alert_type": "fault", "info": {"resource_id": resource_id}}}})
+
+
+def iem():
+    return json.dumps({"iem": {"module": "SSP", "event_code": "001",
+                               "severity": "E", "description": "x"}})
+
+
+@patch.object(module, "EventMessageError", BusError)
+@patch.object(module, "MessageBusError", BusError)
+@patch.object(module, "MessageProducer", FakeProducer)
+class TestDrain(unittest.TestCase):
+    """Test batched draining and backoff of EgressAccumulatedMsgsProcessor."""
+
+    def make_processor(self, items, batch_size=2):
+        self.calls = []
+        processor = object.__new__(EgressAccumulatedMsgsProcessor)
+        processor.store_queue = FakeStoreQueue(items, self.calls)
+        processor._producer = FakeProducer(self.calls)
+        processor._batch_size = batch_size
+        processor._idle_interval = 30
+        processor._max_backoff = 300
+        processor._backoff = 30
+        processor._drained_count = 0
+        processor._drain_rate = 0.0
+        return processor
+
+    def test_batches_deleted_after_send(self):
+        items = [alert(f"psu_{index}") for index in range(5)]
+        processor = self.make_processor(items)
+        self.assertEqual(processor._drain(), 30)
+        self.assertEqual(self.calls, [
+            ("send", items[0:2]), ("delete_many", 2),
+            ("send", items[2:4]), ("delete_many", 2),
+            ("send", items[4:5]), ("delete_many", 1)])
+        self.assertEqual(processor.drained_count, 5)
+
+    def test_failed_send_keeps_batch(self):
+        items = ["not json", alert("psu_0"), alert("psu_1")]
+        processor = self.make_processor(items, batch_size=3)
+        processor._producer.fail = True
+        self.assertEqual(processor._drain(), 30)
+        # Only the undecodable message ahead of the failed send is deleted
+        self.assertEqual(self.calls, [("delete_many", 1)])
+        self.assertEqual(processor.store_queue.items, items[1:])
+
+    @patch.object(module, "Iem")
+    def test_partial_batch_failure(self, iem_cls):
+        iem_cls.raise_iem_event.side_effect = RuntimeError("no IEM")
+        stale = json.dumps({"message": {"actuator_response_type": {
+            "info": {"event_time": "0"}}}})
+        items = [stale, alert("psu_0"), iem(), alert("psu_1")]
+        processor = self.make_processor(items, batch_size=4)
+        processor._drain()
+        # Messages before the failed IEM are sent, then deleted with the
+        # stale actuator response, the IEM and later ones stay queued
+        self.assertEqual(self.calls, [("send", [items[1]]),
+                                      ("delete_many", 2)])
+        self.assertEqual(processor.store_queue.items, items[2:])
+
+    def test_backoff_grows_and_resets(self):
+        processor = self.make_processor([alert("psu_0")])
+        processor._producer.fail = True
+        delays = [processor._drain() for _ in range(6)]
+        self.assertEqual(delays, [30, 60, 120, 240, 300, 300])
+        processor._producer.fail = False
+        self.assertEqual(processor._drain(), 30)
+        processor.store_queue.items.append(alert("psu_1"))
+        processor._producer.fail = True
+        self.assertEqual(processor._drain(), 30)
+        self.assertEqual(processor._drain(), 60)
+
+    def test_missing_producer_is_recreated(self):
+        processor = self.make_processor([alert("psu_0")])
+        processor._producer = None
+        processor.create_MsgProducer_obj = Mock()
+        self.assertEqual(processor._drain(), 30)
+        processor.create_MsgProducer_obj.assert_called_once_with()
+        self.assertEqual(self.calls, [])
+
+
+class TestReadConfig(unittest.TestCase):
+    """Test drain settings of EgressAccumulatedMsgsProcessor."""
+
+    @patch.object(module, "Conf")
+    def test_defaults_when_config_fails(self, conf):
+        conf.get.side_effect = RuntimeError("no config")
+        processor = object.__new__(EgressAccumulatedMsgsProcessor)
+        processor._read_config()
+        self.assertEqual((processor._batch_size, processor._idle_interval,
+                          processor._max_backoff), (100, 30, 300))
+
+    @patch.object(module, "Conf")
+    def test_drain_keys_in_processor_section(self, conf):
+        conf.get.side_effect = lambda index, key, default: default
+        processor = object.__new__(EgressAccumulatedMsgsProcessor)
+        processor._read_config()
+        sections = {call[0][1].split(">")[0]
+                    for call in conf.get.call_args_list}
+        self.assertEqual(sections, {"EGRESSPROCESSOR"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,180 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import json
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+from framework.messaging import egress_processor as module
+from framework.messaging.egress_processor import EgressProcessor
+from framework.utils.alert_coalescer import AlertCoalescer
+
+
+class BusError(Exception):
+    pass
+
+
+class FakeProducer(object):
+    """Records sent lists and whether their events were set by then."""
+
+    def __init__(self, events):
+        self.events = events
+        self.sent = []
+        self.fail = False
+
+    def send(self, messages):
+        self.events_set = [event.is_set() for event in self.events]
+        if self.fail:
+            raise BusError("bus unavailable")
+        self.sent.append([json.loads(message)["message"]
+                          for message in messages])
+
+
+def alert(resource_id):
+    return {"message": {"sensor_response_type": {
+        "alert_type": "fault", "info": {"resource_type": "fan",
+                                        "resource_id": resource_id}}}}
+
+
+def ack():
+    return {"message": {"actuator_response_type": {"ack": {"ack_msg": "ok"}}}}
+
+
+@patch.object(module, "MessageBusError", BusError)
+@patch.object(module, "MessageProducer", FakeProducer)
+class TestPublishBatch(unittest.TestCase):
+    """Test batching, linger and spilling of EgressProcessor."""
+
+    def setUp(self):
+        self.events = []
+        processor = object.__new__(EgressProcessor)
+        processor._log_debug = Mock()
+        processor._signer = None
+        processor._signature_user = "sspl-ll"
+        processor._signature_expires = 3600
+        processor._coalescer = AlertCoalescer(0, 0, 60)
+        processor._request_shutdown = False
+        processor._batch = []
+        processor._batch_started = None
+        processor._batch_size = 3
+        processor._linger_time = 0.05
+        processor.store_queue = Mock()
+        processor.store_queue.is_empty.return_value = True
+        processor._producer = FakeProducer(self.events)
+        self.processor = processor
+
+    def transmit(self, *msgs):
+        pairs = []
+        for msg in msgs:
+            event = threading.Event()
+            self.events.append(event)
+            pairs.append((msg, event))
+        self.processor._transmit_msgs(pairs)
+
+    def spilled(self):
+        return [[json.loads(message)["message"] for message in call[0][0]]
+                for call in self.processor.store_queue.put_many.call_args_list]
+
+    def test_full_batch_is_sent(self):
+        self.transmit(alert("fan_0"), alert("fan_1"))
+        self.assertEqual(self.processor._producer.sent, [])
+        self.transmit(alert("fan_2"), alert("fan_3"))
+        self.assertEqual(self.processor._producer.sent,
+                         [[alert(f"fan_{index}")["message"]
+                           for index in range(3)]])
+        self.assertEqual(len(self.processor._batch), 1)
+        self.assertEqual([event.is_set() for event in self.events],
+                         [True, True, True, False])
+
+    def test_events_set_after_send(self):
+        self.transmit(alert("fan_0"), ack())
+        self.processor._send_batch()
+        self.assertEqual(self.processor._producer.events_set, [False, False])
+        self.assertTrue(all(event.is_set() for event in self.events))
+
+    def test_failed_send_spills_alerts_in_order(self):
+        self.processor._producer.fail = True
+        self.transmit(alert("fan_0"), ack(), alert("fan_1"))
+        self.assertEqual(self.processor._producer.events_set,
+                         [False, False, False])
+        self.assertEqual(self.spilled(), [[alert("fan_0")["message"],
+                                           alert("fan_1")["message"]]])
+        self.assertTrue(all(event.is_set() for event in self.events))
+
+    def test_alerts_queued_behind_accumulated(self):
+        self.processor.store_queue.is_empty.return_value = False
+        self.transmit(alert("fan_0"), ack())
+        self.processor._send_batch()
+        self.assertEqual(self.spilled(), [[alert("fan_0")["message"]]])
+        self.assertEqual(self.processor._producer.sent, [[ack()["message"]]])
+        self.assertTrue(all(event.is_set() for event in self.events))
+
+    def test_missing_producer_spills_batch(self):
+        self.processor._producer = None
+        self.processor.create_MsgProducer_obj = Mock()
+        self.transmit(alert("fan_0"))
+        self.processor._send_batch()
+        self.assertEqual(self.spilled(), [[alert("fan_0")["message"]]])
+        self.processor.create_MsgProducer_obj.assert_called_once_with()
+        self.assertTrue(self.events[0].is_set())
+
+    def test_linger_expiry(self):
+        processor = self.processor
+        pending = [(alert("fan_0"), None)]
+        lingering = [(alert("fan_1"), None)]
+        deadlines = []
+
+        def read_until(deadline):
+            deadlines.append(deadline)
+            if lingering:
+                return lingering.pop()
+            time.sleep(max(0, deadline - time.monotonic()))
+            return None, None
+
+        processor._is_my_msgQ_empty = lambda: not pending
+        processor._read_my_msgQ = pending.pop
+        processor._read_my_msgQ_until = read_until
+        processor._log_counters = Mock()
+        processor._scheduler = Mock()
+        processor._priority = EgressProcessor.PRIORITY
+        start = time.monotonic()
+        processor.run()
+        self.assertGreaterEqual(time.monotonic() - start, 0.05)
+        self.assertEqual(processor._producer.sent,
+                         [[alert("fan_0")["message"],
+                           alert("fan_1")["message"]]])
+        self.assertEqual(deadlines[0], deadlines[-1])
+        self.assertEqual(processor._batch, [])
+
+
+class TestReadConfig(unittest.TestCase):
+    """Test coalescing and batching settings of EgressProcessor."""
+
+    @patch.object(module, "Conf")
+    def test_defaults_when_config_fails(self, conf):
+        conf.get.side_effect = RuntimeError("no config")
+        processor = object.__new__(EgressProcessor)
+        processor._read_config()
+        self.assertEqual(processor._batch_size, 50)
+        self.assertEqual(processor._linger_time, 0.01)
+        self.assertEqual((processor._coalesce_window,
+                          processor._coalesce_rate_limit,
+                          processor._coalesce_rate_period), (2, 10, 60))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+
+import json
+import threading
+import unittest
+from unittest.mock import Mock
+
+import requests
+
+from framework.platforms.realstor.realstor_enclosure import RealStorEnclosure
+from framework.utils.single_flight_cache import SingleFlightCache
+from framework.utils.webservices import WebServices
+
+
+def cliapi_response(status_code, body=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(body or {
+        "status": [{"return-code": 0, "response": "Command completed"}]
+    }).encode()
+    return response
+
+
+class TestWsRequestMany(unittest.TestCase):
+    """Test concurrent cli api requests of the enclosure."""
+
+    def setUp(self):
+        self.encl = object.__new__(RealStorEnclosure)
+        self.encl.ws = WebServices()
+        self.addCleanup(self.encl.ws.close)
+        self.encl.ws_cache = SingleFlightCache(0)
+        self.encl._login_lock = threading.Lock()
+        self.encl.common_reqheaders = {"sessionKey": "expired"}
+        self.encl.active_ip = "10.0.0.2"
+        self.encl.active_wsport = "80"
+        self.encl.mc_timeout_counter = 0
+        self.encl.login = Mock(side_effect=self.login)
+        self.frus = ["enclosures", "controllers", "power-supplies",
+                     "fan-modules"]
+        self.all_requested = threading.Barrier(len(self.frus), timeout=5)
+        self.encl.ws.ws_request = Mock(side_effect=self.ws_request)
+
+    def login(self):
+        self.encl.common_reqheaders["sessionKey"] = "renewed"
+
+    def ws_request(self, method, url, hdrs, postdata, tout):
+        if hdrs["sessionKey"] == "expired":
+            # Every request fails before any of them logs in again
+            self.all_requested.wait()
+            return cliapi_response(WebServices.HTTP_FORBIDDEN)
+        if url.endswith("/show/fan-modules"):
+            return cliapi_response(WebServices.HTTP_NOTFOUND)
+        uri = url[url.index("/api/show/") + len("/api/show/"):]
+        key = {"enclosure": "enclosures"}.get(uri, uri)
+        return cliapi_response(WebServices.HTTP_OK, {
+            "status": [{"return-code": 0}], key: [{"uri": uri}]})
+
+    def test_single_login_on_session_expiry(self):
+        data = self.encl.get_realstor_encl_data_many(self.frus)
+        self.encl.login.assert_called_once()
+        self.assertEqual(data["enclosures"], [{"uri": "enclosure"}])
+        self.assertEqual(data["power-supplies"], [{"uri": "power-supplies"}])
+        # The failing url does not affect the others
+        self.assertEqual(data["fan-modules"], [])
+        self.assertEqual(self.encl.ws.ws_request.call_count,
+                         2 * len(self.frus))
+
+    def test_responses_in_order(self):
+        self.encl.common_reqheaders["sessionKey"] = "renewed"
+        urls = [self.encl.build_url(self.encl.fru_uri_map[fru])
+                for fru in self.frus]
+        responses = self.encl.ws_request_many(urls)
+        self.assertEqual([response.status_code for response in responses],
+                         [WebServices.HTTP_OK] * 3 +
+                         [WebServices.HTTP_NOTFOUND])
+        self.assertEqual(json.loads(responses[1].content)["controllers"],
+                         [{"uri": "controllers"}])
+        self.encl.login.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
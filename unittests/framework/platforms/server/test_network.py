@@ -0,0 +1,92 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import os
+import socket
+import struct
+import tempfile
+import unittest
+
+from framework.platforms.server.network import (
+    IFADDRMSG, IFA_ADDRESS, IFA_LOCAL, NLMSG_DONE, NLMSG_HDR, RTATTR,
+    RTM_NEWADDR, InterfaceStateProvider, Network)
+
+
+def addr_message(index, family, attrs):
+    payload = IFADDRMSG.pack(family, 24, 0, 0, index)
+    for attr_type, value in attrs:
+        attr = RTATTR.pack(RTATTR.size + len(value), attr_type) + value
+        payload += attr + b"\0" * (-len(attr) % 4)
+    return NLMSG_HDR.pack(NLMSG_HDR.size + len(payload), RTM_NEWADDR,
+                          0, 1, 0) + payload
+
+
+class TestNetwork(unittest.TestCase):
+    """Test rtnetlink address parsing and interface state refresh."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.network = Network.__new__(Network)
+        self.network.base_dir = self.tmp_dir.name
+        self.addresses = {"eth0": ["10.0.0.2"]}
+        self.network.get_ipv4_addresses = lambda: self.addresses
+        self._add_interface("eth0", "up", "1")
+        self._add_interface("eth1", "down", "0")
+
+    def _add_interface(self, name, operstate, carrier):
+        os.makedirs(os.path.join(self.tmp_dir.name, name), exist_ok=True)
+        for sysfs_file, value in (("operstate", operstate),
+                                  ("carrier", carrier)):
+            with open(os.path.join(self.tmp_dir.name, name, sysfs_file),
+                      "w") as f:
+                f.write(value + "\n")
+
+    def test_parse_addr_messages(self):
+        ip = socket.inet_aton
+        data = addr_message(2, socket.AF_INET, [(IFA_ADDRESS, ip("10.0.0.9")),
+                                                (IFA_LOCAL, ip("10.0.0.2"))]) \
+            + addr_message(2, socket.AF_INET, [(IFA_ADDRESS, ip("10.0.0.3"))]) \
+            + addr_message(3, socket.AF_INET6, [(IFA_ADDRESS, b"\0" * 16)])
+        addresses = {}
+        self.assertFalse(Network.parse_addr_messages(data, addresses))
+        self.assertEqual(addresses, {2: ["10.0.0.2", "10.0.0.3"]})
+        done = NLMSG_HDR.pack(NLMSG_HDR.size + 4, NLMSG_DONE, 0, 1, 0) + \
+            struct.pack("=i", 0)
+        self.assertTrue(Network.parse_addr_messages(done, addresses))
+
+    def test_refresh_reports_changed_interfaces(self):
+        provider = InterfaceStateProvider(self.network)
+        self.assertEqual(provider.refresh(), {"eth0", "eth1"})
+        self.assertEqual(provider.get("eth0"), ("UP", "10.0.0.2", "CONNECTED"))
+        self.assertEqual(provider.get("eth1"), ("DOWN", "", "DISCONNECTED"))
+        self.assertEqual(provider.refresh(), set())
+
+        self.addresses = {"eth0": ["10.0.0.5"]}
+        self._add_interface("eth1", "up", "unknown")
+        self.assertEqual(provider.refresh(), {"eth0", "eth1"})
+        self.assertEqual(provider.get("eth0")[1], "10.0.0.5")
+        self.assertEqual(provider.get("eth1"), ("UP", "", "UNKNOWN"))
+
+    def test_unreadable_interface_is_unknown(self):
+        provider = InterfaceStateProvider(self.network)
+        os.makedirs(os.path.join(self.tmp_dir.name, "eth2"))
+        provider.refresh()
+        self.assertEqual(provider.get("eth2"), ("UNKNOWN", "", "UNKNOWN"))
+        self.assertEqual(provider.get("missing"), ("UNKNOWN", "", "UNKNOWN"))
+
+
+if __name__ == "__main__":
+    unittest.main()
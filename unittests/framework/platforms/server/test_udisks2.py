@@ -0,0 +1,133 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from framework.platforms.server import udisks2
+from framework.platforms.server.udisks2 import (
+    BLOCK_INTERFACE, DRIVE_INTERFACE, PARTITION_INTERFACE, UDisks2ObjectTree)
+
+DRIVES = "/org/freedesktop/UDisks2/drives/"
+BLOCKS = "/org/freedesktop/UDisks2/block_devices/"
+
+
+class Array(list):
+    """Stands for dbus.Array, which carries its element signature."""
+
+    def __init__(self, items, signature):
+        super().__init__(items)
+        self.signature = signature
+
+
+def ay(text):
+    return Array(text.encode() + b"\0", "y")
+
+
+def block(drive, device, symlinks, partition=False):
+    interfaces = {BLOCK_INTERFACE: {
+        "Drive": drive, "Device": ay(device),
+        "Symlinks": Array([ay(link) for link in symlinks], "ay")}}
+    if partition:
+        interfaces[PARTITION_INTERFACE] = {"Number": 1}
+    return interfaces
+
+
+class TestUDisks2ObjectTree(unittest.TestCase):
+    """Test indexing and signal updates of the UDisks2 object tree."""
+
+    def setUp(self):
+        patcher = patch.object(udisks2, "Array", Array)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch.object(udisks2.snapshot_cache, "get_version",
+                               return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.manager = MagicMock()
+        self.manager.GetManagedObjects.return_value = {
+            DRIVES + "d1": {DRIVE_INTERFACE: {"Id": "d1", "WWN": "0x5000"}},
+            BLOCKS + "sda": block(DRIVES + "d1", "/dev/sda", [
+                "/dev/disk/by-id/wwn-0x5000",
+                "/dev/disk/by-path/pci-0000-sas-phy0-lun-0"]),
+            BLOCKS + "sda1": block(DRIVES + "d1", "/dev/sda1", [
+                "/dev/disk/by-path/pci-0000-sas-phy0-lun-0-part1"],
+                partition=True),
+            BLOCKS + "dm-0": block("/", "/dev/dm-0", []),
+        }
+        self.bus = MagicMock()
+        self.tree = UDisks2ObjectTree()
+        self.tree.watch(self.bus, self.manager)
+        self.signals = {
+            call[0][0]: call[0][1]
+            for call in self.manager.connect_to_signal.call_args_list}
+
+    def test_load_indexes_whole_disk(self):
+        self.assertEqual(self.tree.get_drive_blocks(), {
+            DRIVES + "d1": ("/dev/sda", [
+                "/dev/disk/by-id/wwn-0x5000",
+                "/dev/disk/by-path/pci-0000-sas-phy0-lun-0"])})
+        self.assertEqual(self.tree.get_device(DRIVES + "d1"), "/dev/sda")
+        self.assertEqual(self.tree.find_drive(device="/dev/sda"),
+                         DRIVES + "d1")
+        self.assertEqual(self.tree.find_drive(
+            by_path="/dev/disk/by-path/pci-0000-sas-phy0-lun-0"),
+            DRIVES + "d1")
+        self.assertEqual(self.tree.find_drive(
+            by_path="pci-0000-sas-phy0-lun-0"), DRIVES + "d1")
+        self.assertEqual(list(self.tree.get_drives()), [DRIVES + "d1"])
+        self.bus.add_signal_receiver.assert_called_once()
+
+    def test_signals_update_tree_before_listeners(self):
+        seen = []
+        self.tree.add_listener(
+            lambda path, _: seen.append(self.tree.get_device(DRIVES + "d2")),
+            lambda path, _: seen.append(self.tree.get_device(DRIVES + "d2")))
+        self.signals["InterfacesAdded"](
+            BLOCKS + "sdb", block(DRIVES + "d2", "/dev/sdb", []))
+        self.signals["InterfacesAdded"](
+            DRIVES + "d2", {DRIVE_INTERFACE: {"Id": "d2", "WWN": "0x5001"}})
+        self.assertIn(DRIVES + "d2", self.tree.get_drives())
+        self.signals["InterfacesRemoved"](BLOCKS + "sdb", [BLOCK_INTERFACE])
+        self.assertEqual(seen, ["/dev/sdb", "/dev/sdb", None])
+        self.assertIsNone(self.tree.find_drive(device="/dev/sdb"))
+        self.assertNotIn(BLOCKS + "sdb", self.tree.get_objects())
+        self.manager.GetManagedObjects.assert_called_once()
+
+    def test_properties_changed(self):
+        self.tree._properties_changed(
+            BLOCK_INTERFACE, {"Device": ay("/dev/sdz")}, [],
+            path=BLOCKS + "sda")
+        self.assertEqual(self.tree.get_device(DRIVES + "d1"), "/dev/sdz")
+        self.assertIsNone(self.tree.find_drive(device="/dev/sda"))
+        self.tree._properties_changed(
+            DRIVE_INTERFACE, {"WWN": "0x6000"}, ["Id"], path=DRIVES + "d1")
+        self.assertEqual(self.tree.get_drives()[DRIVES + "d1"],
+                         {"WWN": "0x6000"})
+
+    def test_unwatched_tree_reloads_when_stale(self):
+        tree = UDisks2ObjectTree()
+        tree._manager = self.manager
+        tree.get_drives()
+        tree.get_drives()
+        self.assertEqual(self.manager.GetManagedObjects.call_count, 2)
+        udisks2.snapshot_cache.get_version.return_value = (1, 1)
+        tree.get_drives()
+        self.assertEqual(self.manager.GetManagedObjects.call_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import threading
+import unittest
+
+from framework.utils.alert_coalescer import AlertCoalescer
+
+
+def alert(alert_type, resource_id="psu_0", description="PSU"):
+    return {"message": {"sensor_response_type": {
+        "alert_type": alert_type, "severity": "critical",
+        "info": {"resource_type": "enclosure:hw:psu",
+                 "resource_id": resource_id,
+                 "description": description}}}}
+
+
+class TestAlertCoalescer(unittest.TestCase):
+    """Test windows, superseded alerts and rate limits of AlertCoalescer."""
+
+    def setUp(self):
+        self.now = 0
+        self.coalescer = AlertCoalescer(2, 3, 60, clock=lambda: self.now)
+
+    def alert_types(self, ready):
+        return [msg["message"]["sensor_response_type"]["alert_type"]
+                for msg, _ in ready]
+
+    def test_other_messages_pass_through(self):
+        msg = {"message": {"actuator_response_type": {"ack": {}}}}
+        self.assertEqual(self.coalescer.add(msg, None), [(msg, None)])
+        msg = alert("get")
+        self.assertEqual(self.coalescer.add(msg, None), [(msg, None)])
+        self.assertEqual(self.coalescer.get_counters()["received"], 0)
+
+    def test_window_publishes_last_state(self):
+        events = [threading.Event() for _ in range(3)]
+        ready = self.coalescer.add(alert("fault"), events[0])
+        self.assertEqual(self.alert_types(ready), ["fault"])
+        self.assertEqual(self.coalescer.add(alert("fault_resolved"),
+                                            events[1]), [])
+        self.assertEqual(self.coalescer.add(alert("fault", "psu_1"),
+                                            None)[0][1], None)
+        self.assertEqual(self.coalescer.add(alert("fault_resolved"),
+                                            events[2]), [])
+        self.assertEqual(self.coalescer.get_next_deadline(), 2)
+        self.assertEqual(self.coalescer.flush(), [])
+
+        self.now = 2
+        ready = self.coalescer.flush()
+        self.assertEqual(self.alert_types(ready), ["fault_resolved"])
+        self.assertFalse(events[1].is_set())
+        ready[0][1].set()
+        self.assertTrue(events[1].is_set() and events[2].is_set())
+        counters = self.coalescer.get_counters()
+        self.assertEqual(counters["superseded"], 1)
+        self.assertEqual(counters["published"], 3)
+
+    def test_unchanged_state_is_dropped(self):
+        event = threading.Event()
+        self.coalescer.add(alert("fault"), None)
+        self.coalescer.add(alert("fault_resolved"), None)
+        self.coalescer.add(alert("fault"), event)
+        self.now = 2
+        self.assertEqual(self.coalescer.flush(), [])
+        self.assertTrue(event.is_set())
+        self.assertEqual(self.coalescer.get_counters()["unchanged"], 1)
+        self.now = 4
+        self.coalescer.flush()
+        self.assertEqual(self.coalescer.get_counters()["resources"], 1)
+
+    def test_rate_limit_publishes_summary(self):
+        published = []
+        event = threading.Event()
+        for second in range(10):
+            self.now = second * 2
+            alert_type = "fault" if second % 2 else "fault_resolved"
+            published += self.coalescer.flush()
+            published += self.coalescer.add(alert(alert_type), event)
+        self.assertEqual(len(published), 3)
+        self.assertTrue(event.is_set())
+        self.assertEqual(self.coalescer.get_counters()["muted"], 7)
+
+        self.now = 60
+        ready = self.coalescer.flush()
+        self.assertEqual(self.alert_types(ready), ["fault"])
+        self.assertEqual(
+            ready[0][0]["message"]["sensor_response_type"]["info"]
+            ["description"], "PSU (7 alerts muted within 60 seconds)")
+        counters = self.coalescer.get_counters()
+        self.assertEqual(counters["summaries"], 1)
+        self.assertEqual(counters["muted"], 6)
+
+    def test_force_flush(self):
+        self.coalescer.add(alert("fault"), None)
+        self.coalescer.add(alert("fault_resolved"), None)
+        self.assertEqual(self.alert_types(self.coalescer.flush(force=True)),
+                         ["fault_resolved"])
+
+    def test_disabled(self):
+        coalescer = AlertCoalescer(0, 0, 60)
+        for alert_type in ("fault", "fault_resolved", "fault"):
+            self.assertEqual(len(coalescer.add(alert(alert_type), None)), 1)
+        self.assertEqual(coalescer.get_counters()["received"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import unittest
+from unittest.mock import Mock, patch
+
+from framework.utils.cpu_load_sampler import CPULoadSampler
+
+
+class TestCPULoadSampler(unittest.TestCase):
+    """Test windowed per core averages of CPULoadSampler."""
+
+    def setUp(self):
+        # 60s interval: windows of 1, 5 and 15 ticks
+        self.sampler = CPULoadSampler(cpus=2, interval=60)
+        self.busy = [0, 0]
+        self.total = [0, 0]
+
+    def _tick(self, *loads):
+        """Advance each core by 100 jiffies, loads[core] of them busy."""
+        for core, load in enumerate(loads):
+            self.busy[core] += load
+            self.total[core] += 100
+        overall = (sum(self.busy), sum(self.total))
+        cores = {core: (self.busy[core], self.total[core])
+                 for core in range(len(loads))}
+        self.sampler.sample((overall, cores))
+
+    def test_not_sampled(self):
+        self.assertEqual(self.sampler.load_averages(),
+                         [[CPULoadSampler.NOT_SAMPLED] * 2] * 3)
+        self._tick(0, 0)
+        self.assertEqual(self.sampler.load_averages(),
+                         [[CPULoadSampler.NOT_SAMPLED] * 2] * 3)
+
+    def test_cpu_usage_of_last_tick(self):
+        self._tick(0, 0)
+        self._tick(50, 100)
+        self.assertAlmostEqual(self.sampler.cpu_usage, 75.0)
+
+    def test_windows_drop_old_ticks(self):
+        self._tick(0, 0)
+        for _ in range(15):
+            self._tick(100, 20)
+        for _ in range(5):
+            self._tick(0, 20)
+        load_1min, load_5min, load_15min = self.sampler.load_averages()
+        self.assertEqual(load_1min, [0.0, 20.0])
+        self.assertEqual(load_5min, [0.0, 20.0])
+        self.assertAlmostEqual(load_15min[0], 100.0 * 10 / 15)
+        self.assertAlmostEqual(load_15min[1], 20.0)
+
+    def test_partial_window_averages_sampled_ticks(self):
+        self._tick(0, 0)
+        self._tick(40, 0)
+        self._tick(80, 0)
+        load_1min, load_5min, load_15min = self.sampler.load_averages()
+        self.assertEqual(load_1min, [80.0, 0.0])
+        self.assertEqual(load_5min, [60.0, 0.0])
+        self.assertEqual(load_15min, [60.0, 0.0])
+
+    def test_missing_core_counts_as_idle_time(self):
+        self._tick(0, 0)
+        self.sampler.sample(((50, 200), {0: (50, 200)}))
+        self.assertEqual(self.sampler.load_averages()[0], [50.0, 0.0])
+
+
+    @patch("framework.base.shared_scheduler.get_shared_scheduler")
+    @patch("framework.base.shared_scheduler.shared_scheduler_enabled",
+           return_value=False)
+    @patch("threading.Thread")
+    def test_own_thread_when_shared_scheduler_disabled(
+            self, thread, enabled, get_shared_scheduler):
+        self.sampler.sample = Mock()
+        self.sampler.start()
+        get_shared_scheduler.assert_not_called()
+        self.assertTrue(thread.call_args[1]["daemon"])
+        thread.return_value.start.assert_called_once_with()
+
+    @patch("framework.base.shared_scheduler.get_shared_scheduler")
+    @patch("framework.base.shared_scheduler.shared_scheduler_enabled",
+           return_value=True)
+    def test_shared_scheduler(self, enabled, get_shared_scheduler):
+        self.sampler.sample = Mock()
+        self.sampler.start()
+        get_shared_scheduler.return_value.call_later.assert_called_once_with(
+            60, self.sampler._tick)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import json
+import os
+import subprocess
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+from framework.utils.drive_utils import DriveUtils
+
+
+class TestDriveUtils(unittest.TestCase):
+    """Test sysfs drive discovery and parallel SMART data collection."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        patcher = patch.object(DriveUtils, "SYSFS_BLOCK", self.tmp_dir.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch.object(DriveUtils, "_smart_cache", {})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self._add_block("sda", "0", b"\0\x80\0\x08ZC18AD01")
+        self._add_block("sdb", "0", b"\0\x80\0\x08ZC18AD02")
+        # CD-ROM, not a disk
+        self._add_block("sr0", "5", b"")
+        os.makedirs(os.path.join(self.tmp_dir.name, "loop0"))
+        self.runs = []
+
+    def _add_block(self, name, scsi_type, vpd_pg80):
+        device_dir = os.path.join(self.tmp_dir.name, name, "device")
+        os.makedirs(device_dir)
+        with open(os.path.join(device_dir, "type"), "w") as f:
+            f.write(scsi_type + "\n")
+        with open(os.path.join(device_dir, "vpd_pg80"), "wb") as f:
+            f.write(vpd_pg80)
+
+    def _smartctl(self, cmd, **kwargs):
+        drive_path = cmd[cmd.index("-a") + 1]
+        self.runs.append(drive_path)
+        if drive_path == "/dev/sdb" and kwargs.get("timeout") == 0.1:
+            raise subprocess.TimeoutExpired(cmd, kwargs["timeout"])
+        serial = {"/dev/sda": "ZC18AD01", "/dev/sdb": "ZC18AD02"}[drive_path]
+        return Mock(stdout=json.dumps({"serial_number": serial,
+                                       "device": {"protocol": "ATA"}}))
+
+    def test_drives_from_sysfs(self):
+        self.assertEqual(DriveUtils.get_drives(),
+                         {"/dev/sda": "ZC18AD01", "/dev/sdb": "ZC18AD02"})
+
+    def test_smart_data_reused_by_serial(self):
+        with patch("subprocess.run", side_effect=self._smartctl):
+            response = DriveUtils.get_smart_data()
+            self.assertEqual([res["drive_path"] for res in response],
+                             ["/dev/sda", "/dev/sdb"])
+            self.assertEqual(sorted(self.runs), ["/dev/sda", "/dev/sdb"])
+            self.assertEqual(DriveUtils.get_smart_data(), response)
+            self.assertEqual(len(self.runs), 2)
+            list(DriveUtils.iter_smart_data(max_age=-1))
+            self.assertEqual(len(self.runs), 4)
+
+    def test_timed_out_drive_skipped(self):
+        with patch("subprocess.run", side_effect=self._smartctl):
+            response = list(DriveUtils.iter_smart_data(timeout=0.1))
+        self.assertEqual([res["drive_path"] for res in response],
+                         ["/dev/sda"])
+
+
+if __name__ == "__main__":
+    unittest.main()
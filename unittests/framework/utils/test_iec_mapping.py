@@ -0,0 +1,77 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from framework.utils.iec_mapping import IECMapping
+
+
+class TestIECMapping(unittest.TestCase):
+    """Test the indexed IEC mapping and its reload on change."""
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.mapping_dir = os.path.join(tmp_dir.name, "iec_mapping")
+        os.makedirs(self.mapping_dir)
+        self.cache_path = os.path.join(tmp_dir.name, "iec_mapping.pickle")
+        self._write("components", "001,motr\n005,sspl\n")
+        self._write("motr", "001002003,io,write failed\n")
+
+    def _write(self, name, data, mtime=None):
+        path = os.path.join(self.mapping_dir, name)
+        with open(path, "w") as f:
+            f.write(data)
+        if mtime:
+            os.utime(path, (mtime, mtime))
+
+    def test_decode(self):
+        mapping = IECMapping(self.mapping_dir, self.cache_path)
+        self.assertEqual(mapping.get_component("001"), "motr")
+        self.assertIsNone(mapping.get_component("002"))
+        self.assertEqual(mapping.decode("001002003"),
+                         ("motr", "io", "write failed"))
+        self.assertEqual(mapping.decode("001002004"), ("motr", "002", "004"))
+        # No mapping file for sspl
+        self.assertEqual(mapping.decode("005002003"), ("sspl", "002", "003"))
+        self.assertEqual(mapping.decode("009002003"), ("009", "002", "003"))
+
+    def test_reload_on_change(self):
+        mapping = IECMapping(self.mapping_dir, self.cache_path)
+        self.assertEqual(mapping.decode("005002003"), ("sspl", "002", "003"))
+        self._write("sspl", "005002003,raid,degraded\n", mtime=1)
+        mapping._next_check = 0
+        self.assertEqual(mapping.decode("005002003"),
+                         ("sspl", "raid", "degraded"))
+
+    def test_pickled_index_reused(self):
+        IECMapping(self.mapping_dir, self.cache_path).get_component("001")
+        self.assertTrue(os.path.exists(self.cache_path))
+        with patch.object(IECMapping, "_load",
+                          side_effect=AssertionError("CSV parsed")):
+            mapping = IECMapping(self.mapping_dir, self.cache_path)
+            self.assertEqual(mapping.decode("001002003"),
+                             ("motr", "io", "write failed"))
+        self._write("motr", "001002003,io,read failed\n", mtime=1)
+        mapping = IECMapping(self.mapping_dir, self.cache_path)
+        self.assertEqual(mapping.decode("001002003"),
+                         ("motr", "io", "read failed"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -18,7 +18,7 @@
 import os
 import unittest
 import shutil
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from framework.utils.ipmi_client import IpmiFactory, Conf, store
 from framework.base.sspl_constants import DATA_PATH
@@ -84,5 +84,69 @@ class TestIpmiTool(unittest.TestCase):
         os.remove('/usr/bin/ipmisimtool')
         os.remove(f"{DATA_PATH}/server/activate_ipmisimtool")
 
+    def test_parse_sensor_records(self):
+        output = (
+            "Locating sensor record...\n"
+            "Sensor ID              : PS1 Status (0xc8)\n"
+            " Entity ID             : 10.1 (Power Supply)\n"
+            " States Asserted       : Power Supply\n"
+            "                         [Presence detected]\n"
+            "\n"
+            "Sensor ID              : FAN1 (0x41)\n"
+            " Sensor Reading        : 5800 (+/- 0) RPM\n"
+            " Lower Critical        : 300.000\n")
+        records = self.tool.parse_sensor_records(output, ["FAN1", "PS1 Status"])
+        self.assertEqual(records["PS1 Status"]["States Asserted"],
+                         "Power Supply\n                         [Presence detected]")
+        self.assertEqual(records["FAN1"]["Lower Critical"], "300.000")
+
+    def test_static_props_are_cached(self):
+        record = ("Sensor ID              : {} (0x41)\n"
+                  " Sensor Reading        : 5800 (+/- 0) RPM\n"
+                  " Lower Critical        : 300.000\n")
+        def run(cmd, grep_args=None, keep_output=False):
+            if cmd.startswith("sensor get"):
+                return "".join(record.format(sensor_id) for sensor_id in
+                               ("FAN1", "FAN2") if sensor_id in cmd), "", 0
+            return "Most recent Addition : 04/16/2019 05:29:09", "", 0
+        self.tool._run_ipmitool_subcommand = Mock(side_effect=run)
+        self.tool._is_simulator_active = Mock(return_value=False)
+        self.tool._sdr_cache.clear()
+        props = self.tool.get_sensor_static_props_many(["FAN1", "FAN2"])
+        props = self.tool.get_sensor_static_props_many(["FAN1", "FAN2"])
+        self.assertEqual(props["FAN2"][1], {"Lower Critical": "300.000"})
+        sensor_gets = [call for call in
+                       self.tool._run_ipmitool_subcommand.call_args_list
+                       if call[0][0].startswith("sensor get")]
+        self.assertEqual(len(sensor_gets), 1)
+        del self.tool._run_ipmitool_subcommand
+        del self.tool._is_simulator_active
+
+    @patch("framework.utils.ipmi_client.SimpleProcess")
+    def test_sensor_props_many_with_unknown_sensor(self, process):
+        record = ("Locating sensor record...\n"
+                  "Sensor ID              : {} (0x41)\n"
+                  " Sensor Reading        : 5800 (+/- 0) RPM\n")
+        def run(command):
+            # ipmitool fails without stderr if any sensor is not found
+            sensor_ids = command[command.index("get") + 1:]
+            found = [sensor_id for sensor_id in sensor_ids
+                     if sensor_id != "FAN3"]
+            out = "".join(record.format(sensor_id) for sensor_id in found)
+            return Mock(run=Mock(return_value=(
+                out.encode(), b"", 0 if found == sensor_ids else 1)))
+        process.side_effect = run
+        self.tool._is_simulator_active = Mock(return_value=False)
+        props = self.tool.get_sensor_props_many(["FAN1", "FAN2", "FAN3"])
+        self.assertEqual(list(props), ["FAN1", "FAN2"])
+        self.assertEqual(props["FAN2"][1],
+                         {"Sensor Reading": "5800 (+/- 0) RPM"})
+        # Only the sensor left out is read again
+        commands = [call.args[0][call.args[0].index("sensor"):]
+                    for call in process.call_args_list]
+        self.assertEqual(commands, [["sensor", "get", "FAN1", "FAN2", "FAN3"],
+                                    ["sensor", "get", "FAN3"]])
+        del self.tool._is_simulator_active
+
     def tearDown(self):
         pass
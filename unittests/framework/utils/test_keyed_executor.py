@@ -0,0 +1,82 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import threading
+import time
+import unittest
+
+from framework.utils.keyed_executor import KeyedExecutor
+
+
+class TestKeyedExecutor(unittest.TestCase):
+    """Test ordering, parallelism and bounds of KeyedExecutor."""
+
+    def setUp(self):
+        self.executor = KeyedExecutor(4, 8, name="test_keyed")
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def test_order_kept_per_key(self):
+        done = {"a": [], "b": []}
+
+        def task(key, index):
+            time.sleep(0.001 * (index % 3))
+            done[key].append(index)
+
+        for index in range(20):
+            for key in done:
+                self.executor.submit(key, task, key, index)
+        self.assertTrue(self.executor.wait_idle(5))
+        self.assertEqual(done, {"a": list(range(20)), "b": list(range(20))})
+        self.assertEqual(self.executor.pending, 0)
+
+    def test_slow_key_does_not_stall_others(self):
+        release = threading.Event()
+        fast = threading.Event()
+        self.executor.submit("slow", release.wait, 5)
+        self.executor.submit("fast", fast.set)
+        self.assertTrue(fast.wait(5))
+        self.assertFalse(self.executor.wait_idle(0.01))
+        release.set()
+        self.assertTrue(self.executor.wait_idle(5))
+
+    def test_submit_blocks_when_full(self):
+        release = threading.Event()
+        for index in range(8):
+            self.executor.submit(index % 2, release.wait, 5)
+        submitted = threading.Event()
+
+        def submit():
+            self.executor.submit("last", submitted.set)
+
+        thread = threading.Thread(target=submit)
+        thread.start()
+        self.assertFalse(submitted.wait(0.1))
+        self.assertEqual(self.executor.pending, 8)
+        release.set()
+        thread.join(5)
+        self.assertTrue(submitted.wait(5))
+
+    def test_failing_task_does_not_stop_lane(self):
+        done = []
+        self.executor.submit("a", lambda: 1 / 0)
+        self.executor.submit("a", done.append, 1)
+        self.assertTrue(self.executor.wait_idle(5))
+        self.assertEqual(done, [1])
+
+
+if __name__ == "__main__":
+    unittest.main()
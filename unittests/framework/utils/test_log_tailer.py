@@ -0,0 +1,89 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import os
+import tempfile
+import unittest
+
+from framework.utils.log_tailer import LogTailer
+
+
+class TestLogTailer(unittest.TestCase):
+    """Test offset based log reading with inode checkpoints."""
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.log_path = os.path.join(tmp_dir.name, "iem_messages")
+        self.checkpoint_path = os.path.join(tmp_dir.name, "checkpoint")
+        self._append("t1 first\nt2 second\n")
+
+    def _append(self, data, path=None):
+        with open(path or self.log_path, "a") as log_file:
+            log_file.write(data)
+
+    def _tailer(self, **kwargs):
+        tailer = LogTailer(self.log_path, self.checkpoint_path)
+        tailer.open(**kwargs)
+        self.addCleanup(tailer.close)
+        return tailer
+
+    def test_resume_from_checkpoint(self):
+        tailer = self._tailer()
+        self.assertEqual(tailer.read_lines(), ["t1 first", "t2 second"])
+        tailer.save_checkpoint()
+        self._append("t3 third\n")
+        tailer.close()
+        self.assertEqual(self._tailer().read_lines(), ["t3 third"])
+
+    def test_partial_line_held_back(self):
+        tailer = self._tailer()
+        self._append("t3 thi")
+        self.assertEqual(tailer.read_lines(max_lines=1), ["t1 first"])
+        self.assertEqual(tailer.read_lines(), ["t2 second"])
+        self._append("rd\n")
+        self.assertEqual(tailer.read_lines(), ["t3 third"])
+
+    def test_rotation_drains_old_file_first(self):
+        tailer = self._tailer()
+        tailer.read_lines()
+        self._append("t3 third\n")
+        os.rename(self.log_path, self.log_path + ".1")
+        self.assertEqual(tailer.read_lines(), ["t3 third"])
+        self._append("t4 fourth\n")
+        self.assertEqual(tailer.read_lines(), ["t4 fourth"])
+        tailer.save_checkpoint()
+        self.assertEqual(tailer.position,
+                         (os.stat(self.log_path).st_ino, len("t4 fourth\n")))
+
+    def test_truncated_log_read_from_start(self):
+        tailer = self._tailer()
+        tailer.read_lines()
+        open(self.log_path, "w").close()
+        self._append("t3 third\n")
+        self.assertEqual(tailer.read_lines(), ["t3 third"])
+
+    def test_legacy_checkpoint(self):
+        with open(self.checkpoint_path, "w") as checkpoint_file:
+            checkpoint_file.write("t1")
+        tailer = LogTailer(self.log_path, self.checkpoint_path)
+        tailer.open(start_after=lambda last: tailer.scan_offset(
+            lambda line: line.split()[0] > last))
+        self.addCleanup(tailer.close)
+        self.assertEqual(tailer.read_lines(), ["t2 second"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import os
+import select
+import tempfile
+import threading
+import unittest
+from unittest.mock import Mock, patch
+
+from framework.utils.mdstat_watcher import MdstatWatcher
+
+
+class TestMdstatWatcher(unittest.TestCase):
+    """Test md event wakeups of the mdstat watcher."""
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.path = os.path.join(tmp_dir.name, "mdstat")
+        with open(self.path, "w") as f:
+            f.write("Personalities : [raid1]\nunused devices: <none>\n")
+
+    def test_missing_file(self):
+        watcher = MdstatWatcher(self.path + ".missing", Mock())
+        self.assertFalse(watcher.start())
+
+    def test_change_callback(self):
+        changed = threading.Event()
+        poller = Mock()
+        # An md event, then nothing until stopped
+        poller.poll.side_effect = lambda timeout: \
+            [] if changed.is_set() else [(3, select.POLLPRI)]
+        watcher = MdstatWatcher(self.path, changed.set)
+        with patch("select.poll", Mock(return_value=poller)):
+            self.assertTrue(watcher.start())
+        self.assertTrue(changed.wait(5))
+        watcher.stop()
+        watcher._thread.join(5)
+        self.assertFalse(watcher._thread.is_alive())
+        poller.register.assert_called_once()
+
+    def test_regular_file_idles(self):
+        on_change = Mock()
+        watcher = MdstatWatcher(self.path, on_change)
+        watcher.POLL_TIMEOUT = 10
+        self.assertTrue(watcher.start())
+        watcher.stop()
+        watcher._thread.join(5)
+        on_change.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
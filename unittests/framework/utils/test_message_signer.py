@@ -0,0 +1,88 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import ctypes
+import json
+import unittest
+
+from framework.utils.message_signer import MessageSigner, render_message
+
+
+class FakeSecLib(object):
+    """Signs with the length and start of the message, like libsspl_sec."""
+
+    def __init__(self):
+        self.tokens = 0
+        self.signed = []
+
+    def sspl_get_token_length(self):
+        return 5
+
+    def sspl_get_sig_length(self):
+        return 8
+
+    def sspl_generate_session_token(self, username, authn_token_len,
+                                    authn_token, session_length, out_token):
+        self.tokens += 1
+        ctypes.memmove(out_token, b"tok%02d" % self.tokens, 5)
+
+    def sspl_sign_message(self, msg_len, msg, username, token, out_sig):
+        self.signed.append((msg_len, msg, username, token.raw))
+        ctypes.memmove(out_sig, b"%03d%s" % (msg_len, msg[:5]), 8)
+        return 1
+
+
+class TestMessageSigner(unittest.TestCase):
+    """Test session token reuse and signing of MessageSigner."""
+
+    def setUp(self):
+        self.now = 0
+        self.lib = FakeSecLib()
+        self.signer = MessageSigner(self.lib, "sspl-ll", "secret", 3600,
+                                    clock=lambda: self.now)
+
+    def test_sign_serialized_payload(self):
+        self.assertEqual(self.signer.sign(b'{"a": 1}'), '008{"a":')
+        self.assertEqual(self.lib.signed,
+                         [(8, b'{"a": 1}', b"sspl-ll", b"tok01")])
+
+    def test_token_reused_until_shortly_before_expiry(self):
+        for self.now in (0, 1000, 3539):
+            self.signer.sign(b"{}")
+        self.assertEqual(self.lib.tokens, 1)
+        self.now = 3540
+        self.signer.sign(b"{}")
+        self.assertEqual(self.lib.tokens, 2)
+        self.assertEqual(self.lib.signed[-1][3], b"tok02")
+
+    def test_short_sessions_renew_earlier(self):
+        signer = MessageSigner(self.lib, "sspl-ll", "secret", 100,
+                               clock=lambda: self.now)
+        signer.sign(b"{}")
+        self.now = 90
+        signer.sign(b"{}")
+        self.assertEqual(self.lib.tokens, 2)
+
+    def test_render_message(self):
+        json_msg = {"username": "sspl-ll", "message": {"b": [1, "x"]},
+                    "signature": "None"}
+        body = json.dumps(json_msg["message"])
+        self.assertEqual(json.loads(render_message(json_msg, body)), json_msg)
+        self.assertEqual(render_message({"message": {}}, "{}"),
+                         '{"message": {}}')
+
+
+if __name__ == "__main__":
+    unittest.main()
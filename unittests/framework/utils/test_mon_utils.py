@@ -0,0 +1,135 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import threading
+import time
+import unittest
+from unittest.mock import Mock
+
+from framework.utils.mon_utils import MonUtils
+
+
+class TestCollectConcurrently(unittest.TestCase):
+    """Test concurrent collection with timeouts and partial results."""
+
+    def setUp(self):
+        self.log = Mock()
+        self.release = threading.Event()
+        self.addCleanup(self.release.set)
+
+    def _raise(self):
+        raise ValueError("no data")
+
+    def test_partial_results(self):
+        collectors = {
+            "hw>cpu": lambda: ["CPU-0"],
+            "hw>fan": self._raise,
+            "hw>psu": lambda: self.release.wait(10),
+        }
+        results, metadata = MonUtils.collect_concurrently(
+            collectors, 0.2, self.log)
+        self.assertEqual(list(results), list(collectors))
+        self.assertEqual(results, {"hw>cpu": ["CPU-0"], "hw>fan": None,
+                                   "hw>psu": None})
+        self.assertEqual(metadata["hw>cpu"]["status"], "OK")
+        self.assertEqual(metadata["hw>fan"]["status"], "Error")
+        self.assertEqual(metadata["hw>psu"]["status"], "Timeout")
+        self.assertGreaterEqual(metadata["hw>psu"]["latency"], 0.2)
+
+    def test_concurrent_with_timeouts(self):
+        def slow():
+            time.sleep(0.3)
+            return "done"
+        collectors = {"sw>raid": slow, "hw>disk": slow, "hw>nw_port": slow}
+        start = time.monotonic()
+        results, metadata = MonUtils.collect_concurrently(
+            collectors, 0.1, self.log, {"hw>disk": 5, "sw>raid": 5})
+        self.assertLess(time.monotonic() - start, 0.9)
+        self.assertEqual(results, {"sw>raid": "done", "hw>disk": "done",
+                                   "hw>nw_port": None})
+        self.assertEqual(metadata["hw>nw_port"]["status"], "Timeout")
+        self.assertGreaterEqual(metadata["hw>disk"]["latency"], 0.3)
+
+    def test_hung_collector_not_started_again(self):
+        started = []
+
+        def hung():
+            started.append(threading.current_thread())
+            self.release.wait(10)
+        collectors = {"hw>fan": hung}
+        MonUtils.collect_concurrently(collectors, 0.05, self.log)
+        results, metadata = MonUtils.collect_concurrently(
+            collectors, 0.05, self.log)
+        self.assertEqual(results, {"hw>fan": None})
+        self.assertEqual(metadata["hw>fan"]["status"], "Busy")
+        self.assertEqual(len(started), 1)
+        self.assertTrue(started[0].daemon)
+
+        self.release.set()
+        started[0].join(5)
+        results, metadata = MonUtils.collect_concurrently(
+            {"hw>fan": lambda: "fan"}, 1, self.log)
+        self.assertEqual(metadata["hw>fan"]["status"], "OK")
+
+
+
+class TestKeyPaths(unittest.TestCase):
+    """Test sorting by compiled key paths and normalizing values."""
+
+    def setUp(self):
+        self.log = Mock()
+        self.data = [
+            {"uid": "disk_00.1", "health": {"specifics": [{"serial-number": "B"}]}},
+            {"uid": "disk_00.0", "health": {"specifics": [{"serial-number": "C"}]}},
+            {"uid": "disk_00.2", "health": {"specifics": [{"serial-number": "A"}]}},
+        ]
+
+    def test_compile_key_path(self):
+        getter = MonUtils.compile_key_path(
+            """['health'] ["specifics"][0]['serial-number']""")
+        self.assertEqual(getter(self.data[0]), "B")
+        self.assertIs(MonUtils.compile_key_path("['uid']"),
+                      MonUtils.compile_key_path("['uid']"))
+        for key_path in ["", "['uid'].keys()", "[uid]", "['uid']x"]:
+            with self.assertRaises(ValueError):
+                MonUtils.compile_key_path(key_path)
+
+    def test_sort_by_specific_kv(self):
+        uids = [item["uid"] for item in MonUtils.sort_by_specific_kv(
+            self.data, "['health']['specifics'][0]['serial-number']",
+            self.log)]
+        self.assertEqual(uids, ["disk_00.2", "disk_00.1", "disk_00.0"])
+        uids = [item["uid"] for item in MonUtils.sort_by_specific_kv(
+            self.data, "['uid']", self.log)]
+        self.assertEqual(uids, ["disk_00.0", "disk_00.1", "disk_00.2"])
+
+    def test_sort_by_missing_key(self):
+        self.assertEqual(MonUtils.sort_by_specific_kv(
+            self.data, "['serial_number']", self.log), self.data)
+        self.log.svc_log.assert_called_once()
+
+    def test_normalize_kv(self):
+        item = {"a": ["NA", "", {"b": "N/A", "c": 0}], "d": ("NA",),
+                "e": None}
+        self.assertEqual(
+            MonUtils.normalize_kv(item, ["NA", "N/A", ""], "Not Available"),
+            {"a": ["Not Available", "Not Available",
+                   {"b": "Not Available", "c": 0}],
+             "d": ("NA",), "e": None})
+        self.assertEqual(MonUtils.normalize_kv([None, 1], None, "-"), ["-", 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from framework.utils.segment_log import SegmentLog
+
+
+class TestSegmentLog(unittest.TestCase):
+    """Test append, replay and crash recovery of SegmentLog."""
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def _segments(self):
+        return sorted(name for name in os.listdir(self.path)
+                      if name.endswith(SegmentLog.SEGMENT_SUFFIX))
+
+    def test_fifo_across_segments(self):
+        log = SegmentLog(self.path, segment_size=128)
+        log.append([f"msg{i}" for i in range(40)])
+        self.assertEqual(log.count, 40)
+        self.assertGreater(len(self._segments()), 1)
+        self.assertListEqual(log.peek(3), ["msg0", "msg1", "msg2"])
+        self.assertEqual(log.consume(35), 35)
+        self.assertListEqual(log.peek(10), [f"msg{i}" for i in range(35, 40)])
+        # Fully consumed segments are removed
+        self.assertLessEqual(int(self._segments()[0][:-4]), log.head)
+        self.assertNotIn("%020d.seg" % 0, self._segments())
+
+    def test_reset_when_drained(self):
+        log = SegmentLog(self.path)
+        log.append(["a", b"b"])
+        self.assertListEqual(log.peek(2), ["a", b"b"])
+        log.consume(2)
+        self.assertTrue(log.is_empty())
+        self.assertEqual(log.size, 0)
+        self.assertListEqual(self._segments(), [])
+
+    def test_recovery_without_close(self):
+        log = SegmentLog(self.path, segment_size=128)
+        log.append([f"msg{i}" for i in range(40)])
+        log.consume(5)
+        log.flush()
+        recovered = SegmentLog(self.path, segment_size=128)
+        self.assertEqual(recovered.count, 35)
+        self.assertListEqual(recovered.peek(1), ["msg5"])
+
+    def test_torn_record_is_truncated(self):
+        log = SegmentLog(self.path)
+        log.append(["first", "second"])
+        with open(os.path.join(self.path, self._segments()[-1]), "ab") as fh:
+            fh.write(b"\x00\x00\x00\x10torn")
+        recovered = SegmentLog(self.path)
+        self.assertEqual(recovered.count, 2)
+        recovered.append(["third"])
+        self.assertListEqual(recovered.peek(5), ["first", "second", "third"])
+
+
+if __name__ == "__main__":
+    unittest.main()
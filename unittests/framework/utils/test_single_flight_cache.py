@@ -0,0 +1,72 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import threading
+import time
+import unittest
+from unittest.mock import Mock
+
+from framework.utils.single_flight_cache import SingleFlightCache
+
+
+class TestSingleFlightCache(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 100.0
+        self.cache = SingleFlightCache(10, clock=lambda: self.now)
+
+    def test_ttl_expiry(self):
+        loader = Mock(side_effect=["first", "second"])
+        self.assertEqual(self.cache.get("/show/disks", loader), "first")
+        self.assertEqual(self.cache.get("/show/disks", loader), "first")
+        self.now += 11
+        self.assertEqual(self.cache.get("/show/disks", loader), "second")
+        self.assertEqual(loader.call_count, 2)
+
+    def test_uncacheable_result_is_reloaded(self):
+        loader = Mock(side_effect=[None, "ok"])
+        cacheable = lambda value: value is not None
+        self.assertIsNone(self.cache.get("k", loader, cacheable=cacheable))
+        self.assertEqual(self.cache.get("k", loader, cacheable=cacheable), "ok")
+
+    def test_invalidate(self):
+        loader = Mock(side_effect=["first", "second"])
+        self.cache.get("k", loader)
+        self.cache.invalidate()
+        self.assertEqual(self.cache.get("k", loader), "second")
+
+    def test_concurrent_callers_share_one_load(self):
+        cache = SingleFlightCache(10)
+        calls = []
+
+        def loader():
+            calls.append(1)
+            time.sleep(0.2)
+            return "value"
+
+        results = []
+        threads = [threading.Thread(
+            target=lambda: results.append(cache.get("k", loader)))
+            for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(calls), 1)
+        self.assertListEqual(results, ["value"] * 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
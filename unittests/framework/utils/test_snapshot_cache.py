@@ -0,0 +1,72 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+from framework.utils import snapshot_cache
+from framework.utils.snapshot_cache import SnapshotCache
+
+
+class TestSnapshotCache(unittest.TestCase):
+    """Test TTL and invalidation of resource snapshots."""
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        patcher = patch.object(snapshot_cache, "VERSION_DIR",
+                               os.path.join(tmp_dir.name, "resource_map"))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.loader = Mock(side_effect=lambda: [{"uid": "sda"}])
+
+    def test_served_from_memory(self):
+        cache = SnapshotCache(60)
+        data = cache.get("disk", self.loader)
+        data[0]["uid"] = "changed by caller"
+        self.assertEqual(cache.get("disk", self.loader), [{"uid": "sda"}])
+        self.assertEqual(self.loader.call_count, 1)
+
+    @patch("framework.utils.snapshot_cache.time.monotonic")
+    def test_ttl(self, monotonic):
+        cache = SnapshotCache(60, {"cpu": 5, "psu": 0})
+        monotonic.return_value = 100
+        cache.get("disk", self.loader)
+        cache.get("cpu", self.loader)
+        monotonic.return_value = 110
+        cache.get("disk", self.loader)
+        cache.get("cpu", self.loader)
+        self.assertEqual(self.loader.call_count, 3)
+        cache.get("psu", self.loader)
+        cache.get("psu", self.loader)
+        self.assertEqual(self.loader.call_count, 5)
+
+    def test_invalidate(self):
+        cache = SnapshotCache(60)
+        cache.get("disk", self.loader)
+        cache.get("raid", self.loader)
+        # As done by sensors in another process
+        snapshot_cache.invalidate("disk")
+        cache.get("disk", self.loader)
+        cache.get("raid", self.loader)
+        self.assertEqual(self.loader.call_count, 3)
+        cache.get("disk", self.loader)
+        self.assertEqual(self.loader.call_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
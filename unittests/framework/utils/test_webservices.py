@@ -0,0 +1,97 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+
+import threading
+import time
+import unittest
+from unittest.mock import Mock
+
+import requests
+from requests.exceptions import ConnectionError
+
+from framework.utils.webservices import WebServices
+
+
+def ok_response():
+    response = requests.Response()
+    response.status_code = WebServices.HTTP_OK
+    return response
+
+
+class TestWsRequestMany(unittest.TestCase):
+    """Test concurrent webservice requests over the bounded pool."""
+
+    def setUp(self):
+        self.ws = WebServices(max_connections_per_host=2)
+        self.addCleanup(self.ws.close)
+        self.ws._session = Mock()
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def slow_get(self, url, headers, timeout):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.2)
+        with self.lock:
+            self.active -= 1
+        if url.endswith("/down"):
+            raise ConnectionError("Connection refused")
+        response = ok_response()
+        response.url = url
+        return response
+
+    def test_requests_bounded_and_in_order(self):
+        self.ws._session.get.side_effect = self.slow_get
+        urls = [f"http://mc/api/show/{uri}" for uri in "abcd"]
+        start = time.monotonic()
+        responses = self.ws.ws_request_many(
+            [(WebServices.HTTP_GET, url, {}, None, 5) for url in urls])
+        elapsed = time.monotonic() - start
+        self.assertEqual([response.url for response in responses], urls)
+        self.assertEqual(self.peak, 2)
+        self.assertGreaterEqual(elapsed, 0.4)
+        self.assertLess(elapsed, 0.7)
+
+    def test_error_per_url(self):
+        self.ws._session.get.side_effect = self.slow_get
+        responses = self.ws.ws_request_many(
+            [(WebServices.HTTP_GET, f"http://mc/api/show/{uri}", {}, None, 5)
+             for uri in ("enclosure", "down", "frus")])
+        self.assertEqual([response.status_code for response in responses],
+                         [WebServices.HTTP_OK, WebServices.HTTP_CONN_REFUSED,
+                          WebServices.HTTP_OK])
+
+    def test_map_concurrent(self):
+        # A single item is handled on the calling thread
+        self.assertEqual(self.ws.map_concurrent(
+            lambda item: threading.current_thread(), [1]),
+            [threading.current_thread()])
+        self.assertIsNone(self.ws._executor)
+        self.assertEqual(self.ws.map_concurrent(lambda item: item * 2,
+                                                range(5)), [0, 2, 4, 6, 8])
+
+        def fail(item):
+            if item == 2:
+                raise ValueError(item)
+            return item
+        with self.assertRaises(ValueError):
+            self.ws.map_concurrent(fail, [1, 2, 3])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import os
+import unittest
+
+from jsonschema import ValidationError
+
+from json_msgs.messages import schema_registry
+
+SCHEMA_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "..",
+    "low-level", "json_msgs", "schemas", "sensors",
+    "SSPL-LL_Sensor_Response.json")
+
+
+class TestSchemaRegistry(unittest.TestCase):
+    """Test the process wide compiled schema validators."""
+
+    def tearDown(self):
+        schema_registry.set_validation_mode(None)
+
+    def test_validator_compiled_once(self):
+        validator = schema_registry.get_validator("sensor_response_type",
+                                                  SCHEMA_FILE)
+        self.assertIs(validator, schema_registry.get_validator(
+            "sensor_response_type", SCHEMA_FILE))
+        self.assertRaises(ValidationError, validator.validate,
+                          {"title": "SSPL Sensor Response"})
+
+    def test_validation_mode(self):
+        schema_registry.set_validation_mode(schema_registry.VALIDATE_ALWAYS)
+        self.assertTrue(schema_registry.validation_enabled())
+        schema_registry.set_validation_mode(schema_registry.VALIDATE_DEBUG)
+        self.assertFalse(schema_registry.validation_enabled())
+
+
+if __name__ == "__main__":
+    unittest.main()
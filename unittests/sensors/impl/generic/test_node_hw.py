@@ -0,0 +1,178 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import Mock
+
+from framework.utils.ipmi_client import IPMITool
+from sensors.impl.generic.node_hw import NodeHWsensor
+
+RECORD = ("Sensor ID              : {} (0xc8)\n"
+          " Entity ID             : 10.1 (Power Supply)\n"
+          " States Asserted       : Power Supply\n"
+          "                         [Presence detected]\n")
+
+
+class TestSensorSdrPropsMany(unittest.TestCase):
+    """Test reading the SDR records of many sensors with one call."""
+
+    def setUp(self):
+        self.sensor = object.__new__(NodeHWsensor)
+        self.sensor.ipmi_client = Mock(
+            ACTIVE_IPMI_TOOL=IPMITool.IPMITOOL,
+            parse_sensor_records=IPMITool.parse_sensor_records)
+        self.sensor._run_ipmitool_subcommand = Mock(
+            return_value=("Unable to find sensor id 'PS3 Status'", "", 1))
+
+    def test_unknown_sensor_read_alone(self):
+        # ipmitool fails without stderr if any sensor is not found
+        self.sensor.ipmi_client._run_ipmitool_subcommand.return_value = (
+            RECORD.format("PS1 Status") + RECORD.format("PS2 Status"), "", 1)
+        props = self.sensor._get_sensor_sdr_props_many(
+            ["PS1 Status", "PS2 Status", "PS3 Status"])
+        self.assertEqual(list(props), ["PS1 Status", "PS2 Status"])
+        dynamic, static = props["PS2 Status"]
+        self.assertEqual(dynamic, {
+            "States Asserted":
+                "Power Supply\n                         [Presence detected]"})
+        self.assertEqual(static["Entity ID"], "10.1 (Power Supply)")
+        self.sensor.ipmi_client._run_ipmitool_subcommand.assert_called_once_with(
+            "sdr get 'PS1 Status' 'PS2 Status' 'PS3 Status'", keep_output=True)
+        # Only the sensor left out goes through the IEM raising path
+        self.sensor._run_ipmitool_subcommand.assert_called_once_with(
+            "sdr get 'PS3 Status'")
+
+    def test_single_sensor(self):
+        self.sensor._run_ipmitool_subcommand.return_value = (
+            RECORD.format("PS1 Status"), "", 0)
+        props = self.sensor._get_sensor_sdr_props_many(["PS1 Status"])
+        self.assertEqual(props["PS1 Status"][1]["Sensor ID"],
+                         "PS1 Status (0xc8)")
+        self.sensor.ipmi_client._run_ipmitool_subcommand.assert_not_called()
+
+
+
+def sel_line(index, device_id, event="Lower Non-critical going low",
+             status="Asserted"):
+    return (f"{index:4x} | 04/16/2019 | 05:29:09 | {device_id} | {event} "
+            f"| {status}")
+
+
+class TestSelList(unittest.TestCase):
+    """Test listing and parsing only the SEL entries not processed yet."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+        self.sensor = object.__new__(NodeHWsensor)
+        self.sensor.index_file_name = os.path.join(self.tmp_dir, "index")
+        self.sensor.list_file_name = os.path.join(self.tmp_dir, "list")
+        self.sensor.list_file_collect_name = os.path.join(
+            self.tmp_dir, "collect")
+        self.sensor.list_file = self.sensor._get_file(
+            self.sensor.list_file_name)
+        self.addCleanup(lambda: self.sensor.list_file.close())
+        self.sensor._write_index_file(0)
+        self.sensor._sel_entries_listed = None
+        self.sensor._sel_index_listed = None
+        self.sensor.channel_err = False
+        self.sensor.ipmi_client = Mock(ACTIVE_IPMI_TOOL=IPMITool.IPMITOOL)
+        self.fan = Mock()
+        self.psu = Mock()
+        self.sensor.fru_types = {"Fan": self.fan, "Power Supply": self.psu}
+        self.sensor._run_ipmitool_subcommand = Mock(side_effect=self.run_cmd)
+        self.sel = []
+        self.free = 1024
+
+    def run_cmd(self, subcommand, grep_args=None):
+        if subcommand == "sel info":
+            return (f"SEL Information\nEntries          : {len(self.sel)}\n"
+                    f"Free Space       : {self.free} bytes\n"), "", 0
+        if subcommand == "sel list":
+            return "\n".join(self.sel) + "\n", "", 0
+        count = int(subcommand.split()[-1])
+        return "\n".join(self.sel[-count:]) + "\n", "", 0
+
+    def poll(self):
+        self.sensor._run_ipmitool_subcommand.reset_mock()
+        self.fan.reset_mock()
+        self.sensor._update_list_file()
+        self.sensor._notify_NodeDataMsgHandler()
+        return [call[0][0] for call in
+                self.sensor._run_ipmitool_subcommand.call_args_list
+                if call[0][0] != "sel info"]
+
+    def fan_indexes(self):
+        return [call[0][0] for call in self.fan.call_args_list]
+
+    def test_parse_sel_list(self):
+        list_file = io.StringIO("".join(
+            sel_line(index, device_id) + "\n" for index, device_id in
+            [(1, "Fan #0x30"), (2, "Power Supply #0xc8"), (3, "Fan #0x31")]))
+        events, last_fru_index = NodeHWsensor._parse_sel_list(list_file, "1")
+        self.assertEqual([event[0] for event in events], ["2", "3"])
+        self.assertEqual(events[1][3:8], ("Fan #0x31", "Fan", "31",
+                                          "Lower Non-critical going low",
+                                          "Asserted"))
+        self.assertEqual(last_fru_index, {"Power Supply": "2", "Fan": "3"})
+        # An index not listed leaves every entry new
+        events, _ = NodeHWsensor._parse_sel_list(list_file, "a")
+        self.assertEqual(len(events), 3)
+
+    def test_only_new_entries_listed(self):
+        self.sel = [sel_line(index, "Fan #0x30") for index in range(1, 31)]
+        self.assertEqual(self.poll(), ["sel list"])
+        self.assertEqual(len(self.fan_indexes()), 30)
+        self.assertEqual(self.sensor._read_index_file(), (30, 30))
+
+        self.assertEqual(self.poll(), [])
+        self.fan.assert_not_called()
+
+        self.sel += [sel_line(31, "Fan #0x31"),
+                     sel_line(32, "Processor #0x10")]
+        self.assertEqual(self.poll(), ["sel list last 12"])
+        self.assertEqual(self.fan_indexes(), ["1f"])
+        self.assertEqual(self.sensor._read_index_file(), (32, 32))
+
+        # The last processed entry is of a device type not monitored
+        self.sel.append(sel_line(33, "Fan #0x32"))
+        self.assertEqual(self.poll(), ["sel list last 11"])
+        self.assertEqual(self.fan_indexes(), ["21"])
+
+    def test_whole_sel_listed_without_last_index(self):
+        self.sel = [sel_line(index, "Fan #0x30") for index in range(1, 31)]
+        self.poll()
+        # The SEL got cleared and has more entries since
+        self.sel = [sel_line(index, "Fan #0x31") for index in range(41, 81)]
+        self.assertEqual(self.poll(), ["sel list last 20", "sel list"])
+        self.assertEqual(len(self.fan_indexes()), 40)
+
+    def test_whole_sel_listed_when_full(self):
+        self.sel = [sel_line(index, "Fan #0x30") for index in range(1, 31)]
+        self.poll()
+        # A full SEL in circular mode drops the oldest entry for a new one
+        self.free = 0
+        self.sel = self.sel[1:] + [sel_line(31, "Fan #0x31")]
+        self.assertEqual(self.poll(), ["sel list"])
+        self.assertEqual(self.fan_indexes(), ["1f"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -13,6 +13,7 @@
 # about this software or licensing, please email opensource@seagate.com or
 # cortx-questions@seagate.com.
 
+import shlex
 import unittest
 from socket import AF_INET
 from unittest.mock import patch, Mock
@@ -39,11 +40,7 @@ NET_IF_ADDRESS = {
 }
 
 
-def get_sdr_type_response(cmd):
-    if cmd.startswith("sensor get"):
-        return (
-            """Locating sensor record...
-            Sensor ID              : CPU1 Temp (0x1)
+SENSOR_RECORD = """Sensor ID              : {} (0x1)
             Entity ID             : 3.1
             Sensor Type (Threshold)  : Temperature
             Sensor Reading        : 36 (+/- 0) degrees C
@@ -57,10 +54,18 @@ def get_sdr_type_response(cmd):
             Positive Hysteresis   : 2.000
             Negative Hysteresis   : 2.000
             Assertion Events      :
-            Assertions Enabled    :""",
-            "",
-            0,
-        )
+            Assertions Enabled    :
+"""
+
+
+def get_sdr_type_response(cmd):
+    if cmd.startswith("sdr info"):
+        return "Most recent Addition    : 04/16/2019 05:29:09", "", 0
+    if cmd.startswith("sensor get"):
+        # One record per sensor id, all with the same thresholds
+        records = "\n".join(SENSOR_RECORD.format(sensor_id)
+                             for sensor_id in shlex.split(cmd)[2:])
+        return f"Locating sensor record...\n{records}", "", 0
     if cmd == "sdr type 'Temperature'":
         return (
             """CPU1 Temp        | 01h | ok  |  3.1 | 36 degrees C
@@ -203,6 +203,18 @@ class TestStorageHealth(unittest.TestCase):
         assert resp[0]['health']['specifics'][0]["status"] == "Up"
         assert resp[0]['health']['specifics'][0]["speed"] == 13800
 
+    @patch("solution.lr2.storage.health.enclosure")
+    def test_sweep_needs_response_cache(self, encl):
+        storage_map = self.create_storage_health_obj()
+        encl.get_realstor_encl_data.return_value = []
+        encl.ws_cache.ttl = 0
+        storage_map.get_storage_health_info()
+        encl.get_realstor_encl_data_many.assert_not_called()
+        encl.ws_cache.ttl = 10
+        storage_map.get_storage_health_info()
+        encl.get_realstor_encl_data_many.assert_called_once_with(
+            StorageHealth.ENCL_SWEEP_FRUS)
+
 
 if __name__ == "__main__":
     unittest.main()
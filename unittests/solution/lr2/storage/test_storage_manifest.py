@@ -149,6 +149,18 @@ class TestStorageManifest(unittest.TestCase):
         assert fans[0]['speed'] == 13800
         assert fans[0]['location'] == 'Enclosure 0, Fan Module 0'
 
+    @patch("solution.lr2.storage.manifest.ENCL")
+    def test_sweep_needs_response_cache(self, encl):
+        storage_manifest = self.create_storage_manifest_obj()
+        encl.get_realstor_encl_data.return_value = []
+        encl.ws_cache.ttl = 0
+        storage_manifest.get_storage_manifest_info()
+        encl.get_realstor_encl_data_many.assert_not_called()
+        encl.ws_cache.ttl = 10
+        storage_manifest.get_storage_manifest_info()
+        encl.get_realstor_encl_data_many.assert_called_once_with(
+            StorageManifest.ENCL_SWEEP_FRUS)
+
 
 if __name__ == "__main__":
     unittest.main()